@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark: MetadataCacheV2.search_actions latency vs. number of matched actions
+
+Populates a throwaway metadata cache with a growing number of entity actions
+(each with a few parameters) and times a broad ``search_actions("%")`` call.
+Actions and their parameters are loaded in a fixed number of queries, so the
+time per matched action should stay flat as the result set grows.
+
+Usage:
+    python examples/benchmark_search_actions.py
+"""
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from statistics import median
+
+from d365fo_client.metadata_v2 import MetadataCacheV2
+from d365fo_client.models import (
+    ActionParameterInfo,
+    ActionParameterTypeInfo,
+    ODataBindingKind,
+    PublicEntityActionInfo,
+    PublicEntityInfo,
+)
+
+ACTION_COUNTS = [10, 100, 1000, 5000]
+ACTIONS_PER_ENTITY = 5
+PARAMETERS_PER_ACTION = 3
+RUNS = 5
+
+
+def make_entity(index: int) -> PublicEntityInfo:
+    entity = PublicEntityInfo(name=f"Entity{index}", entity_set_name=f"Entity{index}s")
+    entity.actions = [
+        PublicEntityActionInfo(
+            name=f"Action{a}",
+            binding_kind=ODataBindingKind.BOUND_TO_ENTITY_SET,
+            parameters=[
+                ActionParameterInfo(
+                    name=f"param{p}",
+                    type=ActionParameterTypeInfo(type_name="Edm.String"),
+                )
+                for p in range(PARAMETERS_PER_ACTION)
+            ],
+        )
+        for a in range(ACTIONS_PER_ENTITY)
+    ]
+    return entity
+
+
+async def benchmark(action_count: int) -> float:
+    """Return the median search_actions time in milliseconds"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = MetadataCacheV2(Path(temp_dir), "https://benchmark.dynamics.com")
+        await cache.initialize()
+
+        async with cache.connections.writer() as db:
+            cursor = await db.execute(
+                "INSERT INTO global_versions (version_hash, modules_hash) VALUES (?, ?)",
+                ("benchmark", "benchmark"),
+            )
+            global_version_id = cursor.lastrowid
+
+        entities = [make_entity(i) for i in range(action_count // ACTIONS_PER_ENTITY)]
+        await cache.store_metadata_bulk(
+            global_version_id, public_entities=entities, fresh_version=True
+        )
+
+        timings = []
+        for _ in range(RUNS):
+            start = time.perf_counter()
+            actions = await cache.search_actions(
+                "%", global_version_id=global_version_id
+            )
+            timings.append((time.perf_counter() - start) * 1000)
+            assert len(actions) == action_count
+
+        await cache.close()
+        return median(timings)
+
+
+async def main():
+    print(f"{'actions':>8} {'median ms':>10} {'us/action':>10}")
+    for action_count in ACTION_COUNTS:
+        elapsed_ms = await benchmark(action_count)
+        per_action_us = elapsed_ms * 1000 / action_count
+        print(f"{action_count:>8} {elapsed_ms:>10.2f} {per_action_us:>10.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
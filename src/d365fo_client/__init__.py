@@ -153,6 +153,8 @@ def _get_package_metadata():
 
 __version__, __author__, __email__ = _get_package_metadata()
 
+from .batch import BatchOperationResult, BatchRequest
+from .bulk import BulkRecordResult, BulkWriter, BulkWriterStats
 from .cli import CLIManager
 
 # Import main classes and functions for public API
@@ -168,6 +170,7 @@ from .exceptions import (
     MetadataError,
     NetworkError,
 )
+from .json_backend import get_json_backend, set_json_backend
 from .labels import resolve_labels_generic, resolve_labels_generic_with_cache
 from .main import main
 
@@ -188,6 +191,7 @@ from .models import (
     QueryOptions,
 )
 from .output import OutputFormatter
+from .partitions import PartitionBuilder, PartitionedReader, QueryPartition
 from .profile_manager import ProfileManager
 from .profiles import Profile
 from .settings import D365FOSettings, get_settings, reset_settings
@@ -226,6 +230,20 @@ __all__ = [
     "EnumerationInfo",
     "PublicEntityPropertyInfo",
     "EnumerationMemberInfo",
+    # Batch operations
+    "BatchRequest",
+    "BatchOperationResult",
+    # Bulk writes
+    "BulkWriter",
+    "BulkWriterStats",
+    "BulkRecordResult",
+    # Partitioned reads
+    "QueryPartition",
+    "PartitionBuilder",
+    "PartitionedReader",
+    # JSON decoding
+    "get_json_backend",
+    "set_json_backend",
     # Exceptions
     "FOClientError",
     "AuthenticationError",
@@ -1,5 +1,7 @@
 """Authentication utilities for D365 F&O client."""
 
+import asyncio
+import logging
 from datetime import datetime
 from typing import Optional, Union
 
@@ -8,6 +10,15 @@ from azure.identity import ClientSecretCredential, DefaultAzureCredential
 from .credential_sources import CredentialManager, CredentialSource
 from .models import FOClientConfig
 
+logger = logging.getLogger(__name__)
+
+# Fraction of a token's lifetime after which it is refreshed in the background
+TOKEN_REFRESH_RATIO = 0.8
+
+# Delay before retrying a failed refresh, doubled per consecutive failure
+TOKEN_REFRESH_RETRY_SECONDS = 5.0
+TOKEN_REFRESH_RETRY_MAX_SECONDS = 300.0
+
 
 class AuthenticationManager:
     """Manages authentication for F&O client"""
@@ -21,6 +32,9 @@ class AuthenticationManager:
         self.config = config
         self._token = None
         self._token_expires = None
+        self._token_refresh_at: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_failures = 0
         self._credential_manager = CredentialManager()
         self.credential: Optional[
             Union[ClientSecretCredential, DefaultAzureCredential]
@@ -54,6 +68,14 @@ class AuthenticationManager:
     async def get_token(self) -> str:
         """Get authentication token
 
+        A cached token is returned while it is valid. Once it has passed
+        ``TOKEN_REFRESH_RATIO`` of its lifetime a refresh is started in the
+        background and the current token is still returned. Concurrent callers
+        share a single in-flight refresh, and the blocking azure-identity call
+        runs in a worker thread so the event loop is never stalled. A failed
+        background refresh is retried with exponential backoff rather than
+        on every call.
+
         Returns:
             Bearer token string
         """
@@ -68,13 +90,34 @@ class AuthenticationManager:
         if self.credential is None:
             raise ValueError("Authentication credentials are not set up.")
 
-        if (
-            self._token
-            and self._token_expires
-            and datetime.now().timestamp() < self._token_expires
-        ):
+        now = datetime.now().timestamp()
+        if self._token and self._token_expires and now < self._token_expires:
+            if self._token_refresh_at is not None and now >= self._token_refresh_at:
+                self._start_refresh()
             return self._token
 
+        return await asyncio.shield(self._start_refresh())
+
+    def _start_refresh(self) -> asyncio.Task:
+        """Return the in-flight refresh task, starting one if none is running"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_token())
+            self._refresh_task.add_done_callback(self._on_refresh_done)
+        return self._refresh_task
+
+    @staticmethod
+    def _on_refresh_done(task: asyncio.Task) -> None:
+        # Background refreshes may have no awaiter; retrieve the exception so
+        # it is logged once instead of reported as never retrieved
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug("Token refresh failed: %s", task.exception())
+
+    async def _refresh_token(self) -> str:
+        """Acquire a new token from the credential"""
+        credential = self.credential
+        if credential is None:
+            raise ValueError("Authentication credentials are not set up.")
+
         # Try different scopes
         scopes_to_try = [
             f"{self.config.base_url.rstrip('/')}/.default",
@@ -84,14 +127,27 @@ class AuthenticationManager:
             if not scope:
                 continue
             try:
-                token = self.credential.get_token(scope)
+                issued_at = datetime.now().timestamp()
+                token = await asyncio.to_thread(credential.get_token, scope)
                 self._token = token.token
                 self._token_expires = token.expires_on
+                self._token_refresh_at = issued_at + TOKEN_REFRESH_RATIO * max(
+                    0.0, token.expires_on - issued_at
+                )
+                self._refresh_failures = 0
                 return self._token
             except Exception as e:
-                print(f"Failed to get token with scope {scope}: {e}")
+                logger.warning(f"Failed to get token with scope {scope}: {e}")
                 continue
 
+        # Keep using a still-valid token and retry later, so a credential
+        # outage doesn't turn into one token request per HTTP call
+        self._refresh_failures += 1
+        delay = min(
+            TOKEN_REFRESH_RETRY_MAX_SECONDS,
+            TOKEN_REFRESH_RETRY_SECONDS * 2 ** (self._refresh_failures - 1),
+        )
+        self._token_refresh_at = datetime.now().timestamp() + delay
         raise Exception("Failed to get authentication token")
 
     def _is_localhost(self) -> bool:
@@ -107,6 +163,7 @@ class AuthenticationManager:
         """Invalidate cached token to force refresh"""
         self._token = None
         self._token_expires = None
+        self._token_refresh_at = None
 
     async def invalidate_credentials(self):
         """Invalidate cached credentials and token to force full refresh"""
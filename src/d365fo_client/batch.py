@@ -0,0 +1,421 @@
+"""OData $batch support for D365 F&O client.
+
+Packs many entity operations into a single ``/data/$batch`` request using the
+OData multipart/mixed format and parses the multipart response back into one
+result per operation.
+"""
+
+import json
+import re
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .json_backend import json_loads
+from .models import QueryOptions
+from .query import QueryBuilder
+
+if TYPE_CHECKING:
+    from .models import PublicEntityInfo
+
+DEFAULT_MAX_OPERATIONS_PER_REQUEST = 100
+
+_BOUNDARY_PATTERN = re.compile(r'boundary="?([^";]+)"?', re.IGNORECASE)
+
+
+@dataclass
+class BatchOperation:
+    """A single operation inside an OData batch request"""
+
+    method: str
+    entity_name: str
+    key: Optional[Union[str, Dict[str, Any]]] = None
+    data: Optional[Dict[str, Any]] = None
+    options: Optional[QueryOptions] = None
+    entity_schema: Optional["PublicEntityInfo"] = None
+    changeset: Optional[int] = None
+    index: int = 0
+
+    @property
+    def is_read(self) -> bool:
+        return self.method == "GET"
+
+    def build_url(self, base_url: str) -> str:
+        """Build the absolute request URL for this operation"""
+        url = QueryBuilder.build_entity_url(
+            base_url, self.entity_name, self.key, self.entity_schema
+        )
+        query_string = QueryBuilder.build_query_string(self.options)
+        if query_string:
+            url += query_string.replace("?", "&") if "?" in url else query_string
+        return url
+
+
+@dataclass
+class BatchOperationResult:
+    """Outcome of a single operation from a batch response"""
+
+    index: int
+    method: str
+    entity_name: str
+    status_code: int
+    success: bool
+    data: Optional[Any] = None
+    error: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "index": self.index,
+            "method": self.method,
+            "entity_name": self.entity_name,
+            "status_code": self.status_code,
+            "success": self.success,
+            "data": self.data,
+            "error": self.error,
+        }
+
+
+@dataclass
+class _HttpPart:
+    """An application/http part decoded from a multipart response"""
+
+    status_code: int
+    headers: Dict[str, str]
+    body: str
+    content_id: Optional[str] = None
+
+
+class BatchRequest:
+    """Builder for OData $batch requests
+
+    Write operations added directly are each placed in their own changeset, so
+    one failing record does not roll back the others. Operations added inside
+    ``with batch.changeset():`` share a changeset and succeed or fail together.
+
+    Example:
+        batch = BatchRequest()
+        batch.add_create("CustomersV3", {...})
+        with batch.changeset():
+            batch.add_update("CustomersV3", key, {...})
+            batch.add_delete("CustomersV3", other_key)
+        results = await client.execute_batch(batch)
+    """
+
+    def __init__(self):
+        self.operations: List[BatchOperation] = []
+        self._next_changeset = 0
+        self._active_changeset: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self.operations)
+
+    @contextmanager
+    def changeset(self) -> Iterator["BatchRequest"]:
+        """Group the write operations added in this block into one atomic changeset"""
+        if self._active_changeset is not None:
+            raise ValueError("Changesets cannot be nested")
+        self._active_changeset = self._new_changeset()
+        try:
+            yield self
+        finally:
+            self._active_changeset = None
+
+    def _new_changeset(self) -> int:
+        changeset = self._next_changeset
+        self._next_changeset += 1
+        return changeset
+
+    def _add(self, operation: BatchOperation) -> BatchOperation:
+        if operation.is_read:
+            if self._active_changeset is not None:
+                raise ValueError("GET operations cannot be part of a changeset")
+        elif self._active_changeset is not None:
+            operation.changeset = self._active_changeset
+        else:
+            operation.changeset = self._new_changeset()
+        operation.index = len(self.operations)
+        self.operations.append(operation)
+        return operation
+
+    def add_get(
+        self,
+        entity_name: str,
+        key: Optional[Union[str, Dict[str, Any]]] = None,
+        options: Optional[QueryOptions] = None,
+        entity_schema: Optional["PublicEntityInfo"] = None,
+    ) -> BatchOperation:
+        """Add a read of an entity set or a single entity"""
+        return self._add(
+            BatchOperation(
+                "GET",
+                entity_name,
+                key=key,
+                options=options,
+                entity_schema=entity_schema,
+            )
+        )
+
+    def add_create(
+        self,
+        entity_name: str,
+        data: Dict[str, Any],
+        entity_schema: Optional["PublicEntityInfo"] = None,
+    ) -> BatchOperation:
+        """Add an entity create"""
+        return self._add(
+            BatchOperation("POST", entity_name, data=data, entity_schema=entity_schema)
+        )
+
+    def add_update(
+        self,
+        entity_name: str,
+        key: Union[str, Dict[str, Any]],
+        data: Dict[str, Any],
+        method: str = "PATCH",
+        entity_schema: Optional["PublicEntityInfo"] = None,
+    ) -> BatchOperation:
+        """Add an entity update (PATCH or PUT)"""
+        return self._add(
+            BatchOperation(
+                method.upper(),
+                entity_name,
+                key=key,
+                data=data,
+                entity_schema=entity_schema,
+            )
+        )
+
+    def add_delete(
+        self,
+        entity_name: str,
+        key: Union[str, Dict[str, Any]],
+        entity_schema: Optional["PublicEntityInfo"] = None,
+    ) -> BatchOperation:
+        """Add an entity delete"""
+        return self._add(
+            BatchOperation("DELETE", entity_name, key=key, entity_schema=entity_schema)
+        )
+
+    def groups(self) -> List[List[BatchOperation]]:
+        """Return operations grouped into top-level batch parts, in order
+
+        Each group is either a single GET or all operations of one changeset.
+        """
+        groups: List[List[BatchOperation]] = []
+        by_changeset: Dict[int, List[BatchOperation]] = {}
+        for operation in self.operations:
+            if operation.changeset is None:
+                groups.append([operation])
+            elif operation.changeset in by_changeset:
+                by_changeset[operation.changeset].append(operation)
+            else:
+                by_changeset[operation.changeset] = [operation]
+                groups.append(by_changeset[operation.changeset])
+        return groups
+
+    def chunks(
+        self, max_operations: int = DEFAULT_MAX_OPERATIONS_PER_REQUEST
+    ) -> List[List[List[BatchOperation]]]:
+        """Split the batch into requests of at most ``max_operations`` operations
+
+        Changesets are never split across requests; a changeset larger than
+        the limit is sent in a request of its own.
+        """
+        if max_operations < 1:
+            raise ValueError("max_operations must be at least 1")
+
+        chunks: List[List[List[BatchOperation]]] = []
+        current: List[List[BatchOperation]] = []
+        size = 0
+        for group in self.groups():
+            if current and size + len(group) > max_operations:
+                chunks.append(current)
+                current, size = [], 0
+            current.append(group)
+            size += len(group)
+        if current:
+            chunks.append(current)
+        return chunks
+
+
+def build_batch_body(
+    groups: List[List[BatchOperation]], base_url: str
+) -> Tuple[str, str]:
+    """Serialize operation groups into a multipart/mixed batch body
+
+    Args:
+        groups: Operation groups as returned by BatchRequest.chunks()
+        base_url: Base F&O URL used for absolute operation URLs
+
+    Returns:
+        Tuple of (content type header value, request body)
+    """
+    batch_boundary = f"batch_{uuid.uuid4()}"
+    lines: List[str] = []
+
+    for group in groups:
+        lines.append(f"--{batch_boundary}")
+        if group[0].is_read:
+            lines.extend(_http_part_lines(group[0], base_url))
+            continue
+
+        changeset_boundary = f"changeset_{uuid.uuid4()}"
+        lines.append(f"Content-Type: multipart/mixed; boundary={changeset_boundary}")
+        lines.append("")
+        for operation in group:
+            lines.append(f"--{changeset_boundary}")
+            lines.extend(_http_part_lines(operation, base_url))
+        lines.append(f"--{changeset_boundary}--")
+
+    lines.append(f"--{batch_boundary}--")
+    lines.append("")
+    return f"multipart/mixed; boundary={batch_boundary}", "\r\n".join(lines)
+
+
+def _http_part_lines(operation: BatchOperation, base_url: str) -> List[str]:
+    lines = [
+        "Content-Type: application/http",
+        "Content-Transfer-Encoding: binary",
+    ]
+    if not operation.is_read:
+        lines.append(f"Content-ID: {operation.index + 1}")
+    lines.append("")
+    lines.append(f"{operation.method} {operation.build_url(base_url)} HTTP/1.1")
+    lines.append("Accept: application/json")
+    if operation.data is not None:
+        lines.append("Content-Type: application/json; type=entry")
+        lines.append("")
+        lines.append(json.dumps(operation.data, default=str))
+    else:
+        lines.append("")
+    lines.append("")
+    return lines
+
+
+def parse_batch_response(
+    content_type: str,
+    body: str,
+    groups: List[List[BatchOperation]],
+) -> List[BatchOperationResult]:
+    """Map a multipart batch response back onto the operations that produced it
+
+    Args:
+        content_type: Content-Type header of the batch response
+        body: Batch response body
+        groups: Operation groups sent in the request
+
+    Returns:
+        One result per operation, in request order
+    """
+    parts = _split_multipart(content_type, body)
+    results: List[BatchOperationResult] = []
+
+    for position, group in enumerate(groups):
+        if position >= len(parts):
+            for operation in group:
+                results.append(
+                    _result(
+                        operation,
+                        _HttpPart(0, {}, "No response returned for operation"),
+                    )
+                )
+            continue
+
+        part_headers, part_body = parts[position]
+        part_type = part_headers.get("content-type", "")
+        if part_type.lower().startswith("multipart/mixed"):
+            responses = [
+                _parse_http_part(h, b)
+                for h, b in _split_multipart(part_type, part_body)
+            ]
+            by_content_id = {r.content_id: r for r in responses if r.content_id}
+            for offset, operation in enumerate(group):
+                response = by_content_id.get(str(operation.index + 1))
+                if response is None and offset < len(responses):
+                    response = responses[offset]
+                if response is None:
+                    response = _HttpPart(0, {}, "No response returned for operation")
+                results.append(_result(operation, response))
+        else:
+            # A single response for a changeset means the whole changeset failed
+            response = _parse_http_part(part_headers, part_body)
+            for operation in group:
+                results.append(_result(operation, response))
+
+    return results
+
+
+def _result(operation: BatchOperation, response: _HttpPart) -> BatchOperationResult:
+    success = 200 <= response.status_code < 300
+    data: Optional[Any] = None
+    error: Optional[str] = None
+    if success:
+        if response.body.strip():
+            try:
+                data = json_loads(response.body)
+            except ValueError:
+                data = response.body
+        else:
+            data = {"success": True}
+    else:
+        error = (
+            f"{operation.method} {operation.entity_name} failed: "
+            f"{response.status_code} - {response.body.strip()}"
+        )
+    return BatchOperationResult(
+        index=operation.index,
+        method=operation.method,
+        entity_name=operation.entity_name,
+        status_code=response.status_code,
+        success=success,
+        data=data,
+        error=error,
+        headers=response.headers,
+    )
+
+
+def _split_headers(text: str) -> Tuple[Dict[str, str], str]:
+    """Split a MIME or HTTP header block from its content"""
+    if text.startswith("\n"):
+        return {}, text[1:]
+    head, _, rest = text.partition("\n\n")
+    headers: Dict[str, str] = {}
+    for line in head.split("\n"):
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return headers, rest
+
+
+def _split_multipart(content_type: str, body: str) -> List[Tuple[Dict[str, str], str]]:
+    """Split a multipart/mixed body into (headers, content) parts"""
+    match = _BOUNDARY_PATTERN.search(content_type)
+    if not match:
+        raise ValueError(f"No multipart boundary in content type: {content_type}")
+    delimiter = f"--{match.group(1)}"
+
+    parts = []
+    for segment in body.replace("\r\n", "\n").split(delimiter)[1:]:
+        if segment.startswith("--"):
+            break
+        parts.append(_split_headers(segment.strip("\n")))
+    return parts
+
+
+def _parse_http_part(part_headers: Dict[str, str], content: str) -> _HttpPart:
+    """Decode an application/http part into status, headers and body"""
+    status_line, _, rest = content.partition("\n")
+    pieces = status_line.split(" ", 2)
+    try:
+        status_code = int(pieces[1])
+    except (IndexError, ValueError):
+        status_code = 0
+    headers, body = _split_headers(rest)
+    return _HttpPart(
+        status_code=status_code,
+        headers=headers,
+        body=body.strip("\n"),
+        content_id=part_headers.get("content-id") or headers.get("content-id"),
+    )
@@ -0,0 +1,405 @@
+"""Bulk write pipeline for D365 F&O entities.
+
+``BulkWriter`` accepts a stream of records for one entity and writes them with
+a bounded number of concurrent requests, either one record per request or
+packed into OData $batch requests. Every record gets an outcome; a failing
+record never aborts the rest of the run.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .batch import BatchRequest
+from .odata_serializer import ODataSerializer
+
+if TYPE_CHECKING:
+    from .crud import CrudOperations
+    from .models import PublicEntityInfo
+
+logger = logging.getLogger(__name__)
+
+BULK_OPERATIONS = ("create", "update", "delete")
+
+EntityKey = Union[str, Dict[str, Any]]
+
+
+@dataclass
+class BulkRecordResult:
+    """Outcome of writing a single record"""
+
+    index: int
+    success: bool
+    status_code: Optional[int] = None
+    data: Optional[Any] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "index": self.index,
+            "success": self.success,
+            "status_code": self.status_code,
+            "data": self.data,
+            "error": self.error,
+        }
+
+
+@dataclass
+class BulkWriterStats:
+    """Throughput counters for a bulk write run"""
+
+    submitted: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    in_flight: int = 0
+    retries: int = 0
+    requests: int = 0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def completed(self) -> int:
+        return self.succeeded + self.failed
+
+    @property
+    def elapsed_seconds(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return end - self.started_at
+
+    @property
+    def records_per_second(self) -> float:
+        elapsed = self.elapsed_seconds
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "submitted": self.submitted,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "in_flight": self.in_flight,
+            "retries": self.retries,
+            "requests": self.requests,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "records_per_second": round(self.records_per_second, 2),
+        }
+
+
+@dataclass
+class _PendingRecord:
+    index: int
+    payload: Dict[str, Any]
+    key: Optional[EntityKey] = None
+
+
+_WRITER_DONE = object()
+
+
+class BulkWriter:
+    """Async context manager that writes a stream of records to one entity
+
+    Records passed to ``write()`` are serialized with ODataSerializer using the
+    entity schema and queued; ``write()`` blocks while the queue is full, which
+    applies backpressure to the producer. Up to ``max_concurrency`` requests
+    are in flight at once. With ``use_batch=True`` records are packed into
+    $batch requests of up to ``batch_size`` operations. Throttled requests are
+    retried by the session manager's retry policy; ``stats.retries`` reports
+    how many retries happened during the run.
+
+    Example:
+        async with client.bulk_writer("CustomersV3", max_concurrency=8) as writer:
+            async for record in source:
+                await writer.write(record)
+        print(writer.stats.to_dict(), len(writer.failures))
+    """
+
+    def __init__(
+        self,
+        crud_ops: "CrudOperations",
+        entity_name: str,
+        operation: str = "create",
+        entity_schema: Optional["PublicEntityInfo"] = None,
+        schema_loader: Optional[
+            Callable[[str], Awaitable[Optional["PublicEntityInfo"]]]
+        ] = None,
+        max_concurrency: int = 8,
+        use_batch: bool = False,
+        batch_size: int = 100,
+        update_method: str = "PATCH",
+    ):
+        """Initialize bulk writer
+
+        Args:
+            crud_ops: CRUD operations used to send requests
+            entity_name: Name of the entity set
+            operation: One of "create", "update" or "delete"
+            entity_schema: Entity schema used for serialization and key extraction
+            schema_loader: Optional coroutine used to load the schema on entry
+            max_concurrency: Maximum number of requests in flight
+            use_batch: Send records through OData $batch requests
+            batch_size: Records per $batch request
+            update_method: HTTP method used for updates (PATCH or PUT)
+        """
+        if operation not in BULK_OPERATIONS:
+            raise ValueError(
+                f"Unsupported bulk operation '{operation}', expected one of {BULK_OPERATIONS}"
+            )
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.crud_ops = crud_ops
+        self.entity_name = entity_name
+        self.operation = operation
+        self.entity_schema = entity_schema
+        self.schema_loader = schema_loader
+        self.max_concurrency = max_concurrency
+        self.use_batch = use_batch
+        self.batch_size = batch_size
+        self.update_method = update_method
+
+        self.stats = BulkWriterStats()
+        self.results: List[BulkRecordResult] = []
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._key_fields: List[str] = []
+        self._session_manager = getattr(crud_ops, "session_manager", None)
+        self._retries_at_start = 0
+
+    @property
+    def failures(self) -> List[BulkRecordResult]:
+        """Results of records that could not be written"""
+        return [result for result in self.results if not result.success]
+
+    async def __aenter__(self) -> "BulkWriter":
+        if self.entity_schema is None and self.schema_loader is not None:
+            self.entity_schema = await self.schema_loader(self.entity_name)
+        if self.entity_schema is not None:
+            self._key_fields = [
+                prop.name for prop in self.entity_schema.properties if prop.is_key
+            ]
+
+        per_worker = self.batch_size if self.use_batch else 2
+        self._queue = asyncio.Queue(maxsize=self.max_concurrency * per_worker)
+        self.stats.started_at = time.monotonic()
+        self._retries_at_start = self._session_retries()
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self.max_concurrency)
+        ]
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            for _ in self._workers:
+                await self._queue.put(_WRITER_DONE)
+            await asyncio.gather(*self._workers)
+        else:
+            for task in self._workers:
+                task.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._update_retries()
+        self.stats.finished_at = time.monotonic()
+        self.results.sort(key=lambda result: result.index)
+
+    async def write(
+        self, record: Dict[str, Any], key: Optional[EntityKey] = None
+    ) -> None:
+        """Queue a record for writing, waiting while the queue is full
+
+        Args:
+            record: Entity record (for deletes, may contain only the key fields)
+            key: Explicit entity key; derived from the schema key fields if omitted
+        """
+        if self._queue is None:
+            raise RuntimeError("BulkWriter must be used as an async context manager")
+
+        index = self.stats.submitted
+        self.stats.submitted += 1
+        try:
+            pending = self._prepare(index, record, key)
+        except Exception as e:
+            self._record(BulkRecordResult(index=index, success=False, error=str(e)))
+            return
+        await self._queue.put(pending)
+
+    async def write_many(
+        self, records: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]
+    ) -> None:
+        """Queue every record from a sync or async iterable"""
+        if hasattr(records, "__aiter__"):
+            async for record in records:
+                await self.write(record)
+        else:
+            for record in records:
+                await self.write(record)
+
+    def _prepare(
+        self, index: int, record: Dict[str, Any], key: Optional[EntityKey]
+    ) -> _PendingRecord:
+        """Serialize a record and resolve its key"""
+        payload = ODataSerializer.serialize_payload(record, self.entity_schema)
+        if self.operation == "create":
+            return _PendingRecord(index=index, payload=payload)
+
+        if key is None:
+            if not self._key_fields:
+                raise ValueError(
+                    f"No key given and no key fields known for entity '{self.entity_name}'"
+                )
+            missing = [name for name in self._key_fields if name not in record]
+            if missing:
+                raise ValueError(f"Record is missing key fields: {', '.join(missing)}")
+            key = {name: record[name] for name in self._key_fields}
+
+        if isinstance(key, dict):
+            body = {k: v for k, v in payload.items() if k not in key}
+        else:
+            body = payload
+        return _PendingRecord(index=index, payload=body, key=key)
+
+    def _record(self, result: BulkRecordResult) -> None:
+        if result.success:
+            self.stats.succeeded += 1
+        else:
+            self.stats.failed += 1
+        self.results.append(result)
+
+    def _session_retries(self) -> int:
+        return getattr(self._session_manager, "total_retries", 0) or 0
+
+    def _update_retries(self) -> None:
+        self.stats.retries = self._session_retries() - self._retries_at_start
+
+    async def _worker(self) -> None:
+        while True:
+            item = await self._queue.get()
+            if item is _WRITER_DONE:
+                return
+            if not self.use_batch:
+                await self._write_single(item)
+                continue
+
+            items = [item]
+            done = False
+            while len(items) < self.batch_size:
+                try:
+                    extra = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if extra is _WRITER_DONE:
+                    done = True
+                    break
+                items.append(extra)
+            await self._write_batch(items)
+            if done:
+                return
+
+    async def _send_single(self, pending: _PendingRecord) -> Any:
+        if self.operation == "create":
+            return await self.crud_ops.create_entity(
+                self.entity_name, pending.payload, self.entity_schema
+            )
+        if self.operation == "update":
+            return await self.crud_ops.update_entity(
+                self.entity_name,
+                pending.key,
+                pending.payload,
+                self.update_method,
+                self.entity_schema,
+            )
+        return await self.crud_ops.delete_entity(
+            self.entity_name, pending.key, self.entity_schema
+        )
+
+    async def _write_single(self, pending: _PendingRecord) -> None:
+        self.stats.in_flight += 1
+        self.stats.requests += 1
+        try:
+            data = await self._send_single(pending)
+        except Exception as e:
+            result = BulkRecordResult(
+                index=pending.index,
+                success=False,
+                status_code=getattr(e, "status_code", None),
+                error=str(e),
+            )
+        else:
+            result = BulkRecordResult(index=pending.index, success=True, data=data)
+        finally:
+            self.stats.in_flight -= 1
+            self._update_retries()
+        self._record(result)
+
+    def _build_batch(
+        self, items: List[_PendingRecord]
+    ) -> Tuple[BatchRequest, Dict[int, _PendingRecord]]:
+        batch = BatchRequest()
+        by_operation: Dict[int, _PendingRecord] = {}
+        for pending in items:
+            if self.operation == "create":
+                operation = batch.add_create(
+                    self.entity_name, pending.payload, self.entity_schema
+                )
+            elif self.operation == "update":
+                operation = batch.add_update(
+                    self.entity_name,
+                    pending.key,
+                    pending.payload,
+                    self.update_method,
+                    self.entity_schema,
+                )
+            else:
+                operation = batch.add_delete(
+                    self.entity_name, pending.key, self.entity_schema
+                )
+            by_operation[operation.index] = pending
+        return batch, by_operation
+
+    async def _write_batch(self, items: List[_PendingRecord]) -> None:
+        batch, by_operation = self._build_batch(items)
+        self.stats.in_flight += len(items)
+        self.stats.requests += 1
+        try:
+            results = await self.crud_ops.execute_batch(batch, self.batch_size)
+        except Exception as e:
+            for pending in items:
+                self._record(
+                    BulkRecordResult(
+                        index=pending.index,
+                        success=False,
+                        status_code=getattr(e, "status_code", None),
+                        error=str(e),
+                    )
+                )
+            return
+        finally:
+            self.stats.in_flight -= len(items)
+            self._update_retries()
+
+        for result in results:
+            pending = by_operation[result.index]
+            self._record(
+                BulkRecordResult(
+                    index=pending.index,
+                    success=result.success,
+                    status_code=result.status_code,
+                    data=result.data,
+                    error=result.error,
+                )
+            )
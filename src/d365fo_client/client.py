@@ -1,19 +1,23 @@
 """Main F&O client implementation."""
 
 import asyncio
+import copy
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 from d365fo_client.utils import get_default_cache_directory
 
 from .auth import AuthenticationManager
+from .batch import DEFAULT_MAX_OPERATIONS_PER_REQUEST, BatchOperationResult, BatchRequest
+from .bulk import BulkWriter
 from .crud import CrudOperations
 from .exceptions import FOClientError
+from .json_backend import json_loads
 from .labels import LabelOperations, resolve_labels_generic
 from .metadata_api import MetadataAPIOperations
-from .metadata_v2 import MetadataCacheV2, SmartSyncManagerV2
+from .metadata_v2 import MetadataCacheV2, SmartSyncManagerV2, SQLiteTuning
 from .metadata_v2.sync_session_manager import SyncSessionManager
 from .models import (
     ActionInfo,
@@ -22,9 +26,11 @@ from .models import (
     FOClientConfig,
     JsonServiceRequest,
     JsonServiceResponse,
+    PropertySearchResult,
     PublicEntityInfo,
     QueryOptions,
 )
+from .partitions import PartitionBuilder, PartitionedReader, QueryPartition
 from .query import QueryBuilder
 from .session import SessionManager, _parse_server_timing
 
@@ -73,7 +79,12 @@ class FOClient:
         self.crud_ops = CrudOperations(self.session_manager, config.base_url)
 
         # Initialize label operations - will be updated when metadata cache v2 is initialized
-        self.label_ops = LabelOperations(self.session_manager, self.metadata_url, None)
+        self.label_ops = LabelOperations(
+            self.session_manager,
+            self.metadata_url,
+            None,
+            max_concurrency=config.label_fetch_concurrency,
+        )
         self.metadata_api_ops = MetadataAPIOperations(
             self.session_manager, self.metadata_url, self.label_ops
         )
@@ -88,6 +99,9 @@ class FOClient:
             except asyncio.CancelledError:
                 pass
 
+        if self.metadata_cache:
+            await self.metadata_cache.close()
+
         await self.session_manager.close()
 
     async def initialize_metadata(self):
@@ -103,8 +117,21 @@ class FOClient:
                 )
 
                 # Initialize metadata cache v2
+                tuning = SQLiteTuning(
+                    synchronous=self.config.metadata_db_synchronous,
+                    cache_size_mb=self.config.metadata_db_cache_size_mb,
+                    mmap_size_mb=self.config.metadata_db_mmap_size_mb,
+                    busy_timeout_ms=self.config.metadata_db_busy_timeout_ms,
+                    maintenance_interval=self.config.metadata_db_maintenance_interval,
+                )
                 self.metadata_cache = MetadataCacheV2(
-                    cache_dir, self.config.base_url, self.metadata_api_ops
+                    cache_dir,
+                    self.config.base_url,
+                    self.metadata_api_ops,
+                    tuning,
+                    schema_cache_size=self.config.max_memory_cache_size,
+                    schema_cache_ttl_seconds=self.config.cache_ttl_seconds,
+                    search_cache_ttl_seconds=self.config.cache_ttl_seconds,
                 )
                 # Initialize label operations v2 with cache support
 
@@ -559,7 +586,7 @@ class FOClient:
         """
         entity_schema = None
         if not skip_validation:
-            entity_schema = await self.get_public_entity_schema_by_entityset(
+            entity_schema = await self._get_entity_schema_by_entityset(
                 entity_name
             )
             if not entity_schema:
@@ -569,6 +596,91 @@ class FOClient:
 
         return await self.crud_ops.get_entities(entity_name, options, entity_schema)
 
+    async def iter_entities(
+        self,
+        entity_name: str,
+        options: Optional[QueryOptions] = None,
+        skip_validation: bool = False,
+        prefetch_pages: int = 1,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all entities matching a query, following server-driven paging
+
+        Unlike get_entities, which returns a single page, this follows
+        @odata.nextLink until the result set is exhausted and yields one
+        record at a time while the next page is fetched in the background.
+
+        Args:
+            entity_name: Name of the entity set
+            options: OData query options
+            skip_validation: Skip schema validation for performance
+            prefetch_pages: Maximum number of pages fetched ahead of the consumer
+
+        Yields:
+            Individual entity records
+        """
+        entity_schema = None
+        if not skip_validation:
+            entity_schema = await self._get_entity_schema_by_entityset(
+                entity_name
+            )
+            if not entity_schema:
+                raise FOClientError(
+                    f"Entity '{entity_name}' not found or not accessible for OData operations"
+                )
+
+        async for record in self.crud_ops.iter_entities(
+            entity_name, options, entity_schema, prefetch_pages
+        ):
+            yield record
+
+    async def iter_entities_partitioned(
+        self,
+        entity_name: str,
+        partitions: Union[int, List[QueryPartition]],
+        options: Optional[QueryOptions] = None,
+        max_workers: int = 4,
+        ordered: bool = False,
+        skip_validation: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream an entity by reading disjoint partitions concurrently
+
+        Args:
+            entity_name: Name of the entity set
+            partitions: Explicit partitions (see PartitionBuilder), or a count
+                to split on the leading characters of the entity's string key
+            options: Base OData query options combined with each partition filter
+            max_workers: Maximum number of partitions read concurrently
+            ordered: Yield records in partition order instead of arrival order
+            skip_validation: Skip schema validation for performance
+
+        Yields:
+            Individual entity records
+        """
+        entity_schema = None
+        if not skip_validation or isinstance(partitions, int):
+            entity_schema = await self._get_entity_schema_by_entityset(
+                entity_name
+            )
+            if not entity_schema:
+                raise FOClientError(
+                    f"Entity '{entity_name}' not found or not accessible for OData operations"
+                )
+
+        if isinstance(partitions, int):
+            partitions = PartitionBuilder.by_key_prefix(entity_schema, partitions)
+
+        reader = PartitionedReader(
+            self.crud_ops,
+            entity_name,
+            partitions,
+            options=options,
+            entity_schema=entity_schema,
+            max_workers=max_workers,
+            ordered=ordered,
+        )
+        async for record in reader:
+            yield record
+
     async def get_entity(
         self,
         entity_name: str,
@@ -592,7 +704,7 @@ class FOClient:
         """
         entity_schema = None
         if not skip_validation:
-            entity_schema = await self.get_public_entity_schema_by_entityset(
+            entity_schema = await self._get_entity_schema_by_entityset(
                 entity_name
             )
             if not entity_schema:
@@ -651,7 +763,7 @@ class FOClient:
         """
         entity_schema = None
         if not skip_validation:
-            entity_schema = await self.get_public_entity_schema_by_entityset(
+            entity_schema = await self._get_entity_schema_by_entityset(
                 entity_name
             )
             if not entity_schema:
@@ -690,7 +802,7 @@ class FOClient:
         """
         entity_schema = None
         if not skip_validation:
-            entity_schema = await self.get_public_entity_schema_by_entityset(
+            entity_schema = await self._get_entity_schema_by_entityset(
                 entity_name
             )
             if not entity_schema:
@@ -727,7 +839,7 @@ class FOClient:
         """
         entity_schema = None
         if not skip_validation:
-            entity_schema = await self.get_public_entity_schema_by_entityset(
+            entity_schema = await self._get_entity_schema_by_entityset(
                 entity_name
             )
             if not entity_schema:
@@ -763,7 +875,7 @@ class FOClient:
         """
         entity_schema = None
         if not skip_validation and entity_name:
-            entity_schema = await self.get_public_entity_schema_by_entityset(
+            entity_schema = await self._get_entity_schema_by_entityset(
                 entity_name
             )
             if not entity_schema:
@@ -775,6 +887,62 @@ class FOClient:
             action_name, parameters, entity_name, entity_key, entity_schema
         )
 
+    async def execute_batch(
+        self,
+        batch: BatchRequest,
+        max_operations_per_request: int = DEFAULT_MAX_OPERATIONS_PER_REQUEST,
+    ) -> List[BatchOperationResult]:
+        """Execute many entity operations through the OData $batch endpoint
+
+        Args:
+            batch: Operations to execute
+            max_operations_per_request: Maximum operations sent per $batch request
+
+        Returns:
+            One result per operation, in the order they were added
+        """
+        return await self.crud_ops.execute_batch(batch, max_operations_per_request)
+
+    def bulk_writer(
+        self,
+        entity_name: str,
+        operation: str = "create",
+        max_concurrency: int = 8,
+        use_batch: bool = False,
+        batch_size: int = 100,
+        skip_validation: bool = False,
+        **kwargs: Any,
+    ) -> BulkWriter:
+        """Create a bulk writer for streaming many records into one entity
+
+        The entity schema is loaded from the metadata cache when the writer is
+        entered and used for payload serialization and key extraction.
+
+        Args:
+            entity_name: Name of the entity set
+            operation: One of "create", "update" or "delete"
+            max_concurrency: Maximum number of requests in flight
+            use_batch: Send records through OData $batch requests
+            batch_size: Records per $batch request
+            skip_validation: Do not load the entity schema
+            **kwargs: Additional BulkWriter options
+
+        Returns:
+            BulkWriter to be used as an async context manager
+        """
+        return BulkWriter(
+            self.crud_ops,
+            entity_name,
+            operation=operation,
+            schema_loader=None
+            if skip_validation
+            else self._get_entity_schema_by_entityset,
+            max_concurrency=max_concurrency,
+            use_batch=use_batch,
+            batch_size=batch_size,
+            **kwargs,
+        )
+
     # Label Operations
 
     async def get_label_text(
@@ -1026,7 +1194,12 @@ class FOClient:
 
         async def cache_lookup():
             if self.metadata_cache:
-                return await self.metadata_cache.get_public_entity_schema(entity_name)
+                schema = await self.metadata_cache.get_public_entity_schema(
+                    entity_name
+                )
+                # Labels are resolved in place and public callers may modify
+                # the result; the cached schema is shared, so return a copy
+                return copy.deepcopy(schema)
             return None
 
         async def fallback_lookup():
@@ -1105,6 +1278,37 @@ class FOClient:
 
         return await resolve_labels_generic(enums, self.label_ops)
 
+    async def search_properties(
+        self,
+        text: str,
+        entity_name: Optional[str] = None,
+        data_type: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[PropertySearchResult]:
+        """Search entity properties by name, label or data type
+
+        Uses the full-text property index of the metadata cache, so it only
+        returns results once metadata has been synced.
+
+        Args:
+            text: Search text (e.g. 'CustomerAccount' or 'invoice account')
+            entity_name: Only return properties of this public entity
+            data_type: Only return properties of this data type
+            limit: Maximum number of results
+
+        Returns:
+            Matching properties ordered by relevance
+        """
+        await self._ensure_metadata_initialized()
+
+        if not self.metadata_cache:
+            return []
+
+        search_engine = self.metadata_cache.create_search_engine()
+        return await search_engine.search_properties(
+            text, entity_name=entity_name, data_type=data_type, limit=limit
+        )
+
     async def get_public_enumeration_info(
         self,
         enumeration_name: str,
@@ -1442,7 +1646,7 @@ class FOClient:
                     try:
                         content_type = response.headers.get("content-type", "")
                         if "application/json" in content_type:
-                            data = await response.json()
+                            data = await response.json(loads=json_loads)
                         else:
                             data = await response.text()
 
@@ -1532,7 +1736,8 @@ class FOClient:
             use_cache_first: Use metadata cache before F&O API (default: True)
 
         Returns:
-            PublicEntityInfo with full schema, or None if entity not found
+            PublicEntityInfo with full schema, or None if entity not found.
+            The schema is a copy the caller may modify.
 
         Resolution Logic:
             1. Try direct lookup in public entities (entityset_name == entity name)
@@ -1540,6 +1745,21 @@ class FOClient:
             3. Resolve to public_entity_name and fetch schema
             4. Use cache-first pattern for all lookups
         """
+        schema = await self._get_entity_schema_by_entityset(
+            entityset_name, use_cache_first=use_cache_first
+        )
+        return copy.deepcopy(schema)
+
+    async def _get_entity_schema_by_entityset(
+        self, entityset_name: str, use_cache_first: Optional[bool] = True
+    ) -> Optional[PublicEntityInfo]:
+        """Resolve an entityset name to its schema without copying it.
+
+        Cached schemas are shared with the metadata cache's memory tier, so
+        the result is read-only. Internal validation paths use this to avoid
+        a deep copy per request; public callers get a copy from
+        get_public_entity_schema_by_entityset().
+        """
 
         async def cache_lookup():
             if not self.metadata_cache:
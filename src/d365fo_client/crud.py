@@ -1,9 +1,19 @@
 """CRUD operations for D365 F&O client."""
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
-
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Union
+
+from .batch import (
+    DEFAULT_MAX_OPERATIONS_PER_REQUEST,
+    BatchOperation,
+    BatchOperationResult,
+    BatchRequest,
+    build_batch_body,
+    parse_batch_response,
+)
 from .exceptions import ActionError, EntityError
+from .json_backend import json_loads
 from .models import QueryOptions
 from .query import QueryBuilder
 from .session import SessionManager, _parse_server_timing
@@ -19,15 +29,17 @@ def _log_activity(
     request_id: Optional[str],
     activity_id: Optional[str],
     server_timing_ms: Optional[float] = None,
+    retries: int = 0,
 ) -> None:
     """Log the D365FO activity ID alongside our request ID for traceability."""
-    if activity_id or server_timing_ms is not None:
+    if activity_id or server_timing_ms is not None or retries:
         logger.debug(
-            "%s: x-ms-client-request-id=%s ms-dyn-aid=%s server-timing=%sms",
+            "%s: x-ms-client-request-id=%s ms-dyn-aid=%s server-timing=%sms retries=%s",
             operation,
             request_id or "n/a",
             activity_id or "n/a",
             server_timing_ms if server_timing_ms is not None else "n/a",
+            retries,
         )
 
 
@@ -60,17 +72,114 @@ class CrudOperations:
         Returns:
             Response containing entities
         """
-        session = await self.session_manager.get_session()
-        tracing = self.session_manager.get_tracing_headers()
         query_string = QueryBuilder.build_query_string(options)
         url = f"{self.base_url}/data/{entity_name}{query_string}"
+        return await self._get_page(url, entity_name)
+
+    async def iter_entities(
+        self,
+        entity_name: str,
+        options: Optional[QueryOptions] = None,
+        entity_schema: Optional["PublicEntityInfo"] = None,
+        prefetch_pages: int = 1,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream entities one record at a time, following @odata.nextLink
+
+        The next page is requested while the current one is being consumed.
+        At most ``prefetch_pages`` pages are buffered ahead of the consumer, so
+        memory stays bounded regardless of the size of the result set.
+
+        Args:
+            entity_name: Name of the entity set
+            options: OData query options applied to the first request
+            entity_schema: Optional entity schema for validation/optimization
+            prefetch_pages: Maximum number of pages fetched ahead of the consumer
+
+        Yields:
+            Individual entity records
+        """
+        async for page in self.iter_entity_pages(
+            entity_name, options, entity_schema, prefetch_pages
+        ):
+            for record in page:
+                yield record
+
+    async def iter_entity_pages(
+        self,
+        entity_name: str,
+        options: Optional[QueryOptions] = None,
+        entity_schema: Optional["PublicEntityInfo"] = None,
+        prefetch_pages: int = 1,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream the ``value`` array of each result page, following @odata.nextLink
+
+        Args:
+            entity_name: Name of the entity set
+            options: OData query options applied to the first request
+            entity_schema: Optional entity schema for validation/optimization
+            prefetch_pages: Maximum number of pages fetched ahead of the consumer
+
+        Yields:
+            Lists of entity records, one per server page
+        """
+        query_string = QueryBuilder.build_query_string(options)
+        url = f"{self.base_url}/data/{entity_name}{query_string}"
+
+        async for page in self._iter_pages(url, entity_name, prefetch_pages):
+            yield page
+
+    async def _iter_pages(
+        self, url: str, entity_name: str, prefetch_pages: int = 1
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield the ``value`` array of each page, prefetching ahead of the consumer"""
+        done = object()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, prefetch_pages))
+
+        async def producer() -> None:
+            next_url: Optional[str] = url
+            try:
+                while next_url:
+                    page = await self._get_page(next_url, entity_name)
+                    await queue.put(page.get("value", []))
+                    next_url = page.get("@odata.nextLink")
+                await queue.put(done)
+            except Exception as e:
+                await queue.put(e)
+
+        task = asyncio.create_task(producer())
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            if not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+    async def _get_page(self, url: str, entity_name: str) -> Dict[str, Any]:
+        """GET a collection URL and return the decoded OData response"""
+        session = await self.session_manager.get_session()
+        tracing = self.session_manager.get_tracing_headers()
 
         async with session.get(url, headers=tracing) as response:
             activity_id = response.headers.get("ms-dyn-aid")
             server_timing_ms = _parse_server_timing(response.headers.get("server-timing"))
-            _log_activity(f"GET {entity_name}", tracing.get("x-ms-client-request-id"), activity_id, server_timing_ms)
+            _log_activity(
+                f"GET {entity_name}",
+                tracing.get("x-ms-client-request-id"),
+                activity_id,
+                server_timing_ms,
+                self.session_manager.get_retry_count(response),
+            )
             if response.status == 200:
-                return await response.json()
+                return await response.json(loads=json_loads)
             else:
                 error_text = await response.text()
                 raise EntityError(
@@ -78,6 +187,7 @@ class CrudOperations:
                     activity_id=activity_id,
                     request_id=tracing.get("x-ms-client-request-id"),
                     server_timing_ms=server_timing_ms,
+                    status_code=response.status,
                 )
 
     async def get_entity(
@@ -120,9 +230,15 @@ class CrudOperations:
         async with session.get(url, headers=tracing) as response:
             activity_id = response.headers.get("ms-dyn-aid")
             server_timing_ms = _parse_server_timing(response.headers.get("server-timing"))
-            _log_activity(f"GET {entity_name}({key})", tracing.get("x-ms-client-request-id"), activity_id, server_timing_ms)
+            _log_activity(
+                f"GET {entity_name}({key})",
+                tracing.get("x-ms-client-request-id"),
+                activity_id,
+                server_timing_ms,
+                self.session_manager.get_retry_count(response),
+            )
             if response.status == 200:
-                return await response.json()
+                return await response.json(loads=json_loads)
             else:
                 error_text = await response.text()
                 raise EntityError(
@@ -130,6 +246,7 @@ class CrudOperations:
                     activity_id=activity_id,
                     request_id=tracing.get("x-ms-client-request-id"),
                     server_timing_ms=server_timing_ms,
+                    status_code=response.status,
                 )
 
     async def create_entity(
@@ -155,9 +272,15 @@ class CrudOperations:
         async with session.post(url, json=data, headers=tracing) as response:
             activity_id = response.headers.get("ms-dyn-aid")
             server_timing_ms = _parse_server_timing(response.headers.get("server-timing"))
-            _log_activity(f"CREATE {entity_name}", tracing.get("x-ms-client-request-id"), activity_id, server_timing_ms)
+            _log_activity(
+                f"CREATE {entity_name}",
+                tracing.get("x-ms-client-request-id"),
+                activity_id,
+                server_timing_ms,
+                self.session_manager.get_retry_count(response),
+            )
             if response.status in [200, 201]:
-                return await response.json()
+                return await response.json(loads=json_loads)
             else:
                 error_text = await response.text()
                 raise EntityError(
@@ -165,6 +288,7 @@ class CrudOperations:
                     activity_id=activity_id,
                     request_id=tracing.get("x-ms-client-request-id"),
                     server_timing_ms=server_timing_ms,
+                    status_code=response.status,
                 )
 
     async def update_entity(
@@ -197,11 +321,17 @@ class CrudOperations:
         async with session.request(method, url, json=data, headers=tracing) as response:
             activity_id = response.headers.get("ms-dyn-aid")
             server_timing_ms = _parse_server_timing(response.headers.get("server-timing"))
-            _log_activity(f"{method} {entity_name}({key})", tracing.get("x-ms-client-request-id"), activity_id, server_timing_ms)
+            _log_activity(
+                f"{method} {entity_name}({key})",
+                tracing.get("x-ms-client-request-id"),
+                activity_id,
+                server_timing_ms,
+                self.session_manager.get_retry_count(response),
+            )
             if response.status in [200, 204]:
                 if response.status == 204:
                     return {"success": True}
-                return await response.json()
+                return await response.json(loads=json_loads)
             else:
                 error_text = await response.text()
                 raise EntityError(
@@ -209,6 +339,7 @@ class CrudOperations:
                     activity_id=activity_id,
                     request_id=tracing.get("x-ms-client-request-id"),
                     server_timing_ms=server_timing_ms,
+                    status_code=response.status,
                 )
 
     async def delete_entity(
@@ -237,7 +368,13 @@ class CrudOperations:
         async with session.delete(url, headers=tracing) as response:
             activity_id = response.headers.get("ms-dyn-aid")
             server_timing_ms = _parse_server_timing(response.headers.get("server-timing"))
-            _log_activity(f"DELETE {entity_name}({key})", tracing.get("x-ms-client-request-id"), activity_id, server_timing_ms)
+            _log_activity(
+                f"DELETE {entity_name}({key})",
+                tracing.get("x-ms-client-request-id"),
+                activity_id,
+                server_timing_ms,
+                self.session_manager.get_retry_count(response),
+            )
             if response.status in [200, 204]:
                 return True
             else:
@@ -247,6 +384,7 @@ class CrudOperations:
                     activity_id=activity_id,
                     request_id=tracing.get("x-ms-client-request-id"),
                     server_timing_ms=server_timing_ms,
+                    status_code=response.status,
                 )
 
     async def call_action(
@@ -282,14 +420,20 @@ class CrudOperations:
         async with session.post(url, json=body, headers=tracing) as response:
             activity_id = response.headers.get("ms-dyn-aid")
             server_timing_ms = _parse_server_timing(response.headers.get("server-timing"))
-            _log_activity(f"ACTION {action_name}", tracing.get("x-ms-client-request-id"), activity_id, server_timing_ms)
+            _log_activity(
+                f"ACTION {action_name}",
+                tracing.get("x-ms-client-request-id"),
+                activity_id,
+                server_timing_ms,
+                self.session_manager.get_retry_count(response),
+            )
             if response.status in [200, 201, 204]:
                 if response.status == 204:
                     return {"success": True}
 
                 content_type = response.headers.get("content-type", "")
                 if "application/json" in content_type:
-                    return await response.json()
+                    return await response.json(loads=json_loads)
                 else:
                     return await response.text()
             else:
@@ -299,4 +443,75 @@ class CrudOperations:
                     activity_id=activity_id,
                     request_id=tracing.get("x-ms-client-request-id"),
                     server_timing_ms=server_timing_ms,
+                    status_code=response.status,
+                )
+
+    async def execute_batch(
+        self,
+        batch: BatchRequest,
+        max_operations_per_request: int = DEFAULT_MAX_OPERATIONS_PER_REQUEST,
+    ) -> List[BatchOperationResult]:
+        """Execute a batch of operations through the OData $batch endpoint
+
+        The batch is split into requests of at most ``max_operations_per_request``
+        operations. Failures of individual operations are reported in the
+        returned results rather than raised.
+
+        Args:
+            batch: Operations to execute
+            max_operations_per_request: Maximum operations sent per $batch request
+
+        Returns:
+            One result per operation, in the order they were added
+
+        Raises:
+            EntityError: If a $batch request itself is rejected
+        """
+        results: List[BatchOperationResult] = []
+        for groups in batch.chunks(max_operations_per_request):
+            results.extend(await self._send_batch(groups))
+        results.sort(key=lambda result: result.index)
+        return results
+
+    async def _send_batch(
+        self, groups: List[List[BatchOperation]]
+    ) -> List[BatchOperationResult]:
+        """Send one $batch request and parse its multipart response"""
+        session = await self.session_manager.get_session()
+        tracing = self.session_manager.get_tracing_headers()
+        url = f"{self.base_url}/data/$batch"
+        content_type, body = build_batch_body(groups, self.base_url)
+        headers = {
+            **tracing,
+            "Content-Type": content_type,
+            "Accept": "multipart/mixed",
+        }
+        operation_count = sum(len(group) for group in groups)
+
+        async with session.post(
+            url, data=body.encode("utf-8"), headers=headers
+        ) as response:
+            activity_id = response.headers.get("ms-dyn-aid")
+            server_timing_ms = _parse_server_timing(
+                response.headers.get("server-timing")
+            )
+            _log_activity(
+                f"BATCH {operation_count} operations",
+                tracing.get("x-ms-client-request-id"),
+                activity_id,
+                server_timing_ms,
+                self.session_manager.get_retry_count(response),
+            )
+            response_text = await response.text()
+            if response.status == 200:
+                return parse_batch_response(
+                    response.headers.get("content-type", ""), response_text, groups
+                )
+            else:
+                raise EntityError(
+                    f"BATCH failed: {response.status} - {response_text}",
+                    activity_id=activity_id,
+                    request_id=tracing.get("x-ms-client-request-id"),
+                    server_timing_ms=server_timing_ms,
+                    status_code=response.status,
                 )
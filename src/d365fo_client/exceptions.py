@@ -14,6 +14,7 @@ class FOClientError(Exception):
             Also required for support ticket tracing.
         server_timing_ms: Duration reported by the server in the ``server-timing``
             response header (milliseconds), if present.
+        status_code: HTTP status code of the failed response, if any.
     """
 
     def __init__(
@@ -22,11 +23,13 @@ class FOClientError(Exception):
         activity_id: Optional[str] = None,
         request_id: Optional[str] = None,
         server_timing_ms: Optional[float] = None,
+        status_code: Optional[int] = None,
     ) -> None:
         super().__init__(message)
         self.activity_id: Optional[str] = activity_id
         self.request_id: Optional[str] = request_id
         self.server_timing_ms: Optional[float] = server_timing_ms
+        self.status_code: Optional[int] = status_code
 
     def to_dict(self) -> dict:
         """Return a structured representation suitable for AI agent consumption."""
@@ -37,6 +40,8 @@ class FOClientError(Exception):
             result["x_ms_client_request_id"] = self.request_id
         if self.server_timing_ms is not None:
             result["server_timing_ms"] = self.server_timing_ms
+        if self.status_code is not None:
+            result["status_code"] = self.status_code
         return result
 
 
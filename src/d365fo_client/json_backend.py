@@ -0,0 +1,263 @@
+"""Pluggable JSON decoding for D365 F&O responses.
+
+Metadata and entity responses can be tens of megabytes, which makes JSON
+decoding the dominant CPU cost of a metadata sync or a large export. When
+``orjson`` or ``msgspec`` is installed (``pip install d365fo-client[speedups]``)
+it is used automatically; otherwise the standard library ``json`` module is
+used. The backend can also be chosen explicitly with ``set_json_backend()``.
+
+``iter_json_array()`` parses a large OData collection incrementally, yielding
+one item at a time instead of materialising the whole response.
+"""
+
+import codecs
+import json
+import logging
+import re
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Union,
+)
+
+logger = logging.getLogger(__name__)
+
+JSON_BACKENDS = ("orjson", "msgspec", "json")
+
+
+def _load_decoder(name: str) -> Callable[[Union[str, bytes]], Any]:
+    """Return the decode function of a backend, raising ImportError if missing"""
+    if name == "orjson":
+        import orjson
+
+        return orjson.loads
+    if name == "msgspec":
+        import msgspec
+
+        decoder = msgspec.json.Decoder()
+
+        def msgspec_loads(data: Union[str, bytes]) -> Any:
+            try:
+                return decoder.decode(data)
+            except msgspec.DecodeError as e:
+                # Match json/orjson, whose decode errors are ValueErrors
+                raise ValueError(str(e)) from e
+
+        return msgspec_loads
+    if name == "json":
+        return json.loads
+    raise ValueError(f"Unknown JSON backend '{name}', expected one of {JSON_BACKENDS}")
+
+
+def available_json_backends() -> List[str]:
+    """Return the JSON backends that can be imported in this environment"""
+    available = []
+    for name in JSON_BACKENDS:
+        try:
+            _load_decoder(name)
+        except ImportError:
+            continue
+        available.append(name)
+    return available
+
+
+def _select_default() -> Dict[str, Any]:
+    for name in JSON_BACKENDS:
+        try:
+            return {"name": name, "loads": _load_decoder(name)}
+        except ImportError:
+            continue
+    return {"name": "json", "loads": json.loads}
+
+
+_backend = _select_default()
+
+
+def get_json_backend() -> str:
+    """Return the name of the JSON backend in use"""
+    return _backend["name"]
+
+
+def set_json_backend(name: str) -> None:
+    """Select the JSON backend used to decode responses
+
+    Args:
+        name: One of "orjson", "msgspec" or "json"
+
+    Raises:
+        ValueError: If the backend is unknown
+        ImportError: If the backend package is not installed
+    """
+    _backend["loads"] = _load_decoder(name)
+    _backend["name"] = name
+    logger.debug(f"JSON backend set to {name}")
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON document with the selected backend
+
+    Compatible with the ``loads`` argument of ``aiohttp.ClientResponse.json()``.
+    Invalid documents raise ``ValueError`` whichever backend is selected.
+    """
+    return _backend["loads"](data)
+
+
+_WHITESPACE = " \t\n\r"
+
+# Quotes and brackets are the only characters that change nesting depth
+_STRUCTURAL = re.compile(r'["{}\[\]]')
+# Rest of a string after its opening quote, skipping escaped characters
+_STRING_TAIL = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_SCALAR_END = re.compile(r"[,\]}\s]")
+
+
+def _value_end(text: str, start: int) -> Optional[int]:
+    """Index just past the JSON value starting at ``start``
+
+    Returns None if the value is not complete within ``text``. A number or
+    literal is only complete once the character following it is present.
+    """
+    first = text[start]
+    if first == '"':
+        match = _STRING_TAIL.match(text, start + 1)
+        return match.end() if match else None
+    if first not in "{[":
+        match = _SCALAR_END.search(text, start)
+        return match.start() if match else None
+
+    depth = 0
+    pos = start
+    while True:
+        match = _STRUCTURAL.search(text, pos)
+        if match is None:
+            return None
+        char = match.group()
+        if char == '"':
+            match = _STRING_TAIL.match(text, match.end())
+            if match is None:
+                return None
+        elif char in "{[":
+            depth += 1
+        else:
+            depth -= 1
+        pos = match.end()
+        if depth == 0:
+            return pos
+
+
+class _StreamBuffer:
+    """Text buffer filled on demand from an async stream of byte chunks"""
+
+    def __init__(self, chunks: AsyncIterable[bytes]):
+        self._chunks = chunks.__aiter__()
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    async def fill(self) -> bool:
+        """Append the next chunk; return False once the stream is exhausted"""
+        if self.eof:
+            return False
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self.text += self._decoder.decode(b"", final=True)
+            self.eof = True
+            return False
+        # Drop consumed text so the buffer only holds the unparsed tail
+        self.text = self.text[self.pos :] + self._decoder.decode(chunk)
+        self.pos = 0
+        return True
+
+    async def skip_whitespace(self) -> None:
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text) or not await self.fill():
+                return
+
+    async def peek(self) -> str:
+        await self.skip_whitespace()
+        if self.pos >= len(self.text):
+            raise ValueError("Unexpected end of JSON stream")
+        return self.text[self.pos]
+
+    async def expect(self, char: str) -> None:
+        found = await self.peek()
+        if found != char:
+            raise ValueError(
+                f"Expected '{char}' at stream offset {self.pos}, found '{found}'"
+            )
+        self.pos += 1
+
+    async def decode_value(self) -> Any:
+        """Decode one complete JSON value, reading more data while it is truncated
+
+        Only the boundaries of the value are found here; the value itself is
+        decoded by the selected backend.
+        """
+        await self.skip_whitespace()
+        end = _value_end(self.text, self.pos)
+        while end is None:
+            if not await self.fill():
+                raise ValueError("Unexpected end of JSON stream")
+            end = _value_end(self.text, self.pos)
+        value = json_loads(self.text[self.pos : end])
+        self.pos = end
+        return value
+
+
+async def iter_json_array(
+    chunks: AsyncIterable[bytes], key: str = "value"
+) -> AsyncIterator[Any]:
+    """Incrementally yield the items of a top-level JSON array
+
+    Parses ``{"...": ..., "<key>": [item, item, ...], ...}`` from a stream of
+    byte chunks (e.g. ``response.content.iter_chunked()``) and yields each
+    array item as soon as it is complete, so only one item is held in memory
+    at a time rather than the whole document.
+
+    Args:
+        chunks: Async iterable of raw UTF-8 byte chunks
+        key: Name of the top-level property holding the array
+
+    Raises:
+        ValueError: If the stream is not valid JSON of the expected shape
+    """
+    buffer = _StreamBuffer(chunks)
+
+    await buffer.expect("{")
+    if await buffer.peek() == "}":
+        return
+
+    while True:
+        name = await buffer.decode_value()
+        await buffer.expect(":")
+        if name != key:
+            await buffer.decode_value()
+        else:
+            await buffer.expect("[")
+            if await buffer.peek() == "]":
+                buffer.pos += 1
+            else:
+                while True:
+                    yield await buffer.decode_value()
+                    separator = await buffer.peek()
+                    buffer.pos += 1
+                    if separator == "]":
+                        break
+                    if separator != ",":
+                        raise ValueError(f"Expected ',' or ']' in '{key}' array")
+
+        separator = await buffer.peek()
+        buffer.pos += 1
+        if separator == "}":
+            return
+        if separator != ",":
+            raise ValueError("Expected ',' or '}' in JSON object")
@@ -1,8 +1,10 @@
 """Label operations for D365 F&O client."""
 
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional, Protocol, Union, runtime_checkable
 
+from .json_backend import json_loads
 from .models import LabelInfo, PublicEntityInfo
 from .session import SessionManager
 
@@ -40,6 +42,7 @@ class LabelOperations:
         session_manager: SessionManager,
         metadata_url: str,
         label_cache: Optional[LabelCacheProtocol] = None,
+        max_concurrency: int = 8,
     ):
         """Initialize label operations
 
@@ -47,10 +50,15 @@ class LabelOperations:
             session_manager: HTTP session manager
             metadata_url: Metadata API URL
             label_cache: Optional label cache implementing LabelCacheProtocol
+            max_concurrency: Maximum label requests in flight when fetching misses
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
         self.session_manager = session_manager
         self.metadata_url = metadata_url
         self.label_cache = label_cache
+        self.max_concurrency = max_concurrency
 
     def set_label_cache(self, label_cache: LabelCacheProtocol):
         """Set the label cache for label operations
@@ -78,6 +86,25 @@ class LabelOperations:
             if cached_value is not None:
                 return cached_value
 
+        label_text = await self._fetch_label(label_id, language)
+
+        # Cache the result
+        if label_text is not None and self.label_cache:
+            await self.label_cache.set_labels_batch(
+                [LabelInfo(id=label_id, language=language, value=label_text)]
+            )
+
+        return label_text
+
+    async def _fetch_label(self, label_id: str, language: str) -> Optional[str]:
+        """Fetch one label from the Labels endpoint
+
+        Throttled and unavailable responses are retried by the session's
+        retry middleware before they reach this method.
+
+        Returns:
+            Label text, or None if the label could not be fetched
+        """
         try:
             session = await self.session_manager.get_session()
             tracing = self.session_manager.get_tracing_headers()
@@ -85,25 +112,42 @@ class LabelOperations:
 
             async with session.get(url, headers=tracing) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    label_text = data.get("Value", "")
+                    data = await response.json(loads=json_loads)
+                    return data.get("Value", "")
 
-                    # Cache the result
-                    if self.label_cache:
-                        label_info = LabelInfo(
-                            id=label_id, language=language, value=label_text
-                        )
-                        await self.label_cache.set_label(label_info)
-
-                    return label_text
-                else:
-                    print(f"Error fetching label {label_id}: {response.status}")
+                logger.warning(f"Error fetching label {label_id}: {response.status}")
 
         except Exception as e:
-            print(f"Exception fetching label {label_id}: {e}")
+            logger.warning(f"Exception fetching label {label_id}: {e}")
 
         return None
 
+    async def _fetch_labels(
+        self, label_ids: List[str], language: str
+    ) -> Dict[str, str]:
+        """Fetch labels with up to ``max_concurrency`` requests in flight
+
+        The Labels endpoint only supports key lookups, so each label is one
+        GET; a small pool of workers shares the id list.
+
+        Returns:
+            Dictionary mapping label ID to label text for fetched labels
+        """
+        results: Dict[str, str] = {}
+        # Workers share one iterator so every label is fetched exactly once
+        pending = iter(label_ids)
+
+        async def worker() -> None:
+            for label_id in pending:
+                label_text = await self._fetch_label(label_id, language)
+                if label_text is not None:
+                    results[label_id] = label_text
+
+        await asyncio.gather(
+            *(worker() for _ in range(min(self.max_concurrency, len(label_ids))))
+        )
+        return results
+
     async def get_labels_batch(
         self, label_ids: List[str], language: str = "en-US"
     ) -> Dict[str, str]:
@@ -119,51 +163,31 @@ class LabelOperations:
         if not label_ids:
             return {}
 
-        results = {}
-        uncached_ids = []
-
-        # First, check cache for all labels if available
+        # First, check cache for all labels in one lookup if available
         if self.label_cache:
-            for label_id in label_ids:
-                cached_value = await self.label_cache.get_label(label_id, language)
-                if cached_value is not None:
-                    results[label_id] = cached_value
-                else:
-                    uncached_ids.append(label_id)
+            results = await self.label_cache.get_labels_batch(label_ids, language)
+            uncached_ids = [
+                label_id for label_id in label_ids if label_id not in results
+            ]
         else:
+            results = {}
             uncached_ids = label_ids
 
         # Fetch uncached labels from API
         if uncached_ids:
-            # For now, use individual calls - could be optimized with batch API if available
-            fetched_labels = []
-            for label_id in uncached_ids:
-                try:
-                    session = await self.session_manager.get_session()
-                    tracing = self.session_manager.get_tracing_headers()
-                    url = f"{self.metadata_url}/Labels(Id='{label_id}',Language='{language}')"
-
-                    async with session.get(url, headers=tracing) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            label_text = data.get("Value", "")
-                            results[label_id] = label_text
-
-                            # Prepare for batch cache storage
-                            fetched_labels.append(
-                                LabelInfo(
-                                    id=label_id, language=language, value=label_text
-                                )
-                            )
-                        else:
-                            print(f"Error fetching label {label_id}: {response.status}")
-
-                except Exception as e:
-                    print(f"Exception fetching label {label_id}: {e}")
+            fetched = await self._fetch_labels(
+                list(dict.fromkeys(uncached_ids)), language
+            )
+            results.update(fetched)
 
             # Batch cache all fetched labels
-            if fetched_labels and self.label_cache:
-                await self.label_cache.set_labels_batch(fetched_labels)
+            if fetched and self.label_cache:
+                await self.label_cache.set_labels_batch(
+                    [
+                        LabelInfo(id=label_id, language=language, value=label_text)
+                        for label_id, label_text in fetched.items()
+                    ]
+                )
 
         return results
 
@@ -517,13 +541,14 @@ async def resolve_labels_generic_with_cache(
             self, label_ids: List[str], language: str
         ) -> Dict[str, str]:
             """Get labels using the cache directly"""
-            label_texts = {}
-            for label_id in label_ids:
-                if label_id:
-                    label_text = await self.cache.get_label(label_id, language)
-                    if label_text:
-                        label_texts[label_id] = label_text
-            return label_texts
+            label_texts = await self.cache.get_labels_batch(
+                [label_id for label_id in label_ids if label_id], language
+            )
+            return {
+                label_id: label_text
+                for label_id, label_text in label_texts.items()
+                if label_text
+            }
 
     # Use the generic function with the cache resolver
     cache_resolver = CacheLabelResolver(cache)
@@ -0,0 +1,177 @@
+"""Adaptive client-side concurrency limiting for D365 F&O requests.
+
+The limiter follows an AIMD (additive increase, multiplicative decrease)
+scheme. While server latency stays close to the lowest latency observed for
+the same endpoint, the number of concurrent requests grows by roughly one per
+round trip. A ``429`` halves the limit; latency inflation beyond a tolerance
+shrinks it gently. Latency is tracked per endpoint because a metadata lookup
+and a large entity query or ``$batch`` differ by an order of magnitude.
+This lets a client saturate an environment without hand-tuning a fixed
+concurrency per sandbox or production tier.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Hashable, List, Optional
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limiter driven by throttling and latency signals"""
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        latency_tolerance: float = 2.0,
+        throttle_backoff: float = 0.5,
+        latency_backoff: float = 0.9,
+        smoothing: float = 0.2,
+        cooldown_seconds: float = 1.0,
+        max_tracked_endpoints: int = 256,
+    ):
+        """Initialize limiter
+
+        Args:
+            initial_limit: Starting number of concurrent requests
+            min_limit: Lower bound for the limit
+            max_limit: Upper bound for the limit
+            latency_tolerance: Smoothed latency above ``baseline * tolerance``
+                counts as congestion
+            throttle_backoff: Multiplier applied to the limit on a 429
+            latency_backoff: Multiplier applied to the limit on latency inflation
+            smoothing: Weight of the newest sample in the latency moving average
+            cooldown_seconds: Minimum time between two decreases, so a burst of
+                429s from requests already in flight only counts once
+            max_tracked_endpoints: Endpoints whose latency is tracked; the least
+                recently seen one is forgotten beyond that
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial_limit <= max_limit")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.throttle_backoff = throttle_backoff
+        self.latency_backoff = latency_backoff
+        self.smoothing = smoothing
+        self.cooldown_seconds = cooldown_seconds
+        self.max_tracked_endpoints = max_tracked_endpoints
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._condition_loop: Optional[asyncio.AbstractEventLoop] = None
+        # endpoint -> [baseline_ms, smoothed_ms]; least recently seen first
+        self._latency: Dict[Hashable, List[float]] = {}
+        self._last_decrease: Optional[float] = None
+
+        self._throttled = 0
+        self._latency_backoffs = 0
+        self._samples = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        """Hold a concurrency slot for the duration of the block."""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            async with condition:
+                self._in_flight -= 1
+                condition.notify_all()
+
+    def _get_condition(self) -> asyncio.Condition:
+        # Bound lazily so the limiter survives being used from a new event loop
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._condition_loop is not loop:
+            self._condition = asyncio.Condition()
+            self._condition_loop = loop
+        return self._condition
+
+    def record(
+        self, status: int, latency_ms: Optional[float], endpoint: Hashable = None
+    ) -> None:
+        """Feed the outcome of a request into the limiter.
+
+        Must be called while the request still holds its slot, so that the
+        limiter can tell whether the current limit is actually being used.
+
+        Args:
+            status: HTTP status of the response
+            latency_ms: Server-reported or measured latency in milliseconds
+            endpoint: Key of the operation the latency belongs to (e.g. method
+                and path); each endpoint is compared with its own baseline
+        """
+        now = time.monotonic()
+        if status == 429:
+            self._throttled += 1
+            self._decrease(self.throttle_backoff, now)
+            return
+
+        if latency_ms is None or status >= 500:
+            return
+
+        self._samples += 1
+        track = self._latency.pop(endpoint, None)
+        if track is None:
+            track = [latency_ms, latency_ms]
+            if len(self._latency) >= self.max_tracked_endpoints:
+                del self._latency[next(iter(self._latency))]
+        else:
+            track[1] += self.smoothing * (latency_ms - track[1])
+            if latency_ms < track[0]:
+                track[0] = latency_ms
+            else:
+                # Let the baseline drift up slowly so a permanently slower
+                # environment is not treated as congested forever
+                track[0] += 0.01 * (latency_ms - track[0])
+        self._latency[endpoint] = track
+        baseline_ms, smoothed_ms = track
+
+        if smoothed_ms > baseline_ms * self.latency_tolerance:
+            self._latency_backoffs += 1
+            self._decrease(self.latency_backoff, now)
+        elif self._in_flight * 2 >= self.limit:
+            # Only grow when the limit is being used; an idle client would
+            # otherwise drift to max_limit and lose the protection
+            self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+
+    def _decrease(self, ratio: float, now: float) -> None:
+        if (
+            self._last_decrease is not None
+            and now - self._last_decrease < self.cooldown_seconds
+        ):
+            return
+        self._limit = max(float(self.min_limit), self._limit * ratio)
+        self._last_decrease = now
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return limiter state for diagnostics."""
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "endpoints": {
+                str(endpoint): {"baseline_ms": baseline_ms, "smoothed_ms": smoothed_ms}
+                for endpoint, (baseline_ms, smoothed_ms) in self._latency.items()
+            },
+            "samples": self._samples,
+            "throttled": self._throttled,
+            "latency_backoffs": self._latency_backoffs,
+        }
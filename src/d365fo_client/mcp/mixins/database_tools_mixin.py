@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import aiosqlite
 
+from ...metadata_v2.connection_manager import SQLiteTuning
 from .base_tools_mixin import BaseToolsMixin
 
 logger = logging.getLogger(__name__)
@@ -100,9 +101,12 @@ class DatabaseToolsMixin(BaseToolsMixin):
 
                 # Get database path
                 db_path = await self._get_database_path(profile)
+                tuning = await self._get_database_tuning(profile)
 
                 # Execute query
-                columns, rows = await self._execute_safe_query(query, db_path, limit)
+                columns, rows = await self._execute_safe_query(
+                    query, db_path, tuning, limit
+                )
 
                 # Format results
                 formatted_results = self._format_query_results(columns, rows, format)
@@ -188,6 +192,7 @@ class DatabaseToolsMixin(BaseToolsMixin):
 
                 schema_info = await self._get_schema_info(
                     db_path,
+                    await self._get_database_tuning(profile),
                     table_name,
                     include_statistics,
                     include_indexes,
@@ -240,7 +245,11 @@ class DatabaseToolsMixin(BaseToolsMixin):
                 db_path = await self._get_database_path(profile)
 
                 table_info = await self._get_detailed_table_info(
-                    db_path, table_name, include_sample_data, include_relationships
+                    db_path,
+                    await self._get_database_tuning(profile),
+                    table_name,
+                    include_sample_data,
+                    include_relationships,
                 )
 
                 return table_info
@@ -302,6 +311,7 @@ class DatabaseToolsMixin(BaseToolsMixin):
                     db_path = await self._get_database_path(profile)
                     additional_stats = await self._get_enhanced_statistics(
                         db_path,
+                        await self._get_database_tuning(profile),
                         include_table_stats,
                         include_version_stats,
                         include_performance_stats,
@@ -383,14 +393,28 @@ class DatabaseToolsMixin(BaseToolsMixin):
                 "No metadata database available for this profile"
             )
 
+    async def _get_database_tuning(self, profile: str = "default") -> SQLiteTuning:
+        """Get the PRAGMA profile of the metadata cache connections.
+
+        Args:
+            profile: Configuration profile to use
+
+        Returns:
+            SQLite tuning of the profile's metadata cache (defaults if unset)
+        """
+        client = await self.client_manager.get_client(profile)
+        connections = getattr(client.metadata_cache, "connections", None)
+        return getattr(connections, "tuning", None) or SQLiteTuning()
+
     async def _execute_safe_query(
-        self, query: str, db_path: str, limit: int = 100
+        self, query: str, db_path: str, tuning: SQLiteTuning, limit: int = 100
     ) -> Tuple[List[str], List[Tuple]]:
         """Execute a safe SQL query and return results.
 
         Args:
             query: SQL query to execute
             db_path: Path to database file
+            tuning: PRAGMA profile applied to the connection
             limit: Maximum number of rows to return
 
         Returns:
@@ -401,6 +425,7 @@ class DatabaseToolsMixin(BaseToolsMixin):
             query += f" LIMIT {limit}"
 
         async with aiosqlite.connect(db_path) as db:
+            await tuning.apply(db)
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(query)
             rows = await cursor.fetchall()
@@ -489,6 +514,7 @@ class DatabaseToolsMixin(BaseToolsMixin):
     async def _get_schema_info(
         self,
         db_path: str,
+        tuning: SQLiteTuning,
         table_name: Optional[str] = None,
         include_statistics: bool = True,
         include_indexes: bool = True,
@@ -496,6 +522,7 @@ class DatabaseToolsMixin(BaseToolsMixin):
     ) -> Dict[str, Any]:
         """Get comprehensive database schema information."""
         async with aiosqlite.connect(db_path) as db:
+            await tuning.apply(db)
             schema_info = {
                 "database_path": db_path,
                 "generated_at": time.time(),
@@ -568,12 +595,14 @@ class DatabaseToolsMixin(BaseToolsMixin):
     async def _get_detailed_table_info(
         self,
         db_path: str,
+        tuning: SQLiteTuning,
         table_name: str,
         include_sample_data: bool = False,
         include_relationships: bool = True,
     ) -> Dict[str, Any]:
         """Get detailed information about a specific table."""
         async with aiosqlite.connect(db_path) as db:
+            await tuning.apply(db)
             table_info = {"table_name": table_name, "generated_at": time.time()}
 
             # Verify table exists
@@ -671,6 +700,7 @@ class DatabaseToolsMixin(BaseToolsMixin):
     async def _get_enhanced_statistics(
         self,
         db_path: str,
+        tuning: SQLiteTuning,
         include_table_stats: bool = True,
         include_version_stats: bool = True,
         include_performance_stats: bool = True,
@@ -679,6 +709,7 @@ class DatabaseToolsMixin(BaseToolsMixin):
         stats = {}
 
         async with aiosqlite.connect(db_path) as db:
+            await tuning.apply(db)
             if include_table_stats:
                 # Get detailed table statistics
                 cursor = await db.execute(
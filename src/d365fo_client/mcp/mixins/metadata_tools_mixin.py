@@ -396,6 +396,63 @@ class MetadataToolsMixin(BaseToolsMixin):
                     {"pattern": pattern, "limit": limit, "profile": profile},
                 )
 
+        @self.mcp.tool()
+        async def d365fo_search_properties(
+            text: str,
+            entity_name: Optional[str] = None,
+            data_type: Optional[str] = None,
+            limit: int = 50,
+            profile: str = "default",
+        ) -> dict:
+            """Search entity properties (fields) across all public entities by name, label or data type.
+
+            Use this to answer questions like "which entities expose a CustomerAccount field" or "which fields are labelled 'Invoice account'". Matches property names, label texts and data types using the full-text index of the metadata cache; a single word also matches as a prefix (e.g. 'Invoice' finds 'InvoiceAccount').
+
+            Args:
+                text: Property name, label words or data type to search for (e.g. 'CustomerAccount', 'invoice account').
+                entity_name: Only return properties of this public entity (e.g. 'CustomersV3').
+                data_type: Only return properties of this data type (e.g. 'String', 'Date', 'Enum').
+                limit: Maximum number of matching properties to return.
+                profile: Configuration profile to use (optional - uses default profile if not specified)
+
+            Returns:
+                Dictionary with matching properties and the entities exposing them
+            """
+            try:
+                client = await self._get_client(profile)
+
+                start_time = time.time()
+
+                properties = await client.search_properties(
+                    text, entity_name=entity_name, data_type=data_type, limit=limit
+                )
+
+                search_time = time.time() - start_time
+
+                return {
+                    "properties": [prop.to_dict() for prop in properties],
+                    "returnedCount": len(properties),
+                    "entities": sorted({prop.entity_name for prop in properties}),
+                    "searchTime": round(search_time, 3),
+                    "text": text,
+                    "limit": limit,
+                    "filters": {"entity_name": entity_name, "data_type": data_type},
+                }
+
+            except Exception as e:
+                logger.error(f"Search properties failed: {e}")
+                return self._create_error_response(
+                    e,
+                    "d365fo_search_properties",
+                    {
+                        "text": text,
+                        "entity_name": entity_name,
+                        "data_type": data_type,
+                        "limit": limit,
+                        "profile": profile,
+                    },
+                )
+
         @self.mcp.tool()
         async def d365fo_get_enumeration_fields(
             enumeration_name: str,
@@ -517,12 +574,14 @@ class MetadataToolsMixin(BaseToolsMixin):
             if not search_text:
                 return []
 
-            # Create search query for data entities
+            # Create search query for data entities; misspelled names fall
+            # back to near matches by edit distance
             query = SearchQuery(
                 text=search_text,
                 entity_types=["data_entity"],
                 limit=5,  # Limit FTS suggestions
                 use_fulltext=True,
+                fuzzy=True,
             )
 
             # Execute FTS search
@@ -8,6 +8,7 @@ from typing import Any, Dict, List
 
 from mcp.types import Resource
 
+from ...metadata_v2.connection_manager import SQLiteTuning
 from ..client_manager import D365FOClientManager
 
 logger = logging.getLogger(__name__)
@@ -68,7 +69,9 @@ class DatabaseResourceHandler:
             # Get list of tables from database
             client = await self.client_manager.get_client()
             if hasattr(client, "metadata_cache") and client.metadata_cache:
-                table_names = await self._get_table_names(client.metadata_cache.db_path)
+                table_names = await self._get_table_names(
+                    client.metadata_cache.db_path, self._get_tuning(client)
+                )
 
                 for table_name in table_names:
                     resources.append(
@@ -120,11 +123,17 @@ class DatabaseResourceHandler:
             }
             return json.dumps(error_content, indent=2)
 
-    async def _get_table_names(self, db_path: str) -> List[str]:
+    def _get_tuning(self, client) -> SQLiteTuning:
+        """Get the PRAGMA profile of the client's metadata cache connections."""
+        connections = getattr(client.metadata_cache, "connections", None)
+        return getattr(connections, "tuning", None) or SQLiteTuning()
+
+    async def _get_table_names(self, db_path: str, tuning: SQLiteTuning) -> List[str]:
         """Get list of table names from database."""
         import aiosqlite
 
         async with aiosqlite.connect(db_path) as db:
+            await tuning.apply(db)
             cursor = await db.execute(
                 "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
             )
@@ -142,6 +151,7 @@ class DatabaseResourceHandler:
             import aiosqlite
 
             async with aiosqlite.connect(db_path) as db:
+                await self._get_tuning(client).apply(db)
                 schema_info = {
                     "database_path": db_path,
                     "generated_at": datetime.utcnow().isoformat(),
@@ -261,14 +271,18 @@ class DatabaseResourceHandler:
             else:
                 # Fallback to basic statistics
                 db_path = str(client.metadata_cache.db_path)
-                stats = await self._get_basic_statistics(db_path)
+                stats = await self._get_basic_statistics(
+                    db_path, self._get_tuning(client)
+                )
                 return json.dumps(stats, indent=2)
 
         except Exception as e:
             logger.error(f"Failed to get database statistics: {e}")
             raise
 
-    async def _get_basic_statistics(self, db_path: str) -> Dict[str, Any]:
+    async def _get_basic_statistics(
+        self, db_path: str, tuning: SQLiteTuning
+    ) -> Dict[str, Any]:
         """Get basic database statistics."""
         import os
 
@@ -291,6 +305,7 @@ class DatabaseResourceHandler:
             stats["database_size_mb"] = None
 
         async with aiosqlite.connect(db_path) as db:
+            await tuning.apply(db)
             # Table counts
             cursor = await db.execute(
                 "SELECT name FROM sqlite_master WHERE type='table'"
@@ -343,6 +358,7 @@ class DatabaseResourceHandler:
             import aiosqlite
 
             async with aiosqlite.connect(db_path) as db:
+                await self._get_tuning(client).apply(db)
                 tables_info = {
                     "generated_at": datetime.utcnow().isoformat(),
                     "resource_type": "tables_list",
@@ -397,6 +413,7 @@ class DatabaseResourceHandler:
             import aiosqlite
 
             async with aiosqlite.connect(db_path) as db:
+                await self._get_tuning(client).apply(db)
                 indexes_info = {
                     "generated_at": datetime.utcnow().isoformat(),
                     "resource_type": "indexes_info",
@@ -454,6 +471,7 @@ class DatabaseResourceHandler:
             import aiosqlite
 
             async with aiosqlite.connect(db_path) as db:
+                await self._get_tuning(client).apply(db)
                 relationships_info = {
                     "generated_at": datetime.utcnow().isoformat(),
                     "resource_type": "relationships_info",
@@ -526,6 +544,7 @@ class DatabaseResourceHandler:
             import aiosqlite
 
             async with aiosqlite.connect(db_path) as db:
+                await self._get_tuning(client).apply(db)
                 # Verify table exists
                 cursor = await db.execute(
                     "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
@@ -2,11 +2,12 @@
 
 import logging
 import re
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 from d365fo_client.crud import CrudOperations
 
 from .exceptions import MetadataError
+from .json_backend import iter_json_array, json_loads
 from .labels import LabelOperations
 from .models import (
     ActionInfo,
@@ -34,6 +35,9 @@ from .session import SessionManager, _parse_server_timing
 
 logger = logging.getLogger(__name__)
 
+# Read size used when streaming the PublicEntities payload
+PUBLIC_ENTITIES_CHUNK_SIZE = 64 * 1024
+
 
 class MetadataAPIOperations:
     """Operations for metadata API endpoints"""
@@ -272,7 +276,7 @@ class MetadataAPIOperations:
                              tracing.get("x-ms-client-request-id"), activity_id or "n/a",
                              server_timing_ms if server_timing_ms is not None else "n/a")
             if response.status == 200:
-                data = await response.json()
+                data = await response.json(loads=json_loads)
                 return data
             else:
                 raise MetadataError(
@@ -468,7 +472,7 @@ class MetadataAPIOperations:
                                  entity_name, tracing.get("x-ms-client-request-id"), activity_id or "n/a",
                                  server_timing_ms if server_timing_ms is not None else "n/a")
                 if response.status == 200:
-                    item = await response.json()
+                    item = await response.json(loads=json_loads)
 
                     # Convert entity category string to enum
                     entity_category_str = item.get("EntityCategory")
@@ -549,7 +553,7 @@ class MetadataAPIOperations:
                              tracing.get("x-ms-client-request-id"), activity_id or "n/a",
                              server_timing_ms if server_timing_ms is not None else "n/a")
             if response.status == 200:
-                return await response.json()
+                return await response.json(loads=json_loads)
             else:
                 raise MetadataError(
                     f"Failed to get public entities: {response.status} - {await response.text()}",
@@ -573,29 +577,68 @@ class MetadataAPIOperations:
         Returns:
             List of PublicEntityInfo objects with complete details
         """
-        # Get all public entities with full details
-        entities_data = await self.get_public_entities()
-        entities = []
+        return [
+            entity
+            async for entity in self.iter_public_entities_with_details(
+                resolve_labels, language
+            )
+        ]
 
-        for item in entities_data.get("value", []):
-            try:
-                # Parse entity using utility function
-                entity = self._parse_public_entity_from_json(item)
+    async def iter_public_entities_with_details(
+        self, resolve_labels: bool = False, language: str = "en-US"
+    ) -> AsyncIterator[PublicEntityInfo]:
+        """Stream all public entities with full details one at a time
 
-                # Resolve labels if requested
-                if resolve_labels and self.label_ops:
-                    await self._resolve_public_entity_labels(entity, language)
+        The PublicEntities response is parsed incrementally as it arrives, so
+        only the entity being processed is held in memory instead of the
+        whole (often tens of MB) payload.
 
-                entities.append(entity)
+        Args:
+            resolve_labels: Whether to resolve label IDs to text
+            language: Language for label resolution
 
-            except Exception as e:
-                # Log error but continue processing other entities
-                logger.warning(
-                    f"Failed to parse entity {item.get('Name', 'unknown')}: {e}"
+        Yields:
+            PublicEntityInfo objects with complete details
+        """
+        session = await self.session_manager.get_session()
+        tracing = self.session_manager.get_tracing_headers()
+        url = f"{self.metadata_url}/PublicEntities"
+
+        async with session.get(url, headers=tracing) as response:
+            activity_id = response.headers.get("ms-dyn-aid")
+            server_timing_ms = _parse_server_timing(response.headers.get("server-timing"))
+            if activity_id or server_timing_ms is not None:
+                logger.debug("GET PublicEntities (stream): x-ms-client-request-id=%s ms-dyn-aid=%s server-timing=%sms",
+                             tracing.get("x-ms-client-request-id"), activity_id or "n/a",
+                             server_timing_ms if server_timing_ms is not None else "n/a")
+            if response.status != 200:
+                raise MetadataError(
+                    f"Failed to get public entities: {response.status} - {await response.text()}",
+                    activity_id=activity_id,
+                    request_id=tracing.get("x-ms-client-request-id"),
+                    server_timing_ms=server_timing_ms,
                 )
-                continue
 
-        return entities
+            items = iter_json_array(
+                response.content.iter_chunked(PUBLIC_ENTITIES_CHUNK_SIZE)
+            )
+            async for item in items:
+                try:
+                    # Parse entity using utility function
+                    entity = self._parse_public_entity_from_json(item)
+
+                    # Resolve labels if requested
+                    if resolve_labels and self.label_ops:
+                        await self._resolve_public_entity_labels(entity, language)
+
+                except Exception as e:
+                    # Log error but continue processing other entities
+                    logger.warning(
+                        f"Failed to parse entity {item.get('Name', 'unknown')}: {e}"
+                    )
+                    continue
+
+                yield entity
 
     async def search_public_entities(
         self,
@@ -687,7 +730,7 @@ class MetadataAPIOperations:
                                  entity_name, tracing.get("x-ms-client-request-id"), activity_id or "n/a",
                                  server_timing_ms if server_timing_ms is not None else "n/a")
                 if response.status == 200:
-                    item = await response.json()
+                    item = await response.json(loads=json_loads)
 
                     # Use utility function to parse the entity
                     entity = self._parse_public_entity_from_json(item)
@@ -737,7 +780,7 @@ class MetadataAPIOperations:
                              tracing.get("x-ms-client-request-id"), activity_id or "n/a",
                              server_timing_ms if server_timing_ms is not None else "n/a")
             if response.status == 200:
-                return await response.json()
+                return await response.json(loads=json_loads)
             else:
                 raise MetadataError(
                     f"Failed to get public enumerations: {response.status} - {await response.text()}",
@@ -851,7 +894,7 @@ class MetadataAPIOperations:
                                  enumeration_name, tracing.get("x-ms-client-request-id"), activity_id or "n/a",
                                  server_timing_ms if server_timing_ms is not None else "n/a")
                 if response.status == 200:
-                    item = await response.json()
+                    item = await response.json(loads=json_loads)
 
                     # Use utility function to parse the enumeration
                     enum = self._parse_public_enumeration_from_json(item)
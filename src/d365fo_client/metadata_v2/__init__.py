@@ -24,6 +24,7 @@ Usage:
 """
 
 from .cache_v2 import MetadataCacheV2
+from .connection_manager import ConnectionManager, SQLiteTuning
 from .database_v2 import DatabaseSchemaV2, MetadataDatabaseV2
 from .global_version_manager import GlobalVersionManager
 
@@ -46,6 +47,8 @@ __all__ = [
     "MetadataDatabaseV2",
     "DatabaseSchemaV2",
     "VersionAwareSearchEngine",
+    "ConnectionManager",
+    "SQLiteTuning",
     # Future components
     # 'MetadataMigrationManager',
 ]
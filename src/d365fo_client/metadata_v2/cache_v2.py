@@ -1,9 +1,16 @@
 """Version-aware metadata cache implementation."""
 
+import asyncio
+import dataclasses
+import itertools
+import json
 import logging
+import re
+import time
+import zlib
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
 import aiosqlite
 
@@ -11,6 +18,7 @@ import aiosqlite
 if TYPE_CHECKING:
     from ..metadata_api import MetadataAPIOperations
 
+from ..json_backend import json_loads
 from ..models import (
     ActionInfo,
     ActionParameterInfo,
@@ -31,14 +39,280 @@ from ..models import (
     PublicEntityPropertyInfo,
     ReferentialConstraintInfo,
     RelatedFixedConstraintInfo,
+    SearchResults,
 )
+from .connection_manager import ConnectionManager, SQLiteTuning
 from .database_v2 import MetadataDatabaseV2
+from .fuzzy_index import FuzzyNameIndex
 from .global_version_manager import GlobalVersionManager
 from .label_utils import apply_label_fallback, process_label_fallback
+from .memory_cache import LRUCache
 from .version_detector import ModuleVersionDetector
 
 logger = logging.getLogger(__name__)
 
+# Bound on bind parameters per IN (...) clause
+_SQL_IN_CHUNK = 500
+
+# Bumped when the layout of schema_blob changes; other versions are ignored
+SCHEMA_BLOB_VERSION = 1
+
+
+def _copy_search_results(results: SearchResults) -> SearchResults:
+    """Copy search results so cached instances are never shared"""
+    return dataclasses.replace(
+        results, results=[dataclasses.replace(result) for result in results.results]
+    )
+
+
+def _trigram_match_query(like_pattern: str) -> Optional[str]:
+    """FTS5 trigram query matching a superset of rows matching ``like_pattern``
+
+    Every literal run of at least three characters between LIKE wildcards
+    must occur in the row, so the runs are AND-ed as quoted substrings.
+
+    Returns:
+        MATCH expression, or None if the pattern has no run long enough for
+        a trigram lookup
+    """
+    runs = [run for run in re.split(r"[%_]+", like_pattern) if len(run) >= 3]
+    if not runs:
+        return None
+    return " AND ".join('"' + run.replace('"', '""') + '"' for run in runs)
+
+
+def _schema_rows(entity_schema: PublicEntityInfo) -> Dict[str, Any]:
+    """Lay out a schema as the rows get_public_entity_schema reads back
+
+    Values and ordering match what is stored in (and selected from) the
+    normalized tables, so both read paths build identical schemas.
+    """
+    return {
+        "v": SCHEMA_BLOB_VERSION,
+        "entity": [
+            entity_schema.name,
+            entity_schema.entity_set_name,
+            entity_schema.label_id,
+            process_label_fallback(entity_schema.label_id, entity_schema.label_text),
+            entity_schema.is_read_only,
+            entity_schema.configuration_enabled,
+        ],
+        "properties": [
+            [
+                prop.name,
+                prop.type_name,
+                prop.data_type,
+                prop.data_type,
+                prop.label_id,
+                process_label_fallback(prop.label_id, prop.label_text),
+                prop.is_key,
+                prop.is_mandatory,
+                prop.configuration_enabled,
+                prop.allow_edit,
+                prop.allow_edit_on_create,
+                prop.is_dimension,
+                prop.dimension_relation,
+                prop.is_dynamic_dimension,
+                prop.dimension_legal_entity_property,
+                prop.dimension_type_property,
+                prop_order,
+            ]
+            for prop_order, prop in enumerate(entity_schema.properties, start=1)
+        ],
+        "navigation_properties": [
+            [
+                nav_prop.name,
+                nav_prop.related_entity,
+                nav_prop.related_relation_name,
+                nav_prop.cardinality,
+                sorted(
+                    (
+                        [
+                            constraint.constraint_type,
+                            getattr(constraint, "property", None),
+                            getattr(constraint, "referenced_property", None),
+                            getattr(constraint, "related_property", None),
+                            getattr(constraint, "value", None),
+                            getattr(constraint, "value_str", None),
+                        ]
+                        for constraint in nav_prop.constraints
+                    ),
+                    key=lambda row: row[0],
+                ),
+            ]
+            for nav_prop in sorted(
+                entity_schema.navigation_properties, key=lambda nav: nav.name
+            )
+        ],
+        "property_groups": [
+            [group.name, sorted(group.properties)]
+            for group in sorted(entity_schema.property_groups, key=lambda g: g.name)
+        ],
+        "actions": [
+            [
+                action.name,
+                action.binding_kind,
+                action.return_type.type_name if action.return_type else None,
+                action.return_type.is_collection if action.return_type else False,
+                action.return_type.odata_xpp_type if action.return_type else None,
+                action.field_lookup,
+                [
+                    [
+                        param.name,
+                        param.type.type_name,
+                        param.type.is_collection,
+                        param.type.type_name,
+                        param_order,
+                    ]
+                    for param_order, param in enumerate(action.parameters, start=1)
+                ],
+            ]
+            for action in sorted(entity_schema.actions, key=lambda a: a.name)
+        ],
+    }
+
+
+def _encode_schema_blob(entity_schema: PublicEntityInfo) -> bytes:
+    """Serialize a schema to zlib-compressed JSON for public_entities.schema_blob"""
+    document = json.dumps(_schema_rows(entity_schema), separators=(",", ":"))
+    return zlib.compress(document.encode("utf-8"))
+
+
+def _decode_schema_blob(blob: bytes) -> Optional[Dict[str, Any]]:
+    """Decode a schema blob, or return None if it is unreadable or outdated"""
+    try:
+        rows = json_loads(zlib.decompress(blob))
+    except (zlib.error, ValueError) as e:
+        logger.warning(f"Ignoring unreadable schema blob: {e}")
+        return None
+    if not isinstance(rows, dict) or rows.get("v") != SCHEMA_BLOB_VERSION:
+        return None
+    return rows
+
+
+def _build_public_entity_schema(rows: Dict[str, Any]) -> PublicEntityInfo:
+    """Create a PublicEntityInfo from rows laid out by ``_schema_rows``"""
+    properties = []
+    for prop_row in rows["properties"]:
+        properties.append(
+            PublicEntityPropertyInfo(
+                name=prop_row[0],
+                type_name=prop_row[1],
+                data_type=prop_row[2],
+                odata_xpp_type=prop_row[3],
+                label_id=prop_row[4],
+                # Apply label fallback for property labels
+                label_text=apply_label_fallback(prop_row[4], prop_row[5]),
+                is_key=prop_row[6],
+                is_mandatory=prop_row[7],
+                configuration_enabled=prop_row[8],
+                allow_edit=prop_row[9],
+                allow_edit_on_create=prop_row[10],
+                is_dimension=prop_row[11],
+                dimension_relation=prop_row[12],
+                is_dynamic_dimension=prop_row[13],
+                dimension_legal_entity_property=prop_row[14],
+                dimension_type_property=prop_row[15],
+                property_order=prop_row[16],
+            )
+        )
+
+    navigation_properties = []
+    for nav_row in rows["navigation_properties"]:
+        constraints = []
+        for constraint_row in nav_row[4]:
+            constraint_type = constraint_row[0]
+
+            if constraint_type == "Referential":
+                constraints.append(
+                    ReferentialConstraintInfo(
+                        property=constraint_row[1],
+                        referenced_property=constraint_row[2],
+                    )
+                )
+            elif constraint_type == "Fixed":
+                constraints.append(
+                    FixedConstraintInfo(
+                        property=constraint_row[1],
+                        value=constraint_row[4],
+                        value_str=constraint_row[5],
+                    )
+                )
+            elif constraint_type == "RelatedFixed":
+                constraints.append(
+                    RelatedFixedConstraintInfo(
+                        related_property=constraint_row[3],
+                        value=constraint_row[4],
+                        value_str=constraint_row[5],
+                    )
+                )
+
+        navigation_properties.append(
+            NavigationPropertyInfo(
+                name=nav_row[0],
+                related_entity=nav_row[1],
+                related_relation_name=nav_row[2],
+                cardinality=(
+                    Cardinality(nav_row[3]) if nav_row[3] else Cardinality.SINGLE
+                ),
+                constraints=constraints,
+            )
+        )
+
+    property_groups = [
+        PropertyGroupInfo(name=group_row[0], properties=group_row[1])
+        for group_row in rows["property_groups"]
+    ]
+
+    actions = []
+    for action_row in rows["actions"]:
+        parameters = [
+            ActionParameterInfo(
+                name=param_row[0],
+                type=ActionParameterTypeInfo(
+                    type_name=param_row[1],
+                    is_collection=param_row[2],
+                    odata_xpp_type=param_row[3],
+                ),
+                parameter_order=param_row[4],
+            )
+            for param_row in action_row[6]
+        ]
+
+        # Create return type if present
+        return_type = None
+        if action_row[2]:  # return_type_name
+            return_type = ActionReturnTypeInfo(
+                type_name=action_row[2],
+                is_collection=action_row[3],
+                odata_xpp_type=action_row[4],
+            )
+
+        actions.append(
+            PublicEntityActionInfo(
+                name=action_row[0],
+                binding_kind=ODataBindingKind(action_row[1]),
+                parameters=parameters,
+                return_type=return_type,
+                field_lookup=action_row[5],
+            )
+        )
+
+    entity_row = rows["entity"]
+    return PublicEntityInfo(
+        name=entity_row[0],
+        entity_set_name=entity_row[1],
+        label_id=entity_row[2],
+        # Apply label fallback for entity labels
+        label_text=apply_label_fallback(entity_row[2], entity_row[3]),
+        is_read_only=entity_row[4],
+        configuration_enabled=entity_row[5],
+        properties=properties,
+        navigation_properties=navigation_properties,
+        property_groups=property_groups,
+        actions=actions,
+    )
+
 
 class MetadataCacheV2:
     """Version-aware metadata cache with intelligent invalidation"""
@@ -48,6 +322,15 @@ class MetadataCacheV2:
         cache_dir: Path,
         base_url: str,
         metadata_api: Optional["MetadataAPIOperations"] = None,
+        tuning: Optional[SQLiteTuning] = None,
+        schema_cache_size: int = 1000,
+        schema_cache_ttl_seconds: Optional[float] = 300,
+        label_cache_size: int = 50000,
+        track_label_hits: bool = True,
+        label_hit_flush_interval_seconds: float = 30.0,
+        label_hit_flush_threshold: int = 1000,
+        search_cache_size: int = 100,
+        search_cache_ttl_seconds: Optional[float] = 300,
     ):
         """Initialize metadata cache v2
 
@@ -55,6 +338,15 @@ class MetadataCacheV2:
             cache_dir: Directory for cache storage
             base_url: D365 F&O environment base URL
             metadata_api: Optional MetadataAPIOperations instance for version detection
+            tuning: SQLite PRAGMA profile for the cache connections (defaults if None)
+            schema_cache_size: Maximum entity schemas kept in memory
+            schema_cache_ttl_seconds: Seconds a schema stays in memory, None for no expiry
+            label_cache_size: Maximum label texts kept in memory
+            track_label_hits: Record label hit_count/last_accessed statistics
+            label_hit_flush_interval_seconds: Seconds between label hit flushes
+            label_hit_flush_threshold: Pending labels that force an early flush
+            search_cache_size: Maximum search results kept in memory
+            search_cache_ttl_seconds: Seconds search results stay in memory, None for no expiry
         """
         self.cache_dir = cache_dir
         self.base_url = base_url
@@ -63,8 +355,9 @@ class MetadataCacheV2:
 
         # Database and managers
         self.db_path = cache_dir / "metadata_v2.db"
-        self.database = MetadataDatabaseV2(self.db_path)
-        self.version_manager = GlobalVersionManager(self.db_path)
+        self.connections = ConnectionManager(self.db_path, tuning=tuning)
+        self.database = MetadataDatabaseV2(self.db_path, self.connections)
+        self.version_manager = GlobalVersionManager(self.db_path, self.connections)
 
         # Version detector - initialized when metadata_api is available
         self.version_detector = None
@@ -75,8 +368,42 @@ class MetadataCacheV2:
         self._environment_id: Optional[int] = None
         self._current_version_info: Optional[EnvironmentVersionInfo] = None
         self._current_global_version_id: Optional[int] = None
+        # version_manager.mapping_generation the current version was resolved
+        # at (None when unresolved); a missing mapping is memoized as well
+        self._current_version_generation: Optional[int] = None
         self._initialized = False
 
+        # Hydrated entity schemas keyed by (global_version_id, entity_name)
+        self._schema_cache: LRUCache[PublicEntityInfo] = LRUCache(
+            schema_cache_size, schema_cache_ttl_seconds
+        )
+        self._schema_generation = 0
+
+        # Search results keyed by (global_version_id, query key)
+        self._search_cache: LRUCache[SearchResults] = LRUCache(
+            search_cache_size, search_cache_ttl_seconds
+        )
+        self._search_generation = 0
+
+        # Typo-tolerant name indexes keyed by global_version_id, built on first
+        # fuzzy search and dropped when the version's metadata is rewritten.
+        # Values are (entity_type, name, entity_set_name, description)
+        self._name_indexes: Dict[int, FuzzyNameIndex[Tuple[str, ...]]] = {}
+        self._name_index_generation = 0
+
+        # Label texts keyed by (global_version_id, language, label_id); labels
+        # never change within a version, so entries are kept until evicted
+        self._label_cache: LRUCache[str] = LRUCache(label_cache_size)
+
+        # Label hits are counted in memory and written behind in one batch:
+        # (global_version_id, label_id, language) -> [hits, last_accessed]
+        self.track_label_hits = track_label_hits
+        self.label_hit_flush_interval_seconds = label_hit_flush_interval_seconds
+        self.label_hit_flush_threshold = label_hit_flush_threshold
+        self._pending_label_hits: Dict[Tuple[int, str, str], List[Any]] = {}
+        self._last_label_hit_flush = time.monotonic()
+        self._label_hit_flush_task: Optional[asyncio.Task] = None
+
     async def initialize(self):
         """Initialize cache database and environment"""
         if self._initialized:
@@ -92,6 +419,15 @@ class MetadataCacheV2:
             f"MetadataCacheV2 initialized for environment {self._environment_id}"
         )
 
+    async def close(self):
+        """Flush pending label hits and close the shared database connections"""
+        task = self._label_hit_flush_task
+        if task is not None and not task.done():
+            await task
+        await self.flush_label_hits()
+        await self.connections.close()
+        self._initialized = False
+
     def set_metadata_api(self, metadata_api: "MetadataAPIOperations"):
         """Set metadata API operations instance and initialize version detector
 
@@ -153,6 +489,7 @@ class MetadataCacheV2:
             # Update current version info
             self._current_version_info = version_info
             self._current_global_version_id = global_version_id
+            self._current_version_generation = self.version_manager.mapping_generation
 
             if was_created:
                 logger.info(f"New version detected: {global_version_id}")
@@ -181,7 +518,7 @@ class MetadataCacheV2:
         Returns:
             True if metadata is complete
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.reader() as db:
             # Check metadata version record
             cursor = await db.execute(
                 """SELECT sync_completed_at, entity_count, action_count, enumeration_count
@@ -204,57 +541,69 @@ class MetadataCacheV2:
             return entity_count > 0  # Has some entities
 
     async def store_data_entities(
-        self, global_version_id: int, entities: List[DataEntityInfo]
+        self,
+        global_version_id: int,
+        entities: List[DataEntityInfo],
+        fresh_version: bool = False,
     ):
         """Store data entities for global version
 
         Args:
             global_version_id: Global version ID
             entities: List of data entity information
+            fresh_version: Skip clearing existing rows (version has no data entities yet)
         """
-        async with aiosqlite.connect(self.db_path) as db:
-
-            # Insert new entities with label processing
-            for entity in entities:
-                # Process label fallback for this entity
-                processed_label_text = process_label_fallback(
-                    entity.label_id, entity.label_text
-                )
+        async with self.connections.writer() as db:
+            await self._write_data_entities(
+                db, global_version_id, entities, fresh_version
+            )
+            logger.debug(
+                f"Stored {len(entities)} data entities for version {global_version_id}"
+            )
 
-                # Clear existing entity for this version
-                await db.execute(
-                    "DELETE FROM data_entities WHERE global_version_id = ? and name = ?",
-                    (
-                        global_version_id,
-                        entity.name,
-                    ),
-                )
+        self.invalidate_name_index(global_version_id)
+        self.invalidate_search_results(global_version_id)
 
-                await db.execute(
-                    """INSERT INTO data_entities
-                       (global_version_id, name, public_entity_name, public_collection_name,
-                        label_id, label_text, entity_category, data_service_enabled,
-                        data_management_enabled, is_read_only)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        global_version_id,
-                        entity.name,
-                        entity.public_entity_name,
-                        entity.public_collection_name,
-                        entity.label_id,
-                        processed_label_text,  # Use processed label text
-                        entity.entity_category if entity.entity_category else None,
-                        entity.data_service_enabled,
-                        entity.data_management_enabled,
-                        entity.is_read_only,
-                    ),
-                )
+    async def _write_data_entities(
+        self,
+        db: aiosqlite.Connection,
+        global_version_id: int,
+        entities: List[DataEntityInfo],
+        fresh_version: bool,
+    ):
+        """Replace data entities by name within the caller's transaction"""
+        # Last occurrence wins, as with one delete + insert per entity
+        entities = list({entity.name: entity for entity in entities}.values())
 
-            await db.commit()
-            logger.debug(
-                f"Stored {len(entities)} data entities for version {global_version_id}"
+        if not fresh_version:
+            await db.executemany(
+                "DELETE FROM data_entities WHERE global_version_id = ? and name = ?",
+                [(global_version_id, entity.name) for entity in entities],
             )
 
+        await db.executemany(
+            """INSERT INTO data_entities
+               (global_version_id, name, public_entity_name, public_collection_name,
+                label_id, label_text, entity_category, data_service_enabled,
+                data_management_enabled, is_read_only)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            [
+                (
+                    global_version_id,
+                    entity.name,
+                    entity.public_entity_name,
+                    entity.public_collection_name,
+                    entity.label_id,
+                    process_label_fallback(entity.label_id, entity.label_text),
+                    entity.entity_category if entity.entity_category else None,
+                    entity.data_service_enabled,
+                    entity.data_management_enabled,
+                    entity.is_read_only,
+                )
+                for entity in entities
+            ],
+        )
+
     async def get_data_entities(
         self,
         global_version_id: Optional[int] = None,
@@ -279,9 +628,24 @@ class MetadataCacheV2:
             if global_version_id is None:
                 return []
 
+        # Patterns with a literal run of 3+ characters are answered from the
+        # trigram index; the LIKE conditions below keep the exact semantics
+        trigram_query = (
+            _trigram_match_query(name_pattern) if name_pattern is not None else None
+        )
+
         # Build query conditions
-        conditions = ["global_version_id = ?"]
-        params = [global_version_id]
+        if trigram_query is not None:
+            # Unary + makes the planner probe the matched rowids instead of
+            # walking every row of the version through the version index
+            conditions = [
+                "+global_version_id = ?",
+                "id IN (SELECT rowid FROM data_entity_names_v2 WHERE data_entity_names_v2 MATCH ? AND global_version_id = ?)",
+            ]
+            params = [global_version_id, trigram_query, global_version_id]
+        else:
+            conditions = ["global_version_id = ?"]
+            params = [global_version_id]
 
         if data_service_enabled is not None:
             conditions.append("data_service_enabled = ?")
@@ -301,7 +665,7 @@ class MetadataCacheV2:
 
         where_clause = " AND ".join(conditions)
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.reader() as db:
             cursor = await db.execute(
                 f"""SELECT name, public_entity_name, public_collection_name,
                            label_id, label_text, entity_category, data_service_enabled,
@@ -342,120 +706,153 @@ class MetadataCacheV2:
             global_version_id: Global version ID
             entity_schema: Public entity schema information
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            # First, get existing entity ID if it exists for this name and version
-            cursor = await db.execute(
-                """SELECT id FROM public_entities 
-                   WHERE name = ? AND global_version_id = ?""",
-                (entity_schema.name, global_version_id),
-            )
+        await self.store_public_entity_schemas(global_version_id, [entity_schema])
 
-            existing_entity = await cursor.fetchone()
-            existing_entity_id = existing_entity[0] if existing_entity else None
+    async def store_public_entity_schemas(
+        self,
+        global_version_id: int,
+        entity_schemas: List[PublicEntityInfo],
+        fresh_version: bool = False,
+    ):
+        """Store several public entity schemas in one transaction
 
-            # Clear existing related data for this entity and version
-            if existing_entity_id:
-                logger.debug(
-                    f"Clearing existing data for entity {entity_schema.name} (ID: {existing_entity_id})"
-                )
+        Args:
+            global_version_id: Global version ID
+            entity_schemas: Public entity schemas to store
+            fresh_version: Skip clearing existing rows (version has no schemas yet)
+        """
+        async with self.connections.writer() as db:
+            await self._write_public_entity_schemas(
+                db, global_version_id, entity_schemas, fresh_version
+            )
+            logger.debug(
+                f"Stored {len(entity_schemas)} entity schemas for version {global_version_id}"
+            )
 
-                # Delete related data in correct order (respecting foreign key constraints)
-                # 1. Delete relation constraints first
-                await db.execute(
-                    """DELETE FROM relation_constraints 
-                       WHERE navigation_property_id IN (
-                           SELECT id FROM navigation_properties 
-                           WHERE entity_id = ? AND global_version_id = ?
-                       )""",
-                    (existing_entity_id, global_version_id),
-                )
+        # Only once committed, so a reader can't cache the old rows again
+        self.invalidate_schema_cache(
+            global_version_id, [schema.name for schema in entity_schemas]
+        )
+        self.invalidate_name_index(global_version_id)
+        self.invalidate_search_results(global_version_id)
 
-                # 2. Delete action parameters
-                await db.execute(
-                    """DELETE FROM action_parameters 
-                       WHERE action_id IN (
-                           SELECT id FROM entity_actions 
-                           WHERE entity_id = ? AND global_version_id = ?
-                       )""",
-                    (existing_entity_id, global_version_id),
-                )
+    async def _clear_public_entities(
+        self, db: aiosqlite.Connection, global_version_id: int, names: List[str]
+    ):
+        """Delete existing public entities and their related rows by name"""
+        existing_ids = []
+        for start in range(0, len(names), _SQL_IN_CHUNK):
+            chunk = names[start : start + _SQL_IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = await db.execute(
+                f"""SELECT id FROM public_entities
+                   WHERE global_version_id = ? AND name IN ({placeholders})""",
+                (global_version_id, *chunk),
+            )
+            existing_ids.extend(row[0] for row in await cursor.fetchall())
 
-                # 3. Delete property group members
-                await db.execute(
-                    """DELETE FROM property_group_members 
-                       WHERE property_group_id IN (
-                           SELECT id FROM property_groups 
-                           WHERE entity_id = ? AND global_version_id = ?
-                       )""",
-                    (existing_entity_id, global_version_id),
-                )
+        if not existing_ids:
+            return
 
-                # 4. Delete direct child records
-                await db.execute(
-                    "DELETE FROM entity_properties WHERE entity_id = ? AND global_version_id = ?",
-                    (existing_entity_id, global_version_id),
-                )
-                await db.execute(
-                    "DELETE FROM navigation_properties WHERE entity_id = ? AND global_version_id = ?",
-                    (existing_entity_id, global_version_id),
-                )
-                await db.execute(
-                    "DELETE FROM property_groups WHERE entity_id = ? AND global_version_id = ?",
-                    (existing_entity_id, global_version_id),
-                )
-                await db.execute(
-                    "DELETE FROM entity_actions WHERE entity_id = ? AND global_version_id = ?",
-                    (existing_entity_id, global_version_id),
-                )
+        logger.debug(f"Clearing existing data for {len(existing_ids)} entities")
+        params = [(entity_id, global_version_id) for entity_id in existing_ids]
+
+        # Delete related data in correct order (respecting foreign key constraints)
+        for statement in (
+            """DELETE FROM relation_constraints
+               WHERE navigation_property_id IN (
+                   SELECT id FROM navigation_properties
+                   WHERE entity_id = ? AND global_version_id = ?
+               )""",
+            """DELETE FROM action_parameters
+               WHERE action_id IN (
+                   SELECT id FROM entity_actions
+                   WHERE entity_id = ? AND global_version_id = ?
+               )""",
+            """DELETE FROM property_group_members
+               WHERE property_group_id IN (
+                   SELECT id FROM property_groups
+                   WHERE entity_id = ? AND global_version_id = ?
+               )""",
+            "DELETE FROM entity_properties WHERE entity_id = ? AND global_version_id = ?",
+            "DELETE FROM navigation_properties WHERE entity_id = ? AND global_version_id = ?",
+            "DELETE FROM property_groups WHERE entity_id = ? AND global_version_id = ?",
+            "DELETE FROM entity_actions WHERE entity_id = ? AND global_version_id = ?",
+            "DELETE FROM public_entities WHERE id = ? AND global_version_id = ?",
+        ):
+            await db.executemany(statement, params)
+
+    async def _write_public_entity_schemas(
+        self,
+        db: aiosqlite.Connection,
+        global_version_id: int,
+        entity_schemas: List[PublicEntityInfo],
+        fresh_version: bool,
+    ):
+        """Replace public entity schemas within the caller's transaction
 
-                # 5. Finally delete the entity itself
-                await db.execute(
-                    "DELETE FROM public_entities WHERE id = ? AND global_version_id = ?",
-                    (existing_entity_id, global_version_id),
-                )
+        Row ids are assigned here rather than read back from ``lastrowid`` so
+        that parent and child rows can all be inserted with ``executemany``.
+        ``_next_row_ids`` holds the write lock until commit, so no other
+        insert can take the same ids.
+        """
+        entity_schemas = list(
+            {schema.name: schema for schema in entity_schemas}.values()
+        )
+        if not entity_schemas:
+            return
 
-            # Insert new entity with label processing
-            processed_entity_label_text = process_label_fallback(
-                entity_schema.label_id, entity_schema.label_text
+        if not fresh_version:
+            await self._clear_public_entities(
+                db, global_version_id, [schema.name for schema in entity_schemas]
             )
 
-            cursor = await db.execute(
-                """INSERT INTO public_entities
-                   (global_version_id, name, entity_set_name, label_id, label_text,
-                    is_read_only, configuration_enabled)
-                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+        next_id = await self._next_row_ids(
+            db,
+            [
+                "public_entities",
+                "entity_properties",
+                "navigation_properties",
+                "relation_constraints",
+                "entity_actions",
+                "action_parameters",
+                "property_groups",
+                "property_group_members",
+            ],
+        )
+
+        entity_rows = []
+        property_rows = []
+        nav_rows = []
+        constraint_rows = []
+        action_rows = []
+        parameter_rows = []
+        group_rows = []
+        member_rows = []
+
+        for entity_schema in entity_schemas:
+            entity_id = next(next_id["public_entities"])
+            entity_rows.append(
                 (
+                    entity_id,
                     global_version_id,
                     entity_schema.name,
                     entity_schema.entity_set_name,
                     entity_schema.label_id,
-                    processed_entity_label_text,  # Use processed label text
+                    process_label_fallback(
+                        entity_schema.label_id, entity_schema.label_text
+                    ),
                     entity_schema.is_read_only,
                     entity_schema.configuration_enabled,
-                ),
-            )
-
-            entity_id = cursor.lastrowid
-
-            # Store properties with label processing
-            prop_order = 0
-            for prop in entity_schema.properties:
-                prop_order += 1
-                # Process label fallback for this property
-                processed_prop_label_text = process_label_fallback(
-                    prop.label_id, prop.label_text
+                    # Denormalized copy for single-read hydration
+                    _encode_schema_blob(entity_schema),
                 )
+            )
 
-                await db.execute(
-                    """INSERT INTO entity_properties
-                       (entity_id, global_version_id, name, type_name, data_type,
-                        odata_xpp_type, label_id, label_text, is_key, is_mandatory,
-                        configuration_enabled, allow_edit, allow_edit_on_create,
-                        is_dimension, dimension_relation, is_dynamic_dimension,
-                        dimension_legal_entity_property, dimension_type_property,
-                        property_order)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            for prop_order, prop in enumerate(entity_schema.properties, start=1):
+                property_rows.append(
                     (
+                        next(next_id["entity_properties"]),
                         entity_id,
                         global_version_id,
                         prop.name,
@@ -463,7 +860,7 @@ class MetadataCacheV2:
                         prop.data_type,
                         prop.data_type,
                         prop.label_id,
-                        processed_prop_label_text,  # Use processed label text
+                        process_label_fallback(prop.label_id, prop.label_text),
                         prop.is_key,
                         prop.is_mandatory,
                         prop.configuration_enabled,
@@ -475,37 +872,26 @@ class MetadataCacheV2:
                         prop.dimension_legal_entity_property,
                         prop.dimension_type_property,
                         prop_order,
-                    ),
+                    )
                 )
 
-            # Store navigation properties
             for nav_prop in entity_schema.navigation_properties:
-                nav_cursor = await db.execute(
-                    """INSERT INTO navigation_properties
-                       (entity_id, global_version_id, name, related_entity,
-                        related_relation_name, cardinality)
-                       VALUES (?, ?, ?, ?, ?, ?)""",
+                nav_prop_id = next(next_id["navigation_properties"])
+                nav_rows.append(
                     (
+                        nav_prop_id,
                         entity_id,
                         global_version_id,
                         nav_prop.name,
                         nav_prop.related_entity,
                         nav_prop.related_relation_name,
                         nav_prop.cardinality,  # StrEnum automatically converts to string
-                    ),
+                    )
                 )
-
-                nav_prop_id = nav_cursor.lastrowid
-
-                # Store relation constraints
                 for constraint in nav_prop.constraints:
-                    await db.execute(
-                        """INSERT INTO relation_constraints
-                           (navigation_property_id, global_version_id, constraint_type,
-                            property_name, referenced_property, related_property,
-                            fixed_value, fixed_value_str)
-                           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                    constraint_rows.append(
                         (
+                            next(next_id["relation_constraints"]),
                             nav_prop_id,
                             global_version_id,
                             constraint.constraint_type,
@@ -514,18 +900,14 @@ class MetadataCacheV2:
                             getattr(constraint, "related_property", None),
                             getattr(constraint, "value", None),
                             getattr(constraint, "value_str", None),
-                        ),
+                        )
                     )
 
-            # Store actions
             for action in entity_schema.actions:
-                action_cursor = await db.execute(
-                    """INSERT INTO entity_actions
-                       (entity_id, global_version_id, name, binding_kind, entity_name,
-                        entity_set_name, return_type_name, return_is_collection,
-                        return_odata_xpp_type, field_lookup)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                action_id = next(next_id["entity_actions"])
+                action_rows.append(
                     (
+                        action_id,
                         entity_id,
                         global_version_id,
                         action.name,
@@ -544,21 +926,12 @@ class MetadataCacheV2:
                             else None
                         ),
                         action.field_lookup,
-                    ),
+                    )
                 )
-
-                action_id = action_cursor.lastrowid
-
-                # Store action parameters
-                param_order = 0
-                for param in action.parameters:
-                    param_order += 1
-                    await db.execute(
-                        """INSERT INTO action_parameters
-                           (action_id, global_version_id, name, type_name,
-                            is_collection, odata_xpp_type, parameter_order)
-                           VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                for param_order, param in enumerate(action.parameters, start=1):
+                    parameter_rows.append(
                         (
+                            next(next_id["action_parameters"]),
                             action_id,
                             global_version_id,
                             param.name,
@@ -566,37 +939,111 @@ class MetadataCacheV2:
                             param.type.is_collection,
                             param.type.type_name,
                             param_order,
-                        ),
+                        )
                     )
 
-            # Store property groups
             for group in entity_schema.property_groups:
-                group_cursor = await db.execute(
-                    """INSERT INTO property_groups
-                       (entity_id, global_version_id, name)
-                       VALUES (?, ?, ?)""",
-                    (entity_id, global_version_id, group.name),
-                )
-
-                group_id = group_cursor.lastrowid
-
-                # Store property group members
+                group_id = next(next_id["property_groups"])
+                group_rows.append((group_id, entity_id, global_version_id, group.name))
                 for property_name in group.properties:
-                    await db.execute(
-                        """INSERT INTO property_group_members
-                           (property_group_id, global_version_id, property_name)
-                           VALUES (?, ?, ?)""",
-                        (group_id, global_version_id, property_name),
+                    member_rows.append(
+                        (
+                            next(next_id["property_group_members"]),
+                            group_id,
+                            global_version_id,
+                            property_name,
+                        )
                     )
 
-            await db.commit()
-            logger.debug(f"Stored entity schema for {entity_schema.name}")
+        # Parents before children so foreign keys always resolve
+        await db.executemany(
+            """INSERT INTO public_entities
+               (id, global_version_id, name, entity_set_name, label_id, label_text,
+                is_read_only, configuration_enabled, schema_blob)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            entity_rows,
+        )
+        await db.executemany(
+            """INSERT INTO entity_properties
+               (id, entity_id, global_version_id, name, type_name, data_type,
+                odata_xpp_type, label_id, label_text, is_key, is_mandatory,
+                configuration_enabled, allow_edit, allow_edit_on_create,
+                is_dimension, dimension_relation, is_dynamic_dimension,
+                dimension_legal_entity_property, dimension_type_property,
+                property_order)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            property_rows,
+        )
+        await db.executemany(
+            """INSERT INTO navigation_properties
+               (id, entity_id, global_version_id, name, related_entity,
+                related_relation_name, cardinality)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            nav_rows,
+        )
+        await db.executemany(
+            """INSERT INTO relation_constraints
+               (id, navigation_property_id, global_version_id, constraint_type,
+                property_name, referenced_property, related_property,
+                fixed_value, fixed_value_str)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            constraint_rows,
+        )
+        await db.executemany(
+            """INSERT INTO entity_actions
+               (id, entity_id, global_version_id, name, binding_kind, entity_name,
+                entity_set_name, return_type_name, return_is_collection,
+                return_odata_xpp_type, field_lookup)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            action_rows,
+        )
+        await db.executemany(
+            """INSERT INTO action_parameters
+               (id, action_id, global_version_id, name, type_name,
+                is_collection, odata_xpp_type, parameter_order)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            parameter_rows,
+        )
+        await db.executemany(
+            """INSERT INTO property_groups
+               (id, entity_id, global_version_id, name)
+               VALUES (?, ?, ?, ?)""",
+            group_rows,
+        )
+        await db.executemany(
+            """INSERT INTO property_group_members
+               (id, property_group_id, global_version_id, property_name)
+               VALUES (?, ?, ?, ?)""",
+            member_rows,
+        )
+
+    @staticmethod
+    async def _next_row_ids(
+        db: aiosqlite.Connection, tables: List[str]
+    ) -> Dict[str, Iterator[int]]:
+        """Return an id counter per table starting after its current maximum
+
+        Takes the database write lock first unless the transaction already
+        holds it, so no other connection or process can insert rows between
+        reading the maxima and committing.
+        """
+        if not db.in_transaction:
+            await db.execute("BEGIN IMMEDIATE")
+        counters = {}
+        for table in tables:
+            cursor = await db.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+            counters[table] = itertools.count((await cursor.fetchone())[0] + 1)
+        return counters
 
     async def get_public_entity_schema(
         self, entity_name: str, global_version_id: Optional[int] = None
     ) -> Optional[PublicEntityInfo]:
         """Get public entity schema
 
+        Schemas are served from an in-memory LRU cache after the first load.
+        The returned schema is shared with the cache and must not be
+        modified; use ``copy.deepcopy()`` on it first to make changes.
+
         Args:
             entity_name: Entity name to retrieve
             global_version_id: Global version ID (uses current if None)
@@ -609,11 +1056,35 @@ class MetadataCacheV2:
             if global_version_id is None:
                 return None
 
-        async with aiosqlite.connect(self.db_path) as db:
+        key = (global_version_id, entity_name)
+        schema = self._schema_cache.get(key)
+        if schema is None:
+            generation = self._schema_generation
+            schema = await self._load_public_entity_schema(
+                entity_name, global_version_id
+            )
+            if schema is None:
+                return None
+            # Schemas written while loading may make this one stale
+            if generation == self._schema_generation:
+                self._schema_cache.set(key, schema)
+
+        return schema
+
+    async def _load_public_entity_schema(
+        self, entity_name: str, global_version_id: int
+    ) -> Optional[PublicEntityInfo]:
+        """Load and hydrate a public entity schema from the database
+
+        Reads the ``schema_blob`` written at sync time when present, so the
+        common case is one indexed row read and one decode. Rows stored
+        before the blob existed are read from the normalized tables.
+        """
+        async with self.connections.reader() as db:
             # Get entity
             cursor = await db.execute(
                 """SELECT id, name, entity_set_name, label_id, label_text,
-                          is_read_only, configuration_enabled
+                          is_read_only, configuration_enabled, schema_blob
                    FROM public_entities
                    WHERE name = ? AND global_version_id = ?""",
                 (entity_name, global_version_id),
@@ -623,6 +1094,11 @@ class MetadataCacheV2:
             if not entity_row:
                 return None
 
+            if entity_row[7] is not None:
+                rows = _decode_schema_blob(entity_row[7])
+                if rows is not None:
+                    return _build_public_entity_schema(rows)
+
             entity_id = entity_row[0]
 
             # Get properties
@@ -638,35 +1114,7 @@ class MetadataCacheV2:
                    ORDER BY property_order""",
                 (entity_id,),
             )
-
-            properties = []
-            for prop_row in await cursor.fetchall():
-                # Apply label fallback for property labels
-                processed_prop_label_text = apply_label_fallback(
-                    prop_row[4], prop_row[5]
-                )
-
-                properties.append(
-                    PublicEntityPropertyInfo(
-                        name=prop_row[0],
-                        type_name=prop_row[1],
-                        data_type=prop_row[2],
-                        odata_xpp_type=prop_row[3],
-                        label_id=prop_row[4],
-                        label_text=processed_prop_label_text,
-                        is_key=prop_row[6],
-                        is_mandatory=prop_row[7],
-                        configuration_enabled=prop_row[8],
-                        allow_edit=prop_row[9],
-                        allow_edit_on_create=prop_row[10],
-                        is_dimension=prop_row[11],
-                        dimension_relation=prop_row[12],
-                        is_dynamic_dimension=prop_row[13],
-                        dimension_legal_entity_property=prop_row[14],
-                        dimension_type_property=prop_row[15],
-                        property_order=prop_row[16],
-                    )
-                )
+            property_rows = [list(row) for row in await cursor.fetchall()]
 
             # Get navigation properties
             cursor = await db.execute(
@@ -677,10 +1125,8 @@ class MetadataCacheV2:
                 (entity_id,),
             )
 
-            navigation_properties = []
+            navigation_rows = []
             for nav_row in await cursor.fetchall():
-                nav_prop_id = nav_row[0]
-
                 # Get constraints for this navigation property
                 constraint_cursor = await db.execute(
                     """SELECT constraint_type, property_name, referenced_property,
@@ -688,50 +1134,12 @@ class MetadataCacheV2:
                        FROM relation_constraints
                        WHERE navigation_property_id = ?
                        ORDER BY constraint_type""",
-                    (nav_prop_id,),
-                )
-
-                constraints = []
-                for constraint_row in await constraint_cursor.fetchall():
-                    constraint_type = constraint_row[0]
-
-                    if constraint_type == "Referential":
-                        constraints.append(
-                            ReferentialConstraintInfo(
-                                property=constraint_row[1],
-                                referenced_property=constraint_row[2],
-                            )
-                        )
-                    elif constraint_type == "Fixed":
-                        constraints.append(
-                            FixedConstraintInfo(
-                                property=constraint_row[1],
-                                value=constraint_row[4],
-                                value_str=constraint_row[5],
-                            )
-                        )
-                    elif constraint_type == "RelatedFixed":
-                        constraints.append(
-                            RelatedFixedConstraintInfo(
-                                related_property=constraint_row[3],
-                                value=constraint_row[4],
-                                value_str=constraint_row[5],
-                            )
-                        )
-
-                navigation_properties.append(
-                    NavigationPropertyInfo(
-                        name=nav_row[1],
-                        related_entity=nav_row[2],
-                        related_relation_name=nav_row[3],
-                        cardinality=(
-                            Cardinality(nav_row[4])
-                            if nav_row[4]
-                            else Cardinality.SINGLE
-                        ),
-                        constraints=constraints,
-                    )
+                    (nav_row[0],),
                 )
+                constraint_rows = [
+                    list(row) for row in await constraint_cursor.fetchall()
+                ]
+                navigation_rows.append([*nav_row[1:], constraint_rows])
 
             # Get property groups
             cursor = await db.execute(
@@ -742,27 +1150,18 @@ class MetadataCacheV2:
                 (entity_id,),
             )
 
-            property_groups = []
+            group_rows = []
             for group_row in await cursor.fetchall():
-                group_id = group_row[0]
-
                 # Get property group members
                 member_cursor = await db.execute(
                     """SELECT property_name
                        FROM property_group_members
                        WHERE property_group_id = ?
                        ORDER BY property_name""",
-                    (group_id,),
+                    (group_row[0],),
                 )
-
                 property_names = [row[0] for row in await member_cursor.fetchall()]
-
-                property_groups.append(
-                    PropertyGroupInfo(
-                        name=group_row[1],
-                        properties=property_names,
-                    )
-                )
+                group_rows.append([group_row[1], property_names])
 
             # Get actions
             cursor = await db.execute(
@@ -774,137 +1173,187 @@ class MetadataCacheV2:
                 (entity_id,),
             )
 
-            actions = []
+            action_rows = []
             for action_row in await cursor.fetchall():
-                action_id = action_row[0]
-
                 # Get action parameters
                 param_cursor = await db.execute(
                     """SELECT name, type_name, is_collection, odata_xpp_type, parameter_order
                        FROM action_parameters
                        WHERE action_id = ?
                        ORDER BY parameter_order""",
-                    (action_id,),
+                    (action_row[0],),
                 )
-
-                parameters = []
-                for param_row in await param_cursor.fetchall():
-                    parameters.append(
-                        ActionParameterInfo(
-                            name=param_row[0],
-                            type=ActionParameterTypeInfo(
-                                type_name=param_row[1],
-                                is_collection=param_row[2],
-                                odata_xpp_type=param_row[3],
-                            ),
-                            parameter_order=param_row[4],
-                        )
-                    )
-
-                # Create return type if present
-                return_type = None
-                if action_row[3]:  # return_type_name
-                    return_type = ActionReturnTypeInfo(
-                        type_name=action_row[3],
-                        is_collection=action_row[4],
-                        odata_xpp_type=action_row[5],
-                    )
-
-                actions.append(
-                    PublicEntityActionInfo(
-                        name=action_row[1],
-                        binding_kind=ODataBindingKind(action_row[2]),
-                        parameters=parameters,
-                        return_type=return_type,
-                        field_lookup=action_row[6],
-                    )
-                )
-
-            # Apply label fallback for entity labels
-            processed_entity_label_text = apply_label_fallback(
-                entity_row[3], entity_row[4]
-            )
-
-            return PublicEntityInfo(
-                name=entity_row[1],
-                entity_set_name=entity_row[2],
-                label_id=entity_row[3],
-                label_text=processed_entity_label_text,
-                is_read_only=entity_row[5],
-                configuration_enabled=entity_row[6],
-                properties=properties,
-                navigation_properties=navigation_properties,
-                property_groups=property_groups,
-                actions=actions,
-            )
+                parameter_rows = [list(row) for row in await param_cursor.fetchall()]
+                action_rows.append([*action_row[1:], parameter_rows])
+
+        return _build_public_entity_schema(
+            {
+                "entity": list(entity_row[1:7]),
+                "properties": property_rows,
+                "navigation_properties": navigation_rows,
+                "property_groups": group_rows,
+                "actions": action_rows,
+            }
+        )
 
     async def store_enumerations(
         self, global_version_id: int, enumerations: List[EnumerationInfo]
     ):
         """Store enumerations
 
+        Replaces all enumerations of the version.
+
         Args:
             global_version_id: Global version ID
             enumerations: List of enumeration information
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            # Clear existing enumerations for this version
+        async with self.connections.writer() as db:
+            await self._write_enumerations(
+                db, global_version_id, enumerations, fresh_version=False
+            )
+            logger.info(
+                f"Stored {len(enumerations)} enumerations for version {global_version_id}"
+            )
+
+        self.invalidate_name_index(global_version_id)
+        self.invalidate_search_results(global_version_id)
+
+    async def _write_enumerations(
+        self,
+        db: aiosqlite.Connection,
+        global_version_id: int,
+        enumerations: List[EnumerationInfo],
+        fresh_version: bool,
+    ):
+        """Replace all enumerations of a version within the caller's transaction"""
+        if not fresh_version:
+            # Clear existing enumerations for this version, members first
+            await db.execute(
+                "DELETE FROM enumeration_members WHERE global_version_id = ?",
+                (global_version_id,),
+            )
             await db.execute(
                 "DELETE FROM enumerations WHERE global_version_id = ?",
                 (global_version_id,),
             )
 
-            for enum_info in enumerations:
-                # Process label fallback for this enumeration
-                processed_enum_label_text = process_label_fallback(
-                    enum_info.label_id, enum_info.label_text
-                )
+        next_id = await self._next_row_ids(db, ["enumerations", "enumeration_members"])
+        enum_rows = []
+        member_rows = []
 
-                # Insert enumeration
-                cursor = await db.execute(
-                    """INSERT INTO enumerations
-                       (global_version_id, name, label_id, label_text)
-                       VALUES (?, ?, ?, ?)""",
+        for enum_info in enumerations:
+            enum_id = next(next_id["enumerations"])
+            enum_rows.append(
+                (
+                    enum_id,
+                    global_version_id,
+                    enum_info.name,
+                    enum_info.label_id,
+                    process_label_fallback(enum_info.label_id, enum_info.label_text),
+                )
+            )
+            for member_order, member in enumerate(enum_info.members, start=1):
+                member_rows.append(
                     (
+                        next(next_id["enumeration_members"]),
+                        enum_id,
                         global_version_id,
-                        enum_info.name,
-                        enum_info.label_id,
-                        processed_enum_label_text,  # Use processed label text
-                    ),
+                        member.name,
+                        member.value,
+                        member.label_id,
+                        process_label_fallback(member.label_id, member.label_text),
+                        member.configuration_enabled,
+                        member_order,
+                    )
                 )
 
-                enum_id = cursor.lastrowid
+        await db.executemany(
+            """INSERT INTO enumerations
+               (id, global_version_id, name, label_id, label_text)
+               VALUES (?, ?, ?, ?, ?)""",
+            enum_rows,
+        )
+        await db.executemany(
+            """INSERT INTO enumeration_members
+               (id, enumeration_id, global_version_id, name, value,
+                label_id, label_text, configuration_enabled, member_order)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            member_rows,
+        )
 
-                # Insert members with label processing
-                member_order = 0
-                for member in enum_info.members:
-                    member_order += 1
-                    # Process label fallback for this member
-                    processed_member_label_text = process_label_fallback(
-                        member.label_id, member.label_text
-                    )
+    async def store_metadata_bulk(
+        self,
+        global_version_id: int,
+        data_entities: Optional[List[DataEntityInfo]] = None,
+        public_entities: Optional[List[PublicEntityInfo]] = None,
+        enumerations: Optional[List[EnumerationInfo]] = None,
+        fresh_version: bool = False,
+    ) -> Dict[str, int]:
+        """Store entities, schemas and enumerations of a version in one transaction
 
-                    await db.execute(
-                        """INSERT INTO enumeration_members
-                           (enumeration_id, global_version_id, name, value,
-                            label_id, label_text, configuration_enabled, member_order)
-                           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                        (
-                            enum_id,
-                            global_version_id,
-                            member.name,
-                            member.value,
-                            member.label_id,
-                            processed_member_label_text,  # Use processed label text
-                            member.configuration_enabled,
-                            member_order,
-                        ),
-                    )
+        Rows are inserted with ``executemany`` and committed once, instead of
+        one statement per row and one commit per entity.
 
-            await db.commit()
-            logger.info(
-                f"Stored {len(enumerations)} enumerations for version {global_version_id}"
+        Args:
+            global_version_id: Global version ID
+            data_entities: Data entities to store (replaced by name)
+            public_entities: Public entity schemas to store (replaced by name)
+            enumerations: Enumerations to store (replace all of the version's)
+            fresh_version: The version has no metadata yet, so skip the deletes
+                of existing rows. Use ``has_version_metadata()`` to check.
+
+        Returns:
+            Number of items stored per metadata type
+        """
+        data_entities = data_entities or []
+        public_entities = public_entities or []
+
+        async with self.connections.writer() as db:
+            if data_entities:
+                await self._write_data_entities(
+                    db, global_version_id, data_entities, fresh_version
+                )
+            if public_entities:
+                await self._write_public_entity_schemas(
+                    db, global_version_id, public_entities, fresh_version
+                )
+            if enumerations is not None:
+                await self._write_enumerations(
+                    db, global_version_id, enumerations, fresh_version
+                )
+
+        if public_entities:
+            self.invalidate_schema_cache(
+                global_version_id, [schema.name for schema in public_entities]
             )
+        self.invalidate_name_index(global_version_id)
+        self.invalidate_search_results(global_version_id)
+
+        counts = {
+            "data_entities": len(data_entities),
+            "public_entities": len(public_entities),
+            "enumerations": len(enumerations or []),
+        }
+        logger.info(f"Bulk stored metadata for version {global_version_id}: {counts}")
+        return counts
+
+    async def has_version_metadata(self, global_version_id: int) -> bool:
+        """Check whether any entities, schemas or enumerations exist for a version
+
+        Args:
+            global_version_id: Global version ID
+
+        Returns:
+            True if the version already has stored metadata
+        """
+        async with self.connections.reader() as db:
+            cursor = await db.execute(
+                """SELECT EXISTS(SELECT 1 FROM data_entities WHERE global_version_id = ?)
+                       OR EXISTS(SELECT 1 FROM public_entities WHERE global_version_id = ?)
+                       OR EXISTS(SELECT 1 FROM enumerations WHERE global_version_id = ?)""",
+                (global_version_id, global_version_id, global_version_id),
+            )
+            return bool((await cursor.fetchone())[0])
 
     async def get_enumeration_info(
         self, enum_name: str, global_version_id: Optional[int] = None
@@ -923,7 +1372,7 @@ class MetadataCacheV2:
             if global_version_id is None:
                 return None
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.reader() as db:
             # Get enumeration
             cursor = await db.execute(
                 """SELECT id, name, label_id, label_text
@@ -992,7 +1441,7 @@ class MetadataCacheV2:
             enumeration_count: Number of enumerations synced
             label_count: Number of labels synced
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.writer() as db:
             await db.execute(
                 """INSERT OR REPLACE INTO metadata_versions
                    (global_version_id, sync_completed_at, entity_count,
@@ -1010,13 +1459,197 @@ class MetadataCacheV2:
             await db.commit()
             logger.info(f"Marked sync completed for version {global_version_id}")
 
+        self.invalidate_schema_cache(global_version_id)
+        self.invalidate_name_index(global_version_id)
+        self.invalidate_search_results(global_version_id)
+        self.invalidate_current_version()
+
+    def invalidate_current_version(self):
+        """Forget the memoized current global version id
+
+        The next read resolves it from the database again. Needed only when
+        the environment's version mapping is changed outside this cache's
+        ``version_manager``.
+        """
+        self._current_global_version_id = None
+        self._current_version_generation = None
+
+    def invalidate_schema_cache(
+        self,
+        global_version_id: Optional[int] = None,
+        entity_names: Optional[List[str]] = None,
+    ) -> int:
+        """Drop in-memory entity schemas
+
+        Loads already in flight are not cached, since they may have read the
+        rows being replaced.
+
+        Args:
+            global_version_id: Only drop schemas of this version (all if None)
+            entity_names: Only drop these entities of ``global_version_id``
+                (all of the version's if None)
+
+        Returns:
+            Number of schemas dropped
+        """
+        self._schema_generation += 1
+        if global_version_id is None:
+            count = len(self._schema_cache)
+            self._schema_cache.clear()
+            return count
+        if entity_names is not None:
+            names = set(entity_names)
+            return self._schema_cache.invalidate(
+                lambda key: key[0] == global_version_id and key[1] in names
+            )
+        return self._schema_cache.invalidate(lambda key: key[0] == global_version_id)
+
+    def get_schema_cache_statistics(self) -> Dict[str, Any]:
+        """Return size and hit/miss counters of the in-memory schema cache"""
+        return self._schema_cache.get_stats()
+
+    async def get_name_index(
+        self, global_version_id: int
+    ) -> FuzzyNameIndex[Tuple[str, ...]]:
+        """Get the typo-tolerant name index of a version, building it if needed
+
+        Data entities are indexed under their name, public entity name and
+        collection name, public entities under their name and entity set
+        name, enumerations under their name.
+
+        Args:
+            global_version_id: Global version ID
+
+        Returns:
+            Index of ``(entity_type, name, entity_set_name, description)`` tuples
+        """
+        index = self._name_indexes.get(global_version_id)
+        if index is not None:
+            return index
+
+        generation = self._name_index_generation
+        index = FuzzyNameIndex()
+        async with self.connections.reader() as db:
+            cursor = await db.execute(
+                """SELECT name, public_entity_name, public_collection_name,
+                          COALESCE(label_text, label_id)
+                   FROM data_entities WHERE global_version_id = ?""",
+                (global_version_id,),
+            )
+            rows = await cursor.fetchall()
+            for name, public_name, collection_name, description in rows:
+                value = ("data_entity", name, collection_name, description)
+                for key in {name, public_name, collection_name}:
+                    if key:
+                        index.add(key, value)
+
+            cursor = await db.execute(
+                """SELECT name, entity_set_name, COALESCE(label_text, label_id)
+                   FROM public_entities WHERE global_version_id = ?""",
+                (global_version_id,),
+            )
+            for name, entity_set_name, description in await cursor.fetchall():
+                value = ("public_entity", name, entity_set_name, description)
+                for key in {name, entity_set_name}:
+                    if key:
+                        index.add(key, value)
+
+            cursor = await db.execute(
+                """SELECT name, COALESCE(label_text, label_id)
+                   FROM enumerations WHERE global_version_id = ?""",
+                (global_version_id,),
+            )
+            for name, description in await cursor.fetchall():
+                index.add(name, ("enumeration", name, name, description))
+
+        # Metadata written while loading makes this index stale; don't keep it
+        if generation == self._name_index_generation:
+            self._name_indexes[global_version_id] = index
+        return index
+
+    def invalidate_name_index(self, global_version_id: Optional[int] = None):
+        """Drop typo-tolerant name indexes
+
+        Args:
+            global_version_id: Only drop the index of this version (all if None)
+        """
+        self._name_index_generation += 1
+        if global_version_id is None:
+            self._name_indexes.clear()
+        else:
+            self._name_indexes.pop(global_version_id, None)
+
+    @property
+    def search_results_generation(self) -> int:
+        """Counter bumped whenever cached search results are invalidated
+
+        Read it before running a search and pass it to
+        ``set_search_results()``, so results computed from rows replaced in
+        the meantime are not cached.
+        """
+        return self._search_generation
+
+    def get_search_results(
+        self, global_version_id: int, query_key: str
+    ) -> Optional[SearchResults]:
+        """Get a copy of cached search results
+
+        Args:
+            global_version_id: Global version the search ran against
+            query_key: Key identifying the search query
+
+        Returns:
+            Copy of the results, or None if not cached or expired
+        """
+        results = self._search_cache.get((global_version_id, query_key))
+        return _copy_search_results(results) if results is not None else None
+
+    def set_search_results(
+        self,
+        global_version_id: int,
+        query_key: str,
+        results: SearchResults,
+        generation: Optional[int] = None,
+    ):
+        """Cache a copy of search results
+
+        Args:
+            global_version_id: Global version the search ran against
+            query_key: Key identifying the search query
+            results: Search results
+            generation: ``search_results_generation`` read before the search
+                ran; the results are not cached if it has changed since
+        """
+        if generation is not None and generation != self._search_generation:
+            return
+        self._search_cache.set(
+            (global_version_id, query_key), _copy_search_results(results)
+        )
+
+    def invalidate_search_results(self, global_version_id: Optional[int] = None) -> int:
+        """Drop cached search results
+
+        Args:
+            global_version_id: Only drop results of this version (all if None)
+
+        Returns:
+            Number of results dropped
+        """
+        self._search_generation += 1
+        if global_version_id is None:
+            count = len(self._search_cache)
+            self._search_cache.clear()
+            return count
+        return self._search_cache.invalidate(lambda key: key[0] == global_version_id)
+
     async def _get_current_global_version_id(self) -> Optional[int]:
         """Get current global version ID for environment
 
         Returns:
             Current global version ID if available
         """
-        if self._current_global_version_id is not None:
+        generation = self.version_manager.mapping_generation
+        if self._current_version_generation == generation:
             return self._current_global_version_id
 
         if self._environment_id is None:
@@ -1028,10 +1661,12 @@ class MetadataCacheV2:
         if result:
             global_version_id, version_info = result
             self._current_version_info = version_info
-            self._current_global_version_id = global_version_id
-            return global_version_id
+        else:
+            global_version_id = None
 
-        return None
+        self._current_global_version_id = global_version_id
+        self._current_version_generation = generation
+        return global_version_id
 
     # Action Operations
 
@@ -1076,9 +1711,9 @@ class MetadataCacheV2:
 
         where_clause = " AND ".join(conditions)
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.reader() as db:
             cursor = await db.execute(
-                f"""SELECT ea.name, ea.binding_kind, ea.entity_name,
+                f"""SELECT ea.id, ea.name, ea.binding_kind, ea.entity_name,
                            ea.entity_set_name, ea.return_type_name,
                            ea.return_is_collection, ea.return_odata_xpp_type,
                            ea.field_lookup
@@ -1087,58 +1722,67 @@ class MetadataCacheV2:
                     ORDER BY ea.name""",
                 params,
             )
-
             rows = await cursor.fetchall()
-            actions = []
 
-            for row in rows:
-                # Get parameters for this action
-                param_cursor = await db.execute(
-                    """SELECT name, type_name, is_collection, odata_xpp_type
-                       FROM action_parameters
-                       WHERE action_id = (
-                           SELECT id FROM entity_actions
-                           WHERE name = ? AND entity_name = ? AND global_version_id = ?
-                       )
-                       ORDER BY parameter_order""",
-                    (row[0], row[2], global_version_id),
-                )
-                param_rows = await param_cursor.fetchall()
-
-                parameters = [
-                    ActionParameterInfo(
-                        name=param_row[0],
-                        type=ActionParameterTypeInfo(
-                            type_name=param_row[1],
-                            is_collection=bool(param_row[2]),
-                            odata_xpp_type=param_row[3],
-                        ),
-                    )
-                    for param_row in param_rows
-                ]
-
-                # Create return type if present
-                return_type = None
-                if row[4]:  # return_type_name
-                    return_type = ActionReturnTypeInfo(
-                        type_name=row[4],
-                        is_collection=bool(row[5]),
-                        odata_xpp_type=row[6],
-                    )
+            # Parameters of all matched actions in one query, not one per action
+            parameters = await self._fetch_action_parameters(db, where_clause, params)
+
+        return [
+            self._build_action_info(row, parameters.get(row[0], [])) for row in rows
+        ]
+
+    @staticmethod
+    async def _fetch_action_parameters(
+        db: aiosqlite.Connection, where_clause: str, params: List[Any]
+    ) -> Dict[int, List[ActionParameterInfo]]:
+        """Load parameters of the actions matching ``where_clause``, keyed by action id"""
+        cursor = await db.execute(
+            f"""SELECT ap.action_id, ap.name, ap.type_name, ap.is_collection,
+                       ap.odata_xpp_type
+                FROM action_parameters ap
+                JOIN entity_actions ea ON ea.id = ap.action_id
+                WHERE {where_clause}
+                ORDER BY ap.action_id, ap.parameter_order""",
+            params,
+        )
 
-                action = ActionInfo(
-                    name=row[0],
-                    binding_kind=ODataBindingKind(row[1]),
-                    entity_name=row[2],
-                    entity_set_name=row[3],
-                    parameters=parameters,
-                    return_type=return_type,
-                    field_lookup=row[7],
+        parameters: Dict[int, List[ActionParameterInfo]] = {}
+        for param_row in await cursor.fetchall():
+            parameters.setdefault(param_row[0], []).append(
+                ActionParameterInfo(
+                    name=param_row[1],
+                    type=ActionParameterTypeInfo(
+                        type_name=param_row[2],
+                        is_collection=bool(param_row[3]),
+                        odata_xpp_type=param_row[4],
+                    ),
                 )
+            )
+        return parameters
+
+    @staticmethod
+    def _build_action_info(
+        row: Tuple, parameters: List[ActionParameterInfo]
+    ) -> ActionInfo:
+        """Create an ActionInfo from an entity_actions row selected with its id"""
+        # Create return type if present
+        return_type = None
+        if row[5]:  # return_type_name
+            return_type = ActionReturnTypeInfo(
+                type_name=row[5],
+                is_collection=bool(row[6]),
+                odata_xpp_type=row[7],
+            )
 
-                actions.append(action)
-
-            return actions
+        return ActionInfo(
+            name=row[1],
+            binding_kind=ODataBindingKind(row[2]),
+            entity_name=row[3],
+            entity_set_name=row[4],
+            parameters=parameters,
+            return_type=return_type,
+            field_lookup=row[8],
+        )
 
     async def get_action_info(
         self,
@@ -1171,7 +1815,7 @@ class MetadataCacheV2:
 
         where_clause = " AND ".join(conditions)
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.reader() as db:
             cursor = await db.execute(
                 f"""SELECT ea.id, ea.name, ea.binding_kind, ea.entity_name,
                            ea.entity_set_name, ea.return_type_name,
@@ -1187,48 +1831,9 @@ class MetadataCacheV2:
             if not row:
                 return None
 
-            action_id = row[0]
+            parameters = await self._fetch_action_parameters(db, "ea.id = ?", [row[0]])
 
-            # Get parameters for this action
-            param_cursor = await db.execute(
-                """SELECT name, type_name, is_collection, odata_xpp_type
-                   FROM action_parameters
-                   WHERE action_id = ?
-                   ORDER BY parameter_order""",
-                (action_id,),
-            )
-            param_rows = await param_cursor.fetchall()
-
-            parameters = [
-                ActionParameterInfo(
-                    name=param_row[0],
-                    type=ActionParameterTypeInfo(
-                        type_name=param_row[1],
-                        is_collection=bool(param_row[2]),
-                        odata_xpp_type=param_row[3],
-                    ),
-                )
-                for param_row in param_rows
-            ]
-
-            # Create return type if present
-            return_type = None
-            if row[5]:  # return_type_name
-                return_type = ActionReturnTypeInfo(
-                    type_name=row[5],
-                    is_collection=bool(row[6]),
-                    odata_xpp_type=row[7],
-                )
-
-            return ActionInfo(
-                name=row[1],
-                binding_kind=ODataBindingKind(row[2]),
-                entity_name=row[3],
-                entity_set_name=row[4],
-                parameters=parameters,
-                return_type=return_type,
-                field_lookup=row[8],
-            )
+        return self._build_action_info(row, parameters.get(row[0], []))
 
     # Label Operations
 
@@ -1251,11 +1856,17 @@ class MetadataCacheV2:
         if global_version_id is None:
             global_version_id = await self._get_current_global_version_id()
 
-        async with aiosqlite.connect(self.db_path) as db:
+        if global_version_id is not None:
+            label_text = self._label_cache.get((global_version_id, language, label_id))
+            if label_text is not None:
+                self._record_label_hits(global_version_id, language, [label_id])
+                return label_text
+
+        async with self.connections.reader() as db:
             if global_version_id is not None:
                 # Search for specific version
                 cursor = await db.execute(
-                    """SELECT label_text
+                    """SELECT label_text, global_version_id
                        FROM labels_cache 
                        WHERE global_version_id = ? AND label_id = ? AND language = ?""",
                     (global_version_id, label_id, language),
@@ -1263,7 +1874,7 @@ class MetadataCacheV2:
             else:
                 # Search across all versions (including temporary entries)
                 cursor = await db.execute(
-                    """SELECT label_text
+                    """SELECT label_text, global_version_id
                        FROM labels_cache 
                        WHERE label_id = ? AND language = ?
                        ORDER BY global_version_id DESC
@@ -1272,31 +1883,18 @@ class MetadataCacheV2:
                 )
 
             row = await cursor.fetchone()
-            if row:
-                # Update hit count and last accessed time
-                if global_version_id is not None:
-                    await db.execute(
-                        """UPDATE labels_cache 
-                           SET hit_count = hit_count + 1, last_accessed = CURRENT_TIMESTAMP
-                           WHERE global_version_id = ? AND label_id = ? AND language = ?""",
-                        (global_version_id, label_id, language),
-                    )
-                else:
-                    # Update for the found entry
-                    await db.execute(
-                        """UPDATE labels_cache 
-                           SET hit_count = hit_count + 1, last_accessed = CURRENT_TIMESTAMP
-                           WHERE label_id = ? AND language = ? AND label_text = ?""",
-                        (label_id, language, row[0]),
-                    )
-                await db.commit()
-
-                logger.debug(f"Label cache hit: {label_id} ({language}) -> {row[0]}")
-                return row[0]
 
+        if not row:
             logger.debug(f"Label cache miss: {label_id} ({language})")
             return None
 
+        if global_version_id is not None:
+            self._label_cache.set((global_version_id, language, label_id), row[0])
+        self._record_label_hits(row[1], language, [label_id])
+
+        logger.debug(f"Label cache hit: {label_id} ({language}) -> {row[0]}")
+        return row[0]
+
     async def set_label(
         self,
         label_id: str,
@@ -1321,7 +1919,7 @@ class MetadataCacheV2:
                 )
                 global_version_id = -1  # Use -1 for temporary entries
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.writer() as db:
             await db.execute(
                 """INSERT OR REPLACE INTO labels_cache
                    (global_version_id, label_id, language, label_text, hit_count, last_accessed)
@@ -1335,6 +1933,8 @@ class MetadataCacheV2:
             )
             await db.commit()
 
+        self._label_cache.set((global_version_id, language, label_id), label_text)
+
         logger.debug(f"Label cached: {label_id} ({language}) -> {label_text}")
 
     async def set_labels_batch(
@@ -1372,7 +1972,7 @@ class MetadataCacheV2:
                 )
             )
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.writer() as db:
             await db.executemany(
                 """INSERT OR REPLACE INTO labels_cache
                    (global_version_id, label_id, language, label_text, hit_count, last_accessed)
@@ -1381,6 +1981,11 @@ class MetadataCacheV2:
             )
             await db.commit()
 
+        for label in labels:
+            self._label_cache.set(
+                (global_version_id, label.language, label.id), label.value
+            )
+
         logger.debug(
             f"Batch cached {len(labels)} labels for version {global_version_id}"
         )
@@ -1407,46 +2012,146 @@ class MetadataCacheV2:
         if global_version_id is None:
             global_version_id = await self._get_current_global_version_id()
 
-        # Create placeholders for SQL IN clause
-        placeholders = ",".join("?" for _ in label_ids)
+        results = {}
+        found_ids: Dict[int, List[str]] = {}
+        missing_ids = []
 
-        async with aiosqlite.connect(self.db_path) as db:
+        # Memory tier first; only the misses go to SQLite
+        for label_id in dict.fromkeys(label_ids):
+            label_text = None
             if global_version_id is not None:
-                # Search for specific version
-                params = [global_version_id, language] + label_ids
-                query = f"""SELECT label_id, label_text
-                            FROM labels_cache 
-                            WHERE global_version_id = ? AND language = ? AND label_id IN ({placeholders})"""
+                label_text = self._label_cache.get(
+                    (global_version_id, language, label_id)
+                )
+            if label_text is not None:
+                results[label_id] = label_text
+                found_ids.setdefault(global_version_id, []).append(label_id)
             else:
-                # Search across all versions (including temporary entries)
-                params = [language] + label_ids
-                query = f"""SELECT label_id, label_text
-                            FROM labels_cache 
-                            WHERE language = ? AND label_id IN ({placeholders})
-                            ORDER BY global_version_id DESC"""  # Prefer actual versions over temporary
-
-            cursor = await db.execute(query, params)
-
-            results = {}
-            found_ids = []
-            async for row in cursor:
-                if row[0] not in results:  # Only use first match (highest version)
-                    results[row[0]] = row[1]
-                    found_ids.append(row[0])
-
-            # Update hit counts for found labels
-            if found_ids and global_version_id is not None:
-                update_placeholders = ",".join("?" for _ in found_ids)
-                await db.execute(
-                    f"""UPDATE labels_cache 
-                        SET hit_count = hit_count + 1, last_accessed = CURRENT_TIMESTAMP
-                        WHERE global_version_id = ? AND language = ? AND label_id IN ({update_placeholders})""",
-                    [global_version_id, language] + found_ids,
+                missing_ids.append(label_id)
+
+        if missing_ids:
+            async with self.connections.reader() as db:
+                for start in range(0, len(missing_ids), _SQL_IN_CHUNK):
+                    chunk = missing_ids[start : start + _SQL_IN_CHUNK]
+                    # Create placeholders for SQL IN clause
+                    placeholders = ",".join("?" for _ in chunk)
+
+                    if global_version_id is not None:
+                        # Search for specific version
+                        params = [global_version_id, language] + chunk
+                        query = f"""SELECT label_id, label_text, global_version_id
+                                    FROM labels_cache 
+                                    WHERE global_version_id = ? AND language = ? AND label_id IN ({placeholders})"""
+                    else:
+                        # Search across all versions (including temporary entries)
+                        params = [language] + chunk
+                        query = f"""SELECT label_id, label_text, global_version_id
+                                    FROM labels_cache 
+                                    WHERE language = ? AND label_id IN ({placeholders})
+                                    ORDER BY global_version_id DESC"""  # Prefer actual versions over temporary
+
+                    cursor = await db.execute(query, params)
+                    async for row in cursor:
+                        # Only use first match (highest version)
+                        if row[0] not in results:
+                            results[row[0]] = row[1]
+                            found_ids.setdefault(row[2], []).append(row[0])
+                            if global_version_id is not None:
+                                self._label_cache.set(
+                                    (global_version_id, language, row[0]), row[1]
+                                )
+
+        for found_version_id, version_label_ids in found_ids.items():
+            self._record_label_hits(found_version_id, language, version_label_ids)
+
+        logger.debug(f"Label batch lookup: {len(results)}/{len(label_ids)} found")
+        return results
+
+    def invalidate_label_cache(self, global_version_id: Optional[int] = None) -> int:
+        """Drop in-memory label texts
+
+        Args:
+            global_version_id: Only drop labels of this version (all if None)
+
+        Returns:
+            Number of labels dropped
+        """
+        if global_version_id is None:
+            count = len(self._label_cache)
+            self._label_cache.clear()
+            return count
+        return self._label_cache.invalidate(lambda key: key[0] == global_version_id)
+
+    def _record_label_hits(
+        self, global_version_id: int, language: str, label_ids: List[str]
+    ):
+        """Count label cache hits in memory, scheduling a flush when due
+
+        Keeps label reads off the writer connection: hit_count and
+        last_accessed are written in one batch every
+        ``label_hit_flush_interval_seconds`` or once
+        ``label_hit_flush_threshold`` labels are pending, by a background
+        task the read does not wait for.
+        """
+        if not self.track_label_hits:
+            return
+
+        accessed_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        for label_id in label_ids:
+            key = (global_version_id, label_id, language)
+            pending = self._pending_label_hits.get(key)
+            if pending is None:
+                self._pending_label_hits[key] = [1, accessed_at]
+            else:
+                pending[0] += 1
+                pending[1] = accessed_at
+
+        if (
+            len(self._pending_label_hits) >= self.label_hit_flush_threshold
+            or time.monotonic() - self._last_label_hit_flush
+            >= self.label_hit_flush_interval_seconds
+        ):
+            task = self._label_hit_flush_task
+            if task is None or task.done():
+                self._label_hit_flush_task = asyncio.create_task(
+                    self._flush_label_hits_in_background()
                 )
-                await db.commit()
 
-            logger.debug(f"Label batch lookup: {len(results)}/{len(label_ids)} found")
-            return results
+    async def _flush_label_hits_in_background(self):
+        """Flush label hits scheduled by a read, logging instead of raising"""
+        try:
+            await self.flush_label_hits()
+        except Exception as e:
+            logger.warning(f"Failed to flush label hit counts: {e}")
+
+    async def flush_label_hits(self) -> int:
+        """Write pending label hit counts to the database in one transaction
+
+        Returns:
+            Number of labels updated
+        """
+        # Swap first so hits recorded while waiting for the writer are kept
+        pending, self._pending_label_hits = self._pending_label_hits, {}
+        self._last_label_hit_flush = time.monotonic()
+        if not pending:
+            return 0
+
+        async with self.connections.writer() as db:
+            await db.executemany(
+                """UPDATE labels_cache
+                   SET hit_count = hit_count + ?, last_accessed = ?
+                   WHERE global_version_id = ? AND label_id = ? AND language = ?""",
+                [
+                    (hits, accessed_at, global_version_id, label_id, language)
+                    for (global_version_id, label_id, language), (
+                        hits,
+                        accessed_at,
+                    ) in pending.items()
+                ],
+            )
+
+        logger.debug(f"Flushed label hit counts for {len(pending)} labels")
+        return len(pending)
 
     async def get_label_cache_statistics(
         self, global_version_id: Optional[int] = None
@@ -1459,7 +2164,9 @@ class MetadataCacheV2:
         Returns:
             Dictionary with label cache statistics
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        await self.flush_label_hits()
+
+        async with self.connections.reader() as db:
             stats = {}
 
             # Base query conditions
@@ -1557,6 +2264,9 @@ class MetadataCacheV2:
         # Label cache statistics (already environment-scoped via current_version)
         label_stats = await self.get_label_cache_statistics(current_version)
         stats["label_cache"] = label_stats
+        stats["schema_cache"] = self.get_schema_cache_statistics()
+        stats["label_memory_cache"] = self._label_cache.get_stats()
+        stats["search_cache"] = self._search_cache.get_stats()
 
         return stats
 
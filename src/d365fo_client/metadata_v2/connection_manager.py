@@ -0,0 +1,256 @@
+"""Shared aiosqlite connections for the metadata cache database."""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+TEMP_STORE_MODES = ("DEFAULT", "FILE", "MEMORY")
+
+
+@dataclass
+class SQLiteTuning:
+    """PRAGMA profile applied to every metadata database connection
+
+    The cache is a rebuildable copy of server metadata, so in WAL mode
+    ``synchronous=NORMAL`` (no fsync per commit; a power loss may only drop
+    the latest transactions) is the right trade-off. ``busy_timeout`` makes
+    connections wait for a lock instead of failing with "database is locked".
+    """
+
+    synchronous: str = "NORMAL"
+    cache_size_mb: int = 32
+    mmap_size_mb: int = 256
+    temp_store: str = "MEMORY"
+    busy_timeout_ms: int = 5000
+    # Writer blocks between wal_checkpoint(PASSIVE) + optimize, 0 disables
+    maintenance_interval: int = 1000
+
+    def __post_init__(self):
+        self.synchronous = self.synchronous.upper()
+        self.temp_store = self.temp_store.upper()
+        if self.synchronous not in SYNCHRONOUS_MODES:
+            raise ValueError(f"synchronous must be one of {SYNCHRONOUS_MODES}")
+        if self.temp_store not in TEMP_STORE_MODES:
+            raise ValueError(f"temp_store must be one of {TEMP_STORE_MODES}")
+        if (
+            min(
+                self.cache_size_mb,
+                self.mmap_size_mb,
+                self.busy_timeout_ms,
+                self.maintenance_interval,
+            )
+            < 0
+        ):
+            raise ValueError("SQLite tuning values must be non-negative")
+
+    async def apply(self, db: aiosqlite.Connection) -> None:
+        """Apply the per-connection settings to an open connection"""
+        # busy_timeout first so the remaining statements wait on a locked file
+        await db.execute(f"PRAGMA busy_timeout = {self.busy_timeout_ms}")
+        await db.execute(f"PRAGMA synchronous = {self.synchronous}")
+        # A negative cache_size is in KiB rather than pages
+        await db.execute(f"PRAGMA cache_size = {-self.cache_size_mb * 1024}")
+        await db.execute(f"PRAGMA mmap_size = {self.mmap_size_mb * 1024 * 1024}")
+        await db.execute(f"PRAGMA temp_store = {self.temp_store}")
+
+
+async def read_sqlite_settings(db: aiosqlite.Connection) -> Dict[str, Any]:
+    """Return the effective storage settings of a connection"""
+    settings: Dict[str, Any] = {}
+    for pragma in (
+        "journal_mode",
+        "synchronous",
+        "cache_size",
+        "mmap_size",
+        "temp_store",
+        "busy_timeout",
+        "page_size",
+        "wal_autocheckpoint",
+        "query_only",
+    ):
+        cursor = await db.execute(f"PRAGMA {pragma}")
+        row = await cursor.fetchone()
+        settings[pragma] = row[0] if row else None
+
+    settings["synchronous"] = SYNCHRONOUS_MODES[settings["synchronous"]]
+    settings["temp_store"] = TEMP_STORE_MODES[settings["temp_store"]]
+    settings["query_only"] = bool(settings["query_only"])
+    return settings
+
+
+class ConnectionManager:
+    """Long-lived connections to one SQLite database: one writer, N readers
+
+    Opening an aiosqlite connection starts a thread and makes SQLite parse the
+    schema, which dominated cached lookups when every method connected on its
+    own. Connections are opened lazily and reused until ``close()``.
+
+    The database runs in WAL mode, so readers never block the writer and see
+    the last committed state. Reader connections are ``query_only``; all
+    writes go through the single writer connection, which is serialized by a
+    lock and committed (or rolled back on error) when the block exits.
+    After ``close()`` connections are reopened on next use.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        max_readers: int = 4,
+        tuning: Optional[SQLiteTuning] = None,
+    ):
+        """Initialize connection manager
+
+        Args:
+            db_path: Path to SQLite database file
+            max_readers: Maximum number of concurrent reader connections
+            tuning: PRAGMA profile applied to each connection (defaults if None)
+        """
+        if max_readers < 1:
+            raise ValueError("max_readers must be at least 1")
+
+        self.db_path = db_path
+        self.max_readers = max_readers
+        self.tuning = tuning or SQLiteTuning()
+
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._idle_readers: List[aiosqlite.Connection] = []
+        self._reader_count = 0
+        # Bumped by close() so readers borrowed before it are not reused
+        self._generation = 0
+
+        # asyncio primitives are bound lazily to the running loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._writer_lock: Optional[asyncio.Lock] = None
+        self._reader_slots: Optional[asyncio.Semaphore] = None
+
+        self._connections_opened = 0
+        self._reads = 0
+        self._writes = 0
+        self._writes_since_maintenance = 0
+        self._maintenance_runs = 0
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._writer_lock = asyncio.Lock()
+            self._reader_slots = asyncio.Semaphore(self.max_readers)
+
+    async def _connect(self, read_only: bool) -> aiosqlite.Connection:
+        db = await aiosqlite.connect(self.db_path)
+        await self.tuning.apply(db)
+        if read_only:
+            await db.execute("PRAGMA query_only = ON")
+        else:
+            # Persistent in the file; readers pick it up from the writer
+            await db.execute("PRAGMA journal_mode = WAL")
+        self._connections_opened += 1
+        return db
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read-only connection for the duration of the block"""
+        self._bind_loop()
+
+        async with self._reader_slots:
+            if self._idle_readers:
+                db = self._idle_readers.pop()
+            else:
+                db = await self._connect(read_only=True)
+                self._reader_count += 1
+
+            generation = self._generation
+            self._reads += 1
+            try:
+                yield db
+            finally:
+                if generation != self._generation:
+                    await db.close()
+                    self._reader_count -= 1
+                else:
+                    self._idle_readers.append(db)
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Hold the writer connection for the duration of the block
+
+        Pending changes are committed when the block exits normally and
+        rolled back if it raises.
+        """
+        self._bind_loop()
+
+        async with self._writer_lock:
+            if self._writer is None:
+                self._writer = await self._connect(read_only=False)
+
+            db = self._writer
+            self._writes += 1
+            try:
+                yield db
+            except BaseException:
+                if db.in_transaction:
+                    await db.rollback()
+                raise
+            else:
+                if db.in_transaction:
+                    await db.commit()
+                await self._maybe_run_maintenance(db)
+
+    async def _maybe_run_maintenance(self, db: aiosqlite.Connection) -> None:
+        """Checkpoint the WAL and refresh planner statistics every N writes"""
+        interval = self.tuning.maintenance_interval
+        if not interval:
+            return
+        self._writes_since_maintenance += 1
+        if self._writes_since_maintenance < interval:
+            return
+        self._writes_since_maintenance = 0
+        try:
+            # PASSIVE never waits on readers, so it cannot stall the writer
+            await db.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            await db.execute("PRAGMA optimize")
+            self._maintenance_runs += 1
+        except Exception as e:
+            logger.warning(f"Metadata database maintenance failed: {e}")
+
+    async def close(self) -> None:
+        """Close all idle connections; borrowed readers close when returned"""
+        self._generation += 1
+
+        readers, self._idle_readers = self._idle_readers, []
+        for db in readers:
+            await db.close()
+            self._reader_count -= 1
+
+        self._bind_loop()
+        async with self._writer_lock:
+            if self._writer is not None:
+                writer, self._writer = self._writer, None
+                try:
+                    await writer.execute("PRAGMA optimize")
+                except Exception as e:
+                    logger.debug(f"PRAGMA optimize on close failed: {e}")
+                await writer.close()
+
+        logger.debug(f"Closed metadata database connections: {self.db_path}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return connection usage counters"""
+        return {
+            "max_readers": self.max_readers,
+            "open_readers": self._reader_count,
+            "idle_readers": len(self._idle_readers),
+            "writer_open": self._writer is not None,
+            "connections_opened": self._connections_opened,
+            "reads": self._reads,
+            "writes": self._writes,
+            "maintenance_runs": self._maintenance_runs,
+        }
@@ -6,8 +6,128 @@ from typing import Any, Dict, Optional
 
 import aiosqlite
 
+from .connection_manager import ConnectionManager, read_sqlite_settings
+
 logger = logging.getLogger(__name__)
 
+SEARCH_INDEX_SCHEMA = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS metadata_search_v2 USING fts5(
+        name,
+        entity_type,
+        description,
+        properties,
+        labels,
+        global_version_id UNINDEXED,
+        entity_id UNINDEXED
+    )
+"""
+
+# Property-level index; rowid is the entity_properties id
+PROPERTY_SEARCH_INDEX_SCHEMA = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS property_search_v2 USING fts5(
+        name,
+        label_text,
+        data_type,
+        entity_name UNINDEXED,
+        label_id UNINDEXED,
+        type_name UNINDEXED,
+        is_key UNINDEXED,
+        global_version_id UNINDEXED
+    )
+"""
+
+_PROPERTY_SEARCH_INDEX_COLUMNS = (
+    "rowid, name, label_text, data_type, entity_name, label_id, type_name, "
+    "is_key, global_version_id"
+)
+
+
+def _property_search_index_values(row: str) -> str:
+    """SQL expressions for one property_search_v2 row of entity_properties alias ``row``"""
+    return (
+        f"{row}.id, {row}.name, COALESCE({row}.label_text, ''), "
+        f"COALESCE({row}.data_type, ''), "
+        f"(SELECT pe.name FROM public_entities pe WHERE pe.id = {row}.entity_id), "
+        f"{row}.label_id, {row}.type_name, {row}.is_key, {row}.global_version_id"
+    )
+
+
+# Substring index over the data entity text columns; rowid is the
+# data_entities id. The trigram tokenizer lets LIKE '%Invoice%' style
+# patterns be answered from the index instead of scanning every row.
+NAME_TRIGRAM_INDEX_SCHEMA = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS data_entity_names_v2 USING fts5(
+        name,
+        public_entity_name,
+        public_collection_name,
+        label_id,
+        label_text,
+        entity_category,
+        global_version_id UNINDEXED,
+        tokenize='trigram'
+    )
+"""
+
+_NAME_TRIGRAM_INDEX_COLUMNS = (
+    "rowid, name, public_entity_name, public_collection_name, label_id, "
+    "label_text, entity_category, global_version_id"
+)
+
+
+def _name_trigram_index_values(row: str) -> str:
+    """SQL expressions for one data_entity_names_v2 row of data_entities alias ``row``"""
+    return (
+        f"{row}.id, {row}.name, {row}.public_entity_name, "
+        f"{row}.public_collection_name, {row}.label_id, {row}.label_text, "
+        f"{row}.entity_category, {row}.global_version_id"
+    )
+
+
+# FTS5 tables holding per-version rows derived from the metadata tables
+SEARCH_INDEX_TABLES = (
+    "metadata_search_v2",
+    "property_search_v2",
+    "data_entity_names_v2",
+)
+
+
+# Tables indexed in metadata_search_v2 as (table, rowid offset, entity_type,
+# properties expression). A source row is indexed under rowid
+# id * 3 + offset so rows of different tables never collide.
+_SEARCH_INDEX_SOURCES = [
+    (
+        "data_entities",
+        0,
+        "data_entity",
+        "{r}.name || ' ' || COALESCE({r}.public_entity_name, '') || ' ' || "
+        "COALESCE({r}.public_collection_name, '')",
+    ),
+    (
+        "public_entities",
+        1,
+        "public_entity",
+        "{r}.name || ' ' || COALESCE({r}.entity_set_name, '')",
+    ),
+    ("enumerations", 2, "enumeration", "{r}.name"),
+]
+
+_SEARCH_INDEX_COLUMNS = (
+    "rowid, name, entity_type, description, properties, labels, "
+    "global_version_id, entity_id"
+)
+
+
+def _search_index_values(
+    row: str, offset: int, entity_type: str, properties: str
+) -> str:
+    """SQL expressions for one metadata_search_v2 row of source alias ``row``"""
+    return (
+        f"{row}.id * 3 + {offset}, {row}.name, '{entity_type}', "
+        f"COALESCE({row}.label_text, {row}.label_id, {row}.name), "
+        f"{properties.format(r=row)}, COALESCE({row}.label_text, ''), "
+        f"{row}.global_version_id, {row}.id"
+    )
+
 
 class DatabaseSchemaV2:
     """Database schema manager for metadata v2"""
@@ -130,6 +250,7 @@ class DatabaseSchemaV2:
                 label_text TEXT,
                 is_read_only BOOLEAN DEFAULT 0,
                 configuration_enabled BOOLEAN DEFAULT 1,
+                schema_blob BLOB,  -- zlib-compressed JSON of the full schema
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """
@@ -303,25 +424,168 @@ class DatabaseSchemaV2:
         """
         )
 
-        # FTS5 search index (version-aware)
-        await db.execute(
-            """
-            CREATE VIRTUAL TABLE IF NOT EXISTS metadata_search_v2 USING fts5(
-                name,
-                entity_type,
-                description,
-                properties,
-                labels,
-                global_version_id UNINDEXED,
-                entity_id UNINDEXED,
-                content='',
-                contentless_delete=1
+        # FTS5 search indexes (version-aware), kept in sync by triggers
+        await db.execute(SEARCH_INDEX_SCHEMA)
+        await db.execute(PROPERTY_SEARCH_INDEX_SCHEMA)
+        await db.execute(NAME_TRIGRAM_INDEX_SCHEMA)
+        await DatabaseSchemaV2.create_search_triggers(db)
+
+        await db.commit()
+        logger.info("Database schema v2 created successfully")
+
+    @staticmethod
+    async def create_search_triggers(db: aiosqlite.Connection):
+        """Create triggers mirroring indexed tables into the search indexes
+
+        Every insert, update or delete of a data entity, public entity,
+        enumeration or entity property touches only its own index rows, so
+        the indexes never need a full rebuild to stay current.
+        """
+        for table, offset, entity_type, properties in _SEARCH_INDEX_SOURCES:
+            insert_new = (
+                f"INSERT INTO metadata_search_v2 ({_SEARCH_INDEX_COLUMNS}) "
+                f"VALUES ({_search_index_values('new', offset, entity_type, properties)});"
+            )
+            delete_old = (
+                f"DELETE FROM metadata_search_v2 WHERE rowid = old.id * 3 + {offset};"
             )
+            await db.execute(
+                f"""CREATE TRIGGER IF NOT EXISTS {table}_search_insert
+                    AFTER INSERT ON {table} BEGIN {insert_new} END"""
+            )
+            await db.execute(
+                f"""CREATE TRIGGER IF NOT EXISTS {table}_search_delete
+                    AFTER DELETE ON {table} BEGIN {delete_old} END"""
+            )
+            await db.execute(
+                f"""CREATE TRIGGER IF NOT EXISTS {table}_search_update
+                    AFTER UPDATE ON {table} BEGIN {delete_old} {insert_new} END"""
+            )
+
+        insert_new = (
+            f"INSERT INTO property_search_v2 ({_PROPERTY_SEARCH_INDEX_COLUMNS}) "
+            f"VALUES ({_property_search_index_values('new')});"
+        )
+        delete_old = "DELETE FROM property_search_v2 WHERE rowid = old.id;"
+        await db.execute(
+            f"""CREATE TRIGGER IF NOT EXISTS entity_properties_search_insert
+                AFTER INSERT ON entity_properties BEGIN {insert_new} END"""
+        )
+        await db.execute(
+            f"""CREATE TRIGGER IF NOT EXISTS entity_properties_search_delete
+                AFTER DELETE ON entity_properties BEGIN {delete_old} END"""
+        )
+        await db.execute(
+            f"""CREATE TRIGGER IF NOT EXISTS entity_properties_search_update
+                AFTER UPDATE ON entity_properties BEGIN {delete_old} {insert_new} END"""
+        )
+
+        insert_new = (
+            f"INSERT INTO data_entity_names_v2 ({_NAME_TRIGRAM_INDEX_COLUMNS}) "
+            f"VALUES ({_name_trigram_index_values('new')});"
+        )
+        delete_old = "DELETE FROM data_entity_names_v2 WHERE rowid = old.id;"
+        await db.execute(
+            f"""CREATE TRIGGER IF NOT EXISTS data_entities_names_insert
+                AFTER INSERT ON data_entities BEGIN {insert_new} END"""
+        )
+        await db.execute(
+            f"""CREATE TRIGGER IF NOT EXISTS data_entities_names_delete
+                AFTER DELETE ON data_entities BEGIN {delete_old} END"""
+        )
+        await db.execute(
+            f"""CREATE TRIGGER IF NOT EXISTS data_entities_names_update
+                AFTER UPDATE ON data_entities BEGIN {delete_old} {insert_new} END"""
+        )
+
+    @staticmethod
+    async def populate_search_index(
+        db: aiosqlite.Connection, global_version_id: Optional[int] = None
+    ):
+        """Index all rows of a version (all versions if None) from the source tables
+
+        Existing index rows of the version must have been deleted first.
         """
+        for table, offset, entity_type, properties in _SEARCH_INDEX_SOURCES:
+            sql = (
+                f"INSERT INTO metadata_search_v2 ({_SEARCH_INDEX_COLUMNS}) "
+                f"SELECT {_search_index_values('t', offset, entity_type, properties)} "
+                f"FROM {table} t"
+            )
+            if global_version_id is None:
+                await db.execute(sql)
+            else:
+                await db.execute(
+                    sql + " WHERE t.global_version_id = ?", (global_version_id,)
+                )
+
+        for sql in (
+            f"INSERT INTO property_search_v2 ({_PROPERTY_SEARCH_INDEX_COLUMNS}) "
+            f"SELECT {_property_search_index_values('t')} FROM entity_properties t",
+            f"INSERT INTO data_entity_names_v2 ({_NAME_TRIGRAM_INDEX_COLUMNS}) "
+            f"SELECT {_name_trigram_index_values('t')} FROM data_entities t",
+        ):
+            if global_version_id is None:
+                await db.execute(sql)
+            else:
+                await db.execute(
+                    sql + " WHERE t.global_version_id = ?", (global_version_id,)
+                )
+
+    @staticmethod
+    async def migrate_schema(db: aiosqlite.Connection):
+        """Add columns introduced after a database was first created"""
+        added_columns = {
+            "public_entities": [("schema_blob", "BLOB")],
+        }
+
+        for table, columns in added_columns.items():
+            cursor = await db.execute(f"PRAGMA table_info({table})")
+            existing = {row[1] for row in await cursor.fetchall()}
+            for column, column_type in columns:
+                if column not in existing:
+                    await db.execute(
+                        f"ALTER TABLE {table} ADD COLUMN {column} {column_type}"
+                    )
+                    logger.info(f"Added column {table}.{column}")
+
+        # Older databases used a contentless search index that was only
+        # filled by explicit rebuilds; replace it with the trigger-maintained one
+        cursor = await db.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'metadata_search_v2'"
+        )
+        row = await cursor.fetchone()
+        if row and "content=''" in row[0]:
+            await db.execute("DROP TABLE metadata_search_v2")
+            await db.execute(SEARCH_INDEX_SCHEMA)
+            await db.execute("DELETE FROM property_search_v2")
+            await db.execute("DELETE FROM data_entity_names_v2")
+            await DatabaseSchemaV2.populate_search_index(db)
+            logger.info("Rebuilt metadata_search_v2 as a trigger-maintained index")
+
+        # Backfill the property index of databases created before it existed
+        cursor = await db.execute(
+            """SELECT EXISTS (SELECT 1 FROM entity_properties)
+                      AND NOT EXISTS (SELECT 1 FROM property_search_v2)"""
         )
+        if (await cursor.fetchone())[0]:
+            await db.execute(
+                f"INSERT INTO property_search_v2 ({_PROPERTY_SEARCH_INDEX_COLUMNS}) "
+                f"SELECT {_property_search_index_values('t')} FROM entity_properties t"
+            )
+            logger.info("Built property_search_v2 from existing entity properties")
 
-        await db.commit()
-        logger.info("Database schema v2 created successfully")
+        # Backfill the name trigram index of databases created before it existed
+        cursor = await db.execute(
+            """SELECT EXISTS (SELECT 1 FROM data_entities)
+                      AND NOT EXISTS (SELECT 1 FROM data_entity_names_v2)"""
+        )
+        if (await cursor.fetchone())[0]:
+            await db.execute(
+                f"INSERT INTO data_entity_names_v2 ({_NAME_TRIGRAM_INDEX_COLUMNS}) "
+                f"SELECT {_name_trigram_index_values('t')} FROM data_entities t"
+            )
+            logger.info("Built data_entity_names_v2 from existing data entities")
 
     @staticmethod
     async def create_indexes(db: aiosqlite.Connection):
@@ -341,6 +605,7 @@ class DatabaseSchemaV2:
             "CREATE INDEX IF NOT EXISTS idx_entity_properties_version ON entity_properties(global_version_id, entity_id)",
             "CREATE INDEX IF NOT EXISTS idx_navigation_props_version ON navigation_properties(global_version_id, entity_id)",
             "CREATE INDEX IF NOT EXISTS idx_entity_actions_version ON entity_actions(global_version_id, entity_id)",
+            "CREATE INDEX IF NOT EXISTS idx_action_parameters_action ON action_parameters(action_id, parameter_order)",
             "CREATE INDEX IF NOT EXISTS idx_enumerations_version ON enumerations(global_version_id, name)",
             # Labels indexes
             "CREATE INDEX IF NOT EXISTS idx_labels_version_lookup ON labels_cache(global_version_id, label_id, language)",
@@ -364,14 +629,16 @@ class DatabaseSchemaV2:
 class MetadataDatabaseV2:
     """Enhanced metadata database with global version support"""
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, connections: Optional[ConnectionManager] = None):
         """Initialize database with path
 
         Args:
             db_path: Path to SQLite database file
+            connections: Shared connection manager (a private one is created if None)
         """
         self.db_path = db_path
         self._ensure_database_directory()
+        self.connections = connections or ConnectionManager(db_path)
 
     def _ensure_database_directory(self):
         """Ensure database directory exists"""
@@ -379,17 +646,24 @@ class MetadataDatabaseV2:
 
     async def initialize(self):
         """Initialize database with v2 schema"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.writer() as db:
             await DatabaseSchemaV2.create_schema(db)
+            await DatabaseSchemaV2.migrate_schema(db)
             await DatabaseSchemaV2.create_indexes(db)
 
-            # Enable foreign key constraints
-            await db.execute("PRAGMA foreign_keys = ON")
-            await db.execute("PRAGMA journal_mode = WAL")
+            # Foreign keys stay unenforced on the shared writer, as they were
+            # when every write opened its own connection: labels cached before
+            # the first sync are stored under the -1 placeholder version, which
+            # has no global_versions row. No constraint cascades, so nothing
+            # relies on enforcement. WAL is set when the writer opens.
             await db.commit()
 
         logger.info(f"Metadata database v2 initialized: {self.db_path}")
 
+    async def close(self):
+        """Close the database connections"""
+        await self.connections.close()
+
     async def get_or_create_environment(self, base_url: str) -> int:
         """Get or create environment ID
 
@@ -399,7 +673,7 @@ class MetadataDatabaseV2:
         Returns:
             Environment ID
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.writer() as db:
             # Try to find existing environment
             cursor = await db.execute(
                 "SELECT id FROM metadata_environments WHERE base_url = ?", (base_url,)
@@ -449,7 +723,7 @@ class MetadataDatabaseV2:
         Returns:
             Dictionary with counts for each metadata type
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.reader() as db:
             counts = {}
 
             tables = [
@@ -476,7 +750,7 @@ class MetadataDatabaseV2:
         Returns:
             Dictionary with database statistics
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.reader() as db:
             stats = {}
 
             # Basic table counts
@@ -540,6 +814,9 @@ class MetadataDatabaseV2:
                 stats["database_size_bytes"] = None
                 stats["database_size_mb"] = None
 
+            # Effective PRAGMA settings of the cache connections
+            stats["sqlite_settings"] = await read_sqlite_settings(db)
+
             return stats
 
     async def get_statistics(self) -> Dict[str, Any]:
@@ -561,7 +838,7 @@ class MetadataDatabaseV2:
         Returns:
             Dictionary with environment-scoped database statistics
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.reader() as db:
             stats = {}
 
             # Get active global versions for this environment
@@ -644,7 +921,7 @@ class MetadataDatabaseV2:
             True if successful, False otherwise
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.connections.writer() as db:
                 await db.execute("VACUUM")
                 await db.commit()
             logger.info("Database vacuum completed successfully")
@@ -659,7 +936,7 @@ class MetadataDatabaseV2:
         Returns:
             Dictionary with integrity check results
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.reader() as db:
             # Run integrity check
             cursor = await db.execute("PRAGMA integrity_check")
             integrity_result = await cursor.fetchone()
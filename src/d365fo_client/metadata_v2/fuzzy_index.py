@@ -0,0 +1,220 @@
+"""In-memory typo-tolerant name index for metadata search."""
+
+from collections import Counter, defaultdict
+from itertools import chain
+from typing import Callable, Dict, Generic, List, Optional, Set, Tuple, TypeVar
+
+V = TypeVar("V")
+
+# Length of the character n-grams used to find candidates
+NGRAM_SIZE = 3
+
+_PAD = "\0" * (NGRAM_SIZE - 1)
+
+
+def _ngrams(text: str) -> Set[str]:
+    """Distinct n-grams of ``text``, padded so short strings still have some"""
+    padded = f"{_PAD}{text}{_PAD}"
+    return {padded[i : i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1)}
+
+
+def default_max_distance(text: str) -> int:
+    """Edit distance tolerated for a query: 1 for short names, up to 3 for long"""
+    return max(1, min(3, len(text) // 5))
+
+
+def bounded_edit_distance(a: str, b: str, max_distance: int) -> Optional[int]:
+    """Optimal string alignment distance of ``a`` and ``b`` if within ``max_distance``
+
+    Insertions, deletions, substitutions and transpositions of adjacent
+    characters each cost 1. Only the diagonal band of the distance matrix
+    that can stay within ``max_distance`` is computed, and the comparison
+    gives up as soon as a row exceeds it.
+
+    Returns:
+        The distance, or None if it is greater than ``max_distance``
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    if len(a) > len(b):
+        a, b = b, a
+
+    # Cells outside the band hold a value that can never come back in range
+    too_far = max_distance + 1
+    before_previous: List[int] = []
+    previous = [j if j <= max_distance else too_far for j in range(len(a) + 1)]
+    for i in range(1, len(b) + 1):
+        current = [too_far] * (len(a) + 1)
+        if i <= max_distance:
+            current[0] = i
+        row_min = current[0]
+        char_b = b[i - 1]
+        for j in range(max(1, i - max_distance), min(len(a), i + max_distance) + 1):
+            char_a = a[j - 1]
+            value = previous[j - 1] + (char_a != char_b)
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if (
+                i > 1
+                and j > 1
+                and char_a == b[i - 2]
+                and a[j - 2] == char_b
+                and before_previous[j - 2] + 1 < value
+            ):
+                value = before_previous[j - 2] + 1
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return None
+        before_previous, previous = previous, current
+
+    distance = previous[-1]
+    return distance if distance <= max_distance else None
+
+
+class FuzzyNameIndex(Generic[V]):
+    """Case-insensitive name index returning near matches ranked by edit distance
+
+    Candidates are found through an inverted index of character n-grams:
+    one edit changes at most ``NGRAM_SIZE + 1`` distinct n-grams of a name,
+    so a name within distance ``k`` shares at least
+    ``len(ngrams(query)) - k * (NGRAM_SIZE + 1)`` of the query's n-grams.
+    Only names of a close enough length passing that count, and not missing
+    more query characters than the distance allows, are compared with
+    :func:`bounded_edit_distance`. Values must be hashable; a value stored
+    under several names is returned once, for its closest name.
+    """
+
+    def __init__(self):
+        self._names: List[str] = []
+        self._values: List[List[V]] = []
+        self._ids: Dict[str, int] = {}
+        # Name ids by name length and n-gram, so only names of a length within
+        # the edit distance are ever counted
+        self._postings: Dict[int, Dict[str, List[int]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        self._by_length: Dict[int, List[int]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, name: str, value: V) -> None:
+        """Index ``value`` under ``name``"""
+        key = name.lower()
+        name_id = self._ids.get(key)
+        if name_id is None:
+            name_id = len(self._names)
+            self._ids[key] = name_id
+            self._names.append(key)
+            self._values.append([])
+            self._by_length[len(key)].append(name_id)
+            postings = self._postings[len(key)]
+            for gram in _ngrams(key):
+                postings[gram].append(name_id)
+        self._values[name_id].append(value)
+
+    def search(
+        self,
+        text: str,
+        max_distance: Optional[int] = None,
+        limit: int = 10,
+        accept: Optional[Callable[[V], bool]] = None,
+    ) -> List[Tuple[int, V]]:
+        """Find values whose name is within ``max_distance`` edits of ``text``
+
+        Args:
+            text: Name to look up (case-insensitive)
+            max_distance: Largest edit distance accepted (scaled to the
+                length of ``text`` if None)
+            limit: Maximum number of values returned
+            accept: Only return values for which this returns True
+
+        Returns:
+            ``(distance, value)`` pairs, closest first; ties are ordered by
+            name length difference, then name
+        """
+        query = text.lower()
+        if max_distance is None:
+            max_distance = default_max_distance(query)
+
+        lengths = range(
+            max(0, len(query) - max_distance), len(query) + max_distance + 1
+        )
+        query_grams = _ngrams(query)
+        shared = Counter(
+            chain.from_iterable(
+                self._postings[length].get(gram, ())
+                for length in lengths
+                if length in self._postings
+                for gram in query_grams
+            )
+        )
+        if len(query_grams) > max_distance * (NGRAM_SIZE + 1):
+            min_shared = len(query_grams) - max_distance * (NGRAM_SIZE + 1)
+            candidates = [
+                (count, name_id)
+                for name_id, count in shared.items()
+                if count >= min_shared
+            ]
+        else:
+            # Too short for the n-gram filter to exclude anything
+            candidates = [
+                (shared[name_id], name_id)
+                for length in lengths
+                for name_id in self._by_length.get(length, ())
+            ]
+        # Names sharing the most n-grams are compared first, so the distance
+        # bound can tighten early and the rest are cut off by their count
+        candidates.sort(reverse=True)
+        query_chars = list(Counter(query).items())
+
+        bound = max_distance
+        found: Dict[V, Tuple[int, int, str]] = {}
+        found_per_distance = [0] * (max_distance + 1)
+        for count, name_id in candidates:
+            if count < len(query_grams) - bound * (NGRAM_SIZE + 1):
+                break
+            name = self._names[name_id]
+
+            # Characters of the query missing from the name each need an
+            # edit; a cheap bound that rejects most n-gram candidates
+            missing = 0
+            for char, char_count in query_chars:
+                missing += max(0, char_count - name.count(char))
+                if missing > bound:
+                    break
+            if missing > bound:
+                continue
+
+            distance = bounded_edit_distance(query, name, bound)
+            if distance is None:
+                continue
+
+            rank = (distance, abs(len(name) - len(query)), name)
+            for value in self._values[name_id]:
+                if accept is not None and not accept(value):
+                    continue
+                previous = found.get(value)
+                if previous is not None:
+                    if previous <= rank:
+                        continue
+                    found_per_distance[previous[0]] -= 1
+                found[value] = rank
+                found_per_distance[distance] += 1
+
+            # Once ``limit`` values are within distance d, farther names can't
+            # make the result
+            if len(found) >= limit:
+                total = 0
+                for d, found_count in enumerate(found_per_distance):
+                    total += found_count
+                    if total >= limit:
+                        bound = d
+                        break
+
+        ranked = sorted(found.items(), key=lambda item: item[1])[:limit]
+        return [(rank[0], value) for value, rank in ranked]
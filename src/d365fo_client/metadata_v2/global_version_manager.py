@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional, Tuple
 import aiosqlite
 
 from ..models import EnvironmentVersionInfo, GlobalVersionInfo, ModuleVersionInfo
+from .connection_manager import ConnectionManager
 
 logger = logging.getLogger(__name__)
 
@@ -15,13 +16,18 @@ logger = logging.getLogger(__name__)
 class GlobalVersionManager:
     """Manages global version registry and cross-environment sharing"""
 
-    def __init__(self, db_path):
+    def __init__(self, db_path, connections: Optional[ConnectionManager] = None):
         """Initialize global version manager
 
         Args:
             db_path: Path to metadata database
+            connections: Shared connection manager (a private one is created if None)
         """
         self.db_path = db_path
+        self.connections = connections or ConnectionManager(db_path)
+        # Bumped whenever an environment -> global version link may change,
+        # so callers holding a resolved version id know to look it up again
+        self.mapping_generation = 0
 
     async def register_environment_version(
         self, environment_id: int, modules: List[ModuleVersionInfo]
@@ -39,7 +45,7 @@ class GlobalVersionManager:
         modules_hash = self._calculate_modules_hash(modules)
         version_hash = self._calculate_version_hash(modules)
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.writer() as db:
             # Check if this exact version already exists
             cursor = await db.execute(
                 "SELECT id FROM global_versions WHERE modules_hash = ?", (modules_hash,)
@@ -83,6 +89,7 @@ class GlobalVersionManager:
             )
 
             await db.commit()
+            self.mapping_generation += 1
 
             return global_version_id, is_new_version
 
@@ -203,7 +210,7 @@ class GlobalVersionManager:
         Returns:
             Tuple of (global_version_id, EnvironmentVersionInfo) if found, None otherwise
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.reader() as db:
             cursor = await db.execute(
                 """SELECT 
                      ev.global_version_id,
@@ -285,7 +292,7 @@ class GlobalVersionManager:
         Returns:
             Global version info if found
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.reader() as db:
             cursor = await db.execute(
                 """SELECT 
                      id, version_hash, modules_hash, first_seen_at, 
@@ -342,7 +349,7 @@ class GlobalVersionManager:
         """
         target_modules_hash = self._calculate_modules_hash(modules)
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.reader() as db:
             if exact_match:
                 # Exact module match only
                 cursor = await db.execute(
@@ -358,16 +365,20 @@ class GlobalVersionManager:
                        ORDER BY reference_count DESC, last_used_at DESC"""
                 )
 
-            compatible_versions = []
-            for row in await cursor.fetchall():
-                version_info = await self.get_global_version_info(row[0])
-                if version_info:
-                    if exact_match or self._is_compatible(
-                        modules, version_info.modules
-                    ):
-                        compatible_versions.append(version_info)
+            version_ids = [row[0] for row in await cursor.fetchall()]
 
-            return compatible_versions
+        # Details are loaded after releasing the connection so lookups never
+        # hold more than one pooled connection at a time
+        compatible_versions = []
+        for version_id in version_ids:
+            version_info = await self.get_global_version_info(version_id)
+            if version_info:
+                if exact_match or self._is_compatible(
+                    modules, version_info.modules
+                ):
+                    compatible_versions.append(version_info)
+
+        return compatible_versions
 
     def _is_compatible(
         self,
@@ -423,7 +434,7 @@ class GlobalVersionManager:
         cutoff_date = cutoff_date.timestamp() - (max_unused_days * 86400)
         cutoff_timestamp = datetime.fromtimestamp(cutoff_date).isoformat()
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.writer() as db:
             # Find unused versions
             cursor = await db.execute(
                 """SELECT id FROM global_versions 
@@ -442,6 +453,7 @@ class GlobalVersionManager:
                 await self._delete_global_version_data(db, global_version_id)
 
             await db.commit()
+            self.mapping_generation += 1
 
             logger.info(f"Cleaned up {len(unused_versions)} unused global versions")
             return len(unused_versions)
@@ -503,7 +515,7 @@ class GlobalVersionManager:
             status: New sync status
             duration_ms: Sync duration in milliseconds
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.writer() as db:
             if duration_ms is not None:
                 await db.execute(
                     """UPDATE environment_versions
@@ -527,7 +539,7 @@ class GlobalVersionManager:
         Returns:
             Dictionary with version statistics
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.reader() as db:
             stats = {}
 
             # Basic counts
@@ -581,7 +593,7 @@ class GlobalVersionManager:
         Returns:
             Dictionary with environment-scoped version statistics
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.connections.reader() as db:
             stats = {}
 
             # Get versions for this specific environment
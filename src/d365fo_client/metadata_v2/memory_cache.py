@@ -0,0 +1,115 @@
+"""Bounded in-process LRU cache with optional TTL expiry."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class LRUCache(Generic[V]):
+    """Size-bounded least-recently-used cache with per-entry expiry
+
+    ``get`` and ``set`` are O(1). Entries expire ``ttl_seconds`` after they
+    were stored (never if ``ttl_seconds`` is None). The cache has no awaits,
+    so it is safe to share between tasks on one event loop without a lock.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize cache
+
+        Args:
+            max_size: Maximum number of entries kept
+            ttl_seconds: Seconds an entry stays valid, None for no expiry
+            clock: Monotonic time source (overridable for tests)
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be greater than 0")
+
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        # key -> (expires_at, value); most recently used last
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING, count=False) is not _MISSING
+
+    def get(self, key: Hashable, default: Any = None, count: bool = True) -> Any:
+        """Return the cached value, or ``default`` if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at is None or expires_at > self._clock():
+                self._entries.move_to_end(key)
+                if count:
+                    self._hits += 1
+                return value
+            del self._entries[key]
+            self._expirations += 1
+
+        if count:
+            self._misses += 1
+        return default
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        expires_at = (
+            self._clock() + self.ttl_seconds if self.ttl_seconds is not None else None
+        )
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        """Remove one entry if present"""
+        self._entries.pop(key, None)
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove all entries whose key matches ``predicate``
+
+        Returns:
+            Number of entries removed
+        """
+        stale = [key for key in self._entries if predicate(key)]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return size and hit/miss counters"""
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+        }
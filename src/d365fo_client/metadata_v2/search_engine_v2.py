@@ -2,14 +2,12 @@
 
 import hashlib
 import logging
-import threading
 import time
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import aiosqlite
-
 from ..exceptions import MetadataError
-from ..models import SearchQuery, SearchResult, SearchResults
+from ..models import PropertySearchResult, SearchQuery, SearchResult, SearchResults
+from .database_v2 import SEARCH_INDEX_TABLES, DatabaseSchemaV2
 
 if TYPE_CHECKING:
     from .cache_v2 import MetadataCacheV2
@@ -35,9 +33,6 @@ class VersionAwareSearchEngine:
             metadata_cache: MetadataCacheV2 instance
         """
         self.cache = metadata_cache
-        self._search_cache = {}
-        self._search_cache_lock = threading.RLock()
-        self._cache_ttl_seconds = 300  # 5 minutes cache TTL
 
     async def rebuild_search_index(self, global_version_id: Optional[int] = None):
         """Rebuild the FTS5 search index for a specific version.
@@ -52,7 +47,7 @@ class VersionAwareSearchEngine:
         # Get version to rebuild for
         if global_version_id is None:
             # Get current environment's active global version
-            async with aiosqlite.connect(self.cache.db_path) as db:
+            async with self.cache.connections.reader() as db:
                 cursor = await db.execute(
                     """SELECT global_version_id FROM environment_versions 
                        WHERE environment_id = ? AND is_active = 1 
@@ -68,70 +63,53 @@ class VersionAwareSearchEngine:
         await self._rebuild_fts_index_for_version(global_version_id)
 
     async def _rebuild_fts_index_for_version(self, global_version_id: int):
-        """Rebuild FTS5 index for specific global version."""
-        async with aiosqlite.connect(self.cache.db_path) as db:
+        """Rebuild FTS5 index for specific global version.
+
+        Triggers keep the index current as metadata is stored, so this is
+        only needed to repair it; the index is optimized afterwards.
+        """
+        async with self.cache.connections.writer() as db:
             logger.info(f"Rebuilding FTS5 search index for version {global_version_id}")
 
             # Clear existing entries for this version
-            await db.execute(
-                "DELETE FROM metadata_search_v2 WHERE global_version_id = ?",
-                (global_version_id,),
-            )
-
-            # Index data entities
-            await db.execute(
-                """INSERT INTO metadata_search_v2 
-                   (name, entity_type, description, properties, labels, global_version_id, entity_id)
-                   SELECT 
-                       de.name,
-                       'data_entity',
-                       COALESCE(de.label_text, de.label_id, de.name),
-                       de.name || ' ' || COALESCE(de.public_entity_name, '') || ' ' || COALESCE(de.public_collection_name, ''),
-                       COALESCE(de.label_text, ''),
-                       de.global_version_id,
-                       de.id
-                   FROM data_entities de
-                   WHERE de.global_version_id = ?""",
-                (global_version_id,),
-            )
-
-            # Index public entities
-            await db.execute(
-                """INSERT INTO metadata_search_v2 
-                   (name, entity_type, description, properties, labels, global_version_id, entity_id)
-                   SELECT 
-                       pe.name,
-                       'public_entity',
-                       COALESCE(pe.label_text, pe.label_id, pe.name),
-                       pe.name || ' ' || COALESCE(pe.entity_set_name, ''),
-                       COALESCE(pe.label_text, ''),
-                       pe.global_version_id,
-                       pe.id
-                   FROM public_entities pe
-                   WHERE pe.global_version_id = ?""",
-                (global_version_id,),
-            )
+            for index_table in SEARCH_INDEX_TABLES:
+                await db.execute(
+                    f"DELETE FROM {index_table} WHERE global_version_id = ?",
+                    (global_version_id,),
+                )
 
-            # Index enumerations
-            await db.execute(
-                """INSERT INTO metadata_search_v2 
-                   (name, entity_type, description, properties, labels, global_version_id, entity_id)
-                   SELECT 
-                       e.name,
-                       'enumeration',
-                       COALESCE(e.label_text, e.label_id, e.name),
-                       e.name,
-                       COALESCE(e.label_text, ''),
-                       e.global_version_id,
-                       e.id
-                   FROM enumerations e
-                   WHERE e.global_version_id = ?""",
-                (global_version_id,),
-            )
+            # Index data entities, public entities, enumerations and properties,
+            # and the data entity name trigram index
+            await DatabaseSchemaV2.populate_search_index(db, global_version_id)
 
             await db.commit()
             logger.info(f"FTS5 search index rebuilt for version {global_version_id}")
 
+        await self.optimize_search_index()
+
+    async def optimize_search_index(self, merge_pages: Optional[int] = None):
+        """Merge the b-trees of the FTS5 search indexes.
+
+        Incremental updates leave the index split into many segments; merging
+        them keeps MATCH queries fast.
+
+        Args:
+            merge_pages: Do a bounded incremental ``merge`` of about this many
+                pages instead of a full ``optimize``.
+        """
+        async with self.cache.connections.writer() as db:
+            for index_table in SEARCH_INDEX_TABLES:
+                if merge_pages is None:
+                    await db.execute(
+                        f"INSERT INTO {index_table}({index_table}) VALUES('optimize')"
+                    )
+                else:
+                    await db.execute(
+                        f"INSERT INTO {index_table}({index_table}, rank) "
+                        "VALUES('merge', ?)",
+                        (merge_pages,),
+                    )
+
     async def search(self, query: SearchQuery) -> SearchResults:
         """Execute version-aware metadata search.
 
@@ -143,16 +121,17 @@ class VersionAwareSearchEngine:
         """
         start_time = time.time()
 
-        # Build cache key
+        # Results are cached per version, so a sync never serves stale ones
+        global_version_id = await self.cache._get_current_global_version_id()
         cache_key = self._build_search_cache_key(query)
+        generation = self.cache.search_results_generation
 
-        # Check cache
-        with self._search_cache_lock:
-            cached = self._search_cache.get(cache_key)
-            if cached and time.time() - cached["timestamp"] < self._cache_ttl_seconds:
-                cached["results"].cache_hit = True
-                cached["results"].query_time_ms = (time.time() - start_time) * 1000
-                return cached["results"]
+        if global_version_id is not None:
+            cached = self.cache.get_search_results(global_version_id, cache_key)
+            if cached is not None:
+                cached.cache_hit = True
+                cached.query_time_ms = (time.time() - start_time) * 1000
+                return cached
 
         # Execute search
         if query.use_fulltext:
@@ -160,24 +139,19 @@ class VersionAwareSearchEngine:
         else:
             results = await self._pattern_search(query)
 
+        if query.fuzzy and not results.results and query.offset == 0:
+            results = await self.search_fuzzy(
+                query.text, entity_types=query.entity_types, limit=query.limit
+            )
+
         # Calculate timing
         results.query_time_ms = (time.time() - start_time) * 1000
         results.cache_hit = False
 
-        # Cache results
-        with self._search_cache_lock:
-            self._search_cache[cache_key] = {
-                "results": results,
-                "timestamp": time.time(),
-            }
-
-            # Limit cache size
-            if len(self._search_cache) > 100:
-                oldest_key = min(
-                    self._search_cache.keys(),
-                    key=lambda k: self._search_cache[k]["timestamp"],
-                )
-                del self._search_cache[oldest_key]
+        if global_version_id is not None:
+            self.cache.set_search_results(
+                global_version_id, cache_key, results, generation
+            )
 
         return results
 
@@ -192,6 +166,7 @@ class VersionAwareSearchEngine:
             str(query.use_fulltext),
             str(query.include_properties),
             str(query.include_actions),
+            str(query.fuzzy),
         ]
 
         if query.filters:
@@ -207,7 +182,7 @@ class VersionAwareSearchEngine:
 
         search_query = self._build_fts_query(query.text)
 
-        async with aiosqlite.connect(self.cache.db_path) as db:
+        async with self.cache.connections.reader() as db:
             # Get current environment's active global version
             cursor = await db.execute(
                 """SELECT global_version_id FROM environment_versions 
@@ -282,7 +257,7 @@ class VersionAwareSearchEngine:
 
         pattern = f"%{query.text.lower()}%"
 
-        async with aiosqlite.connect(self.cache.db_path) as db:
+        async with self.cache.connections.reader() as db:
             # Get current environment's active global version
             cursor = await db.execute(
                 """SELECT global_version_id FROM environment_versions 
@@ -371,6 +346,123 @@ class VersionAwareSearchEngine:
                 total_count=len(results),  # Simplified count for pattern search
             )
 
+    async def search_properties(
+        self,
+        text: str,
+        entity_name: Optional[str] = None,
+        data_type: Optional[str] = None,
+        limit: int = 50,
+        global_version_id: Optional[int] = None,
+    ) -> List[PropertySearchResult]:
+        """Full-text search over entity property names, labels and data types.
+
+        Args:
+            text: Search text (FTS5 syntax allowed; single terms match as prefix)
+            entity_name: Only return properties of this public entity
+            data_type: Only return properties of this data type (e.g. 'String')
+            limit: Maximum number of results
+            global_version_id: Version to search (current version if None)
+
+        Returns:
+            Matching properties ordered by relevance
+        """
+        if global_version_id is None:
+            global_version_id = await self.cache._get_current_global_version_id()
+            if global_version_id is None:
+                logger.warning("No active version found for property search")
+                return []
+
+        sql = """
+            SELECT entity_name, name, label_id, label_text, data_type, type_name,
+                   is_key, bm25(property_search_v2) as relevance,
+                   snippet(property_search_v2, -1, '<mark>', '</mark>', '...', 16) as snippet
+            FROM property_search_v2
+            WHERE property_search_v2 MATCH ? AND global_version_id = ?
+        """
+        params: List[Any] = [self._build_fts_query(text), global_version_id]
+
+        if entity_name:
+            sql += " AND entity_name = ?"
+            params.append(entity_name)
+        if data_type:
+            sql += " AND data_type = ?"
+            params.append(data_type)
+
+        sql += " ORDER BY bm25(property_search_v2) LIMIT ?"
+        params.append(limit)
+
+        async with self.cache.connections.reader() as db:
+            cursor = await db.execute(sql, params)
+            rows = await cursor.fetchall()
+
+        return [
+            PropertySearchResult(
+                entity_name=row[0],
+                name=row[1],
+                label_id=row[2],
+                label_text=row[3] or None,
+                data_type=row[4] or None,
+                type_name=row[5],
+                is_key=bool(row[6]),
+                relevance=row[7],
+                snippet=row[8],
+            )
+            for row in rows
+        ]
+
+    async def search_fuzzy(
+        self,
+        text: str,
+        entity_types: Optional[List[str]] = None,
+        limit: int = 10,
+        max_distance: Optional[int] = None,
+        global_version_id: Optional[int] = None,
+    ) -> SearchResults:
+        """Typo-tolerant name search ranked by edit distance.
+
+        Matches entity, entity set and enumeration names that differ from
+        ``text`` by a few inserted, deleted, substituted or swapped
+        characters (e.g. 'SalesOrderHeaderV2' finds 'SalesOrderHeadersV2').
+        The in-memory name index of a version is built on first use.
+
+        Args:
+            text: Name to look up (case-insensitive)
+            entity_types: Only return these entity types (all if None)
+            limit: Maximum number of results
+            max_distance: Largest edit distance accepted (1-3 depending on
+                the length of ``text`` if None)
+            global_version_id: Version to search (current version if None)
+
+        Returns:
+            Search results, closest first; relevance is 1 / (1 + distance)
+        """
+        if global_version_id is None:
+            global_version_id = await self.cache._get_current_global_version_id()
+            if global_version_id is None:
+                logger.warning("No active version found for fuzzy search")
+                return SearchResults(results=[], total_count=0)
+
+        index = await self.cache.get_name_index(global_version_id)
+
+        accept = (lambda value: value[0] in entity_types) if entity_types else None
+
+        matches = index.search(
+            text, max_distance=max_distance, limit=limit, accept=accept
+        )
+        results = [
+            SearchResult(
+                name=name,
+                entity_type=entity_type,
+                entity_set_name=entity_set_name or "",
+                description=description or "",
+                relevance=1.0 / (1 + distance),
+                snippet=name,
+            )
+            for distance, (entity_type, name, entity_set_name, description) in matches
+        ]
+
+        return SearchResults(results=results, total_count=len(results))
+
     def _build_fts_query(self, text: str) -> str:
         """Build FTS5 query from user input."""
         # Simple FTS query building - can be enhanced with more sophisticated parsing
@@ -5,7 +5,7 @@ import json
 import logging
 import time
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Dict, List, Optional, Set
 
 # Use TYPE_CHECKING to avoid circular import
 if TYPE_CHECKING:
@@ -27,6 +27,9 @@ from .cache_v2 import MetadataCacheV2
 
 logger = logging.getLogger(__name__)
 
+# Entity schemas written per transaction during a full sync
+SCHEMA_BATCH_SIZE = 100
+
 
 class SmartSyncManagerV2:
     """Intelligent metadata synchronization with progress tracking and error handling"""
@@ -235,10 +238,16 @@ class SmartSyncManagerV2:
         """
         entity_count = 0
         action_count = 0
+        schema_count = 0
         enumeration_count = 0
         label_count = 0
+        enumerations: List[EnumerationInfo] = []
+        public_entity_label_ids: Set[str] = set()
 
         try:
+            # A version with no stored metadata skips the deletes of existing rows
+            fresh_version = not await self.cache.has_version_metadata(global_version_id)
+
             # Step 1: Sync data entities
             progress.phase = "entities"
             progress.current_operation = "Syncing data entities"
@@ -247,7 +256,9 @@ class SmartSyncManagerV2:
 
             entities = await self._get_data_entities()
             if entities:
-                await self.cache.store_data_entities(global_version_id, entities)
+                await self.cache.store_data_entities(
+                    global_version_id, entities, fresh_version
+                )
                 entity_count = len(entities)
                 logger.info(f"Synced {entity_count} data entities")
 
@@ -257,12 +268,25 @@ class SmartSyncManagerV2:
             progress.completed_steps = 2
             self._update_progress(progress)
 
-            public_entities = await self._get_public_entities()
-            for entity in public_entities:
-                await self.cache.store_public_entity_schema(global_version_id, entity)
+            # Stored in batches as they are parsed so the full payload is never
+            # held in memory; only label IDs are kept for the label step
+            batch: List[PublicEntityInfo] = []
+            async for entity in self._iter_public_entities():
+                public_entity_label_ids.update(self._public_entity_label_ids(entity))
+                batch.append(entity)
                 action_count += len(entity.actions)
+                schema_count += 1
 
-            schema_count = len(public_entities)
+                if len(batch) >= SCHEMA_BATCH_SIZE:
+                    await self.cache.store_public_entity_schemas(
+                        global_version_id, batch, fresh_version
+                    )
+                    batch = []
+
+            if batch:
+                await self.cache.store_public_entity_schemas(
+                    global_version_id, batch, fresh_version
+                )
 
             logger.info(f"Synced {schema_count} entity schemas")
 
@@ -289,7 +313,7 @@ class SmartSyncManagerV2:
 
             try:
                 label_count = await self._sync_common_labels(
-                    global_version_id, entities, public_entities, enumerations
+                    global_version_id, entities, public_entity_label_ids, enumerations
                 )
                 logger.info(f"Pre-cached {label_count} common labels")
             except Exception as e:
@@ -513,11 +537,9 @@ class SmartSyncManagerV2:
         Returns:
             Dictionary with copy counts
         """
-        import aiosqlite
-
         counts = {}
 
-        async with aiosqlite.connect(self.cache.db_path) as db:
+        async with self.cache.connections.writer() as db:
             # Copy data entities with label processing
             await db.execute(
                 """INSERT INTO data_entities
@@ -559,14 +581,14 @@ class SmartSyncManagerV2:
             await db.execute(
                 """INSERT INTO public_entities
                    (global_version_id, name, entity_set_name, label_id, label_text,
-                    is_read_only, configuration_enabled)
+                    is_read_only, configuration_enabled, schema_blob)
                    SELECT ?, name, entity_set_name, label_id,
                           CASE 
                               WHEN label_text IS NOT NULL AND label_text != '' THEN label_text
                               WHEN label_id IS NOT NULL AND label_id != '' AND NOT label_id LIKE '@%' THEN label_id
                               ELSE label_text
                           END as processed_label_text,
-                          is_read_only, configuration_enabled
+                          is_read_only, configuration_enabled, schema_blob
                    FROM public_entities
                    WHERE global_version_id = ?""",
                 (target_version_id, source_version_id),
@@ -705,20 +727,22 @@ class SmartSyncManagerV2:
             logger.error(f"Error getting data entities: {e}")
             raise
 
-    async def _get_public_entities(self) -> List[PublicEntityInfo]:
-        """Get detailed schema for all public entities using MetadataAPIOperations
+    async def _iter_public_entities(self) -> AsyncIterator[PublicEntityInfo]:
+        """Stream detailed schema for all public entities using MetadataAPIOperations
 
-        Returns:
-            List of PublicEntityInfo with full schema
+        Yields:
+            PublicEntityInfo with full schema
         """
         try:
-            return await self.metadata_api.get_all_public_entities_with_details(
+            async for entity in self.metadata_api.iter_public_entities_with_details(
                 resolve_labels=False  # We'll handle labels separately if needed
-            )
+            ):
+                yield entity
 
         except Exception as e:
+            # A partial schema set must not be stored as a completed sync
             logger.error(f"Error getting public entities: {e}")
-            return []
+            raise
 
     async def _get_public_enumerations(self) -> List[EnumerationInfo]:
         """Get public enumerations using MetadataAPIOperations
@@ -795,11 +819,24 @@ class SmartSyncManagerV2:
             # When in doubt, assume sync is needed
             return True
 
+    @staticmethod
+    def _public_entity_label_ids(entity: PublicEntityInfo) -> Set[str]:
+        """Return the label IDs of a public entity and its properties"""
+        label_ids = set()
+        if entity.label_id and entity.label_id.startswith("@"):
+            label_ids.add(entity.label_id)
+
+        for prop in entity.properties:
+            if prop.label_id and prop.label_id.startswith("@"):
+                label_ids.add(prop.label_id)
+
+        return label_ids
+
     async def _sync_common_labels(
         self,
         global_version_id: int,
         entities: List[DataEntityInfo],
-        public_entities: List[PublicEntityInfo],
+        public_entity_label_ids: Set[str],
         enumerations: List[EnumerationInfo],
     ) -> int:
         """Sync commonly used labels to improve performance
@@ -807,7 +844,7 @@ class SmartSyncManagerV2:
         Args:
             global_version_id: Global version ID
             entities: Data entities to extract labels from
-            public_entities: Public entities to extract labels from
+            public_entity_label_ids: Label IDs collected from public entities
             enumerations: Enumerations to extract labels from
 
         Returns:
@@ -821,16 +858,8 @@ class SmartSyncManagerV2:
                 if entity.label_id and entity.label_id.startswith("@"):
                     label_ids.add(entity.label_id)
 
-        # Collect label IDs from public entities and their properties
-        if public_entities:
-            for entity in public_entities:
-                if entity.label_id and entity.label_id.startswith("@"):
-                    label_ids.add(entity.label_id)
-
-                # Collect from properties
-                for prop in entity.properties:
-                    if prop.label_id and prop.label_id.startswith("@"):
-                        label_ids.add(prop.label_id)
+        # Label IDs of public entities and their properties
+        label_ids.update(public_entity_label_ids)
 
         # Collect label IDs from enumerations and their members
         if enumerations:
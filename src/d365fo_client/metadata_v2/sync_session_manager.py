@@ -4,7 +4,7 @@ import asyncio
 import logging
 import time
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Dict, List, Optional, Set
 
 if TYPE_CHECKING:
     from ..metadata_api import MetadataAPIOperations
@@ -28,6 +28,11 @@ from .cache_v2 import MetadataCacheV2
 
 logger = logging.getLogger(__name__)
 
+# Items written per transaction while syncing
+ENTITY_BATCH_SIZE = 500
+SCHEMA_BATCH_SIZE = 100
+LABEL_BATCH_SIZE = 500
+
 
 class SyncSessionManager:
     """Enhanced sync manager with session-based progress tracking."""
@@ -49,6 +54,10 @@ class SyncSessionManager:
         self._progress_callbacks: Dict[str, List[Callable[[SyncSession], None]]] = {}
         self._max_history = 100  # Keep last 100 sessions in memory
 
+        # Versions with no stored metadata when their sync started; their
+        # inserts skip the deletes of existing rows
+        self._fresh_versions: Set[int] = set()
+
     async def start_sync_session(
         self,
         global_version_id: int,
@@ -210,6 +219,12 @@ class SyncSessionManager:
 
         await self._complete_phase(session, SyncPhase.VERSION_CHECK)
 
+        # Decided per sync, so a failed earlier sync never leaves a stale flag
+        if await self.cache.has_version_metadata(session.global_version_id):
+            self._fresh_versions.discard(session.global_version_id)
+        else:
+            self._fresh_versions.add(session.global_version_id)
+
         if session.strategy == SyncStrategy.FULL:
             # Phase 3: Entities
             await self._sync_entities_with_progress(session)
@@ -251,6 +266,8 @@ class SyncSessionManager:
             # Copy from compatible version
             await self._sync_sharing_with_progress(session)
 
+        self._fresh_versions.discard(session.global_version_id)
+
         # Final phase
         await self._update_phase_progress(
             session, SyncPhase.FINALIZING, SyncStatus.RUNNING
@@ -335,19 +352,22 @@ class SyncSessionManager:
                 if self._should_collect_label_ids(session):
                     self._collect_label_ids_from_entities(session, entities)
 
-                for i, entity in enumerate(entities):
-                    activity.current_item = f"Processing {entity.name}"
-                    activity.items_processed = i + 1
-                    activity.progress_percent = ((i + 1) / len(entities)) * 100
+                fresh_version = session.global_version_id in self._fresh_versions
+
+                # One transaction per batch instead of one per entity
+                for start in range(0, len(entities), ENTITY_BATCH_SIZE):
+                    batch = entities[start : start + ENTITY_BATCH_SIZE]
+                    activity.current_item = f"Processing {batch[-1].name}"
 
-                    # Store entity
                     await self.cache.store_data_entities(
-                        session.global_version_id, [entity]
+                        session.global_version_id, batch, fresh_version
                     )
 
-                    # Notify progress every 10 entities or at completion
-                    if (i + 1) % 10 == 0 or i == len(entities) - 1:
-                        self._notify_progress(session.session_id)
+                    activity.items_processed = start + len(batch)
+                    activity.progress_percent = (
+                        activity.items_processed / len(entities)
+                    ) * 100
+                    self._notify_progress(session.session_id)
 
             await self._complete_phase(session, phase)
 
@@ -367,30 +387,49 @@ class SyncSessionManager:
         self._notify_progress(session.session_id)
 
         try:
-            public_entities = await self._get_public_entities()
-            activity.items_total = len(public_entities) if public_entities else 0
+            collect_labels = self._should_collect_label_ids(session)
+            fresh_version = session.global_version_id in self._fresh_versions
             action_count = 0
-
-            if public_entities:
-                # Collect label IDs from all public entities and their fields/actions (only if labels will be synced)
-                if self._should_collect_label_ids(session):
-                    self._collect_label_ids_from_public_entities(
-                        session, public_entities
+            processed = 0
+            batch: List[PublicEntityInfo] = []
+
+            # The stream carries no total, so the data entities found by the
+            # entity phase (a superset of the public ones) serve as the estimate
+            entity_activity = session.phases.get(SyncPhase.ENTITIES)
+            expected_total = entity_activity.items_total if entity_activity else 0
+            activity.items_total = expected_total
+
+            # Entities are parsed from the response and stored in small batches,
+            # so the full PublicEntities payload is never held in memory
+            async for entity in self._iter_public_entities():
+                # Collect label IDs from the entity and its fields/actions (only if labels will be synced)
+                if collect_labels:
+                    self._collect_label_ids_from_public_entities(session, [entity])
+
+                processed += 1
+                activity.current_item = f"Processing schema for {entity.name}"
+                activity.items_processed = processed
+                activity.items_total = max(expected_total, processed)
+                if expected_total:
+                    activity.progress_percent = min(
+                        99.0, (processed / expected_total) * 100
                     )
 
-                for i, entity in enumerate(public_entities):
-                    activity.current_item = f"Processing schema for {entity.name}"
-                    activity.items_processed = i + 1
-                    activity.progress_percent = ((i + 1) / len(public_entities)) * 100
+                batch.append(entity)
+                action_count += len(entity.actions)
 
-                    await self.cache.store_public_entity_schema(
-                        session.global_version_id, entity
+                if len(batch) >= SCHEMA_BATCH_SIZE:
+                    await self.cache.store_public_entity_schemas(
+                        session.global_version_id, batch, fresh_version
                     )
-                    action_count += len(entity.actions)
+                    batch = []
+                    self._notify_progress(session.session_id)
 
-                    # Notify progress every 5 entities
-                    if (i + 1) % 5 == 0 or i == len(public_entities) - 1:
-                        self._notify_progress(session.session_id)
+            if batch:
+                await self.cache.store_public_entity_schemas(
+                    session.global_version_id, batch, fresh_version
+                )
+            self._notify_progress(session.session_id)
 
             # Store action count for result
             activity.items_processed = action_count
@@ -461,8 +500,9 @@ class SyncSessionManager:
 
             label_count = 0
             if label_ids:
-                # Process labels in batches for better progress reporting
-                batch_size = 50
+                # Process labels in batches for progress reporting; labels
+                # within a batch are fetched concurrently by label_ops
+                batch_size = LABEL_BATCH_SIZE
                 for i in range(0, len(label_ids), batch_size):
                     labels_to_cache = []
                     batch = label_ids[i : i + batch_size]
@@ -553,8 +593,9 @@ class SyncSessionManager:
 
             label_count = 0
             if missing_label_ids:
-                # Process labels in batches for better progress reporting
-                batch_size = 50
+                # Process labels in batches for progress reporting; labels
+                # within a batch are fetched concurrently by label_ops
+                batch_size = LABEL_BATCH_SIZE
                 for i in range(0, len(missing_label_ids), batch_size):
                     labels_to_cache = []
                     batch = missing_label_ids[i : i + batch_size]
@@ -836,9 +877,7 @@ class SyncSessionManager:
         Returns:
             List of missing label IDs that need to be fetched
         """
-        import aiosqlite
-
-        async with aiosqlite.connect(self.cache.db_path) as db:
+        async with self.cache.connections.reader() as db:
             # Comprehensive SQL query to find missing labels from all metadata tables with label_id fields
             cursor = await db.execute(
                 """
@@ -911,12 +950,12 @@ class SyncSessionManager:
                 )
                 self._notify_progress(session.session_id)
 
-                public_entities = await self._get_public_entities()
-                if public_entities:
-                    self._collect_label_ids_from_public_entities(
-                        session, public_entities
-                    )
-                    activity.current_item = f"Collected label IDs from {len(public_entities)} public entities"
+                public_entity_count = 0
+                async for entity in self._iter_public_entities():
+                    self._collect_label_ids_from_public_entities(session, [entity])
+                    public_entity_count += 1
+                if public_entity_count:
+                    activity.current_item = f"Collected label IDs from {public_entity_count} public entities"
                     self._notify_progress(session.session_id)
             except Exception as e:
                 logger.warning(
@@ -994,15 +1033,17 @@ class SyncSessionManager:
             logger.error(f"Error getting data entities: {e}")
             raise
 
-    async def _get_public_entities(self) -> List[PublicEntityInfo]:
-        """Get public entities with details"""
+    async def _iter_public_entities(self) -> AsyncIterator[PublicEntityInfo]:
+        """Stream public entities with details"""
         try:
-            return await self.metadata_api.get_all_public_entities_with_details(
+            async for entity in self.metadata_api.iter_public_entities_with_details(
                 resolve_labels=False
-            )
+            ):
+                yield entity
         except Exception as e:
+            # A partial schema set must not be stored as a completed sync
             logger.error(f"Error getting public entities: {e}")
-            return []
+            raise
 
     async def _get_public_enumerations(self) -> List[EnumerationInfo]:
         """Get public enumerations with details"""
@@ -1068,11 +1109,9 @@ class SyncSessionManager:
         self, source_version_id: int, target_version_id: int
     ) -> Dict[str, int]:
         """Copy metadata between global versions"""
-        import aiosqlite
-
         counts = {}
 
-        async with aiosqlite.connect(self.cache.db_path) as db:
+        async with self.cache.connections.writer() as db:
             # Copy data entities
             await db.execute(
                 """INSERT INTO data_entities
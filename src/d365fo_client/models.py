@@ -99,6 +99,7 @@ class FOClientConfig:
     # Label cache settings
     use_label_cache: bool = True
     label_cache_expiry_minutes: int = 60
+    label_fetch_concurrency: int = 8  # Label requests in flight for cache misses
 
     # Sync configuration
     metadata_sync_interval_minutes: int = 60
@@ -109,6 +110,32 @@ class FOClientConfig:
     enable_request_tracing: bool = True
     trace_client_id: Optional[str] = None  # Stable app UUID; auto-generated and persisted if None
 
+    # Retry policy for throttled (429) and unavailable (503) responses
+    max_retries: int = 3
+    retry_backoff_base: float = 0.5
+    retry_backoff_max: float = 30.0
+
+    # Adaptive client-side concurrency limit (AIMD on 429s and server-timing);
+    # opt-in until proven against production workloads
+    enable_adaptive_concurrency: bool = False
+    initial_concurrency_limit: int = 8
+    max_concurrency_limit: int = 64
+
+    # HTTP connection pool (aiohttp TCPConnector)
+    connection_pool_size: int = 100  # Total connections, 0 for unlimited
+    connection_pool_size_per_host: int = 0  # Connections per host, 0 for unlimited
+    keepalive_timeout: float = 15.0  # Seconds an idle connection is kept open
+    dns_cache_ttl: Optional[int] = 10  # Seconds, None caches forever
+    happy_eyeballs_delay: Optional[float] = 0.25  # None disables Happy Eyeballs
+    enable_compression: bool = True  # Negotiate gzip/deflate (and br if available)
+
+    # SQLite settings applied to every metadata cache connection
+    metadata_db_synchronous: str = "NORMAL"  # OFF, NORMAL, FULL or EXTRA
+    metadata_db_cache_size_mb: int = 32  # Page cache per connection
+    metadata_db_mmap_size_mb: int = 256  # Memory-mapped I/O, 0 disables
+    metadata_db_busy_timeout_ms: int = 5000  # Wait for locks instead of failing
+    metadata_db_maintenance_interval: int = 1000  # Writes between checkpoint/optimize, 0 disables
+
     def __post_init__(self):
         """Post-initialization validation and setup."""
         # Set default cache directory if not provided
@@ -132,6 +159,9 @@ class FOClientConfig:
         if self.label_cache_expiry_minutes <= 0:
             raise ValueError("label_cache_expiry_minutes must be greater than 0")
 
+        if self.label_fetch_concurrency < 1:
+            raise ValueError("label_fetch_concurrency must be at least 1")
+
         if self.metadata_sync_interval_minutes <= 0:
             raise ValueError("metadata_sync_interval_minutes must be greater than 0")
 
@@ -141,6 +171,40 @@ class FOClientConfig:
         if self.max_memory_cache_size <= 0:
             raise ValueError("max_memory_cache_size must be greater than 0")
 
+        if self.max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+
+        if self.retry_backoff_base <= 0:
+            raise ValueError("retry_backoff_base must be greater than 0")
+
+        if self.retry_backoff_max < self.retry_backoff_base:
+            raise ValueError("retry_backoff_max must not be less than retry_backoff_base")
+
+        if self.initial_concurrency_limit < 1:
+            raise ValueError("initial_concurrency_limit must be at least 1")
+
+        if self.max_concurrency_limit < self.initial_concurrency_limit:
+            raise ValueError(
+                "max_concurrency_limit must not be less than initial_concurrency_limit"
+            )
+
+        if self.connection_pool_size < 0 or self.connection_pool_size_per_host < 0:
+            raise ValueError("connection pool sizes must be non-negative")
+
+        if self.keepalive_timeout < 0:
+            raise ValueError("keepalive_timeout must be non-negative")
+
+        if self.metadata_db_synchronous.upper() not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+            raise ValueError("metadata_db_synchronous must be OFF, NORMAL, FULL or EXTRA")
+
+        if (
+            self.metadata_db_cache_size_mb < 0
+            or self.metadata_db_mmap_size_mb < 0
+            or self.metadata_db_busy_timeout_ms < 0
+            or self.metadata_db_maintenance_interval < 0
+        ):
+            raise ValueError("metadata database settings must be non-negative")
+
     @property
     def uses_default_credentials(self) -> bool:
         """Check if using Azure Default Credentials."""
@@ -671,6 +735,8 @@ class SearchQuery:
     use_fulltext: bool = True
     include_properties: bool = False
     include_actions: bool = False
+    # Return near matches by edit distance when nothing matches exactly
+    fuzzy: bool = False
 
 
 @dataclass
@@ -697,6 +763,34 @@ class SearchResult:
         }
 
 
+@dataclass
+class PropertySearchResult:
+    """Entity property matched by a property search"""
+
+    entity_name: str
+    name: str
+    label_id: Optional[str] = None
+    label_text: Optional[str] = None
+    data_type: Optional[str] = None
+    type_name: Optional[str] = None
+    is_key: bool = False
+    relevance: float = 0.0
+    snippet: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "entity_name": self.entity_name,
+            "name": self.name,
+            "label_id": self.label_id,
+            "label_text": self.label_text,
+            "data_type": self.data_type,
+            "type_name": self.type_name,
+            "is_key": self.is_key,
+            "relevance": self.relevance,
+            "snippet": self.snippet,
+        }
+
+
 @dataclass
 class SearchResults:
     """Search results container"""
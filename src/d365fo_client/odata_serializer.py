@@ -5,15 +5,25 @@ that can be used by both QueryBuilder and other components requiring
 type-aware OData serialization.
 """
 
+import base64
 import logging
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from enum import Enum
 from typing import TYPE_CHECKING, Any, Dict, Optional
 from urllib.parse import quote
+from uuid import UUID
 
 if TYPE_CHECKING:
     from .models import PublicEntityInfo, PublicEntityPropertyInfo
 
 logger = logging.getLogger(__name__)
 
+# Property data types whose JSON values are integers
+_INTEGER_TYPES = frozenset(
+    {"Byte", "SByte", "Int16", "Int32", "Int64", "UInt16", "UInt32", "UInt64"}
+)
+
 
 class ODataSerializer:
     """Shared OData value serialization utilities.
@@ -150,6 +160,92 @@ class ODataSerializer:
                 )
             return quote(str_value, safe="")
 
+    @staticmethod
+    def serialize_payload(
+        data: Dict[str, Any], entity_schema: Optional["PublicEntityInfo"] = None
+    ) -> Dict[str, Any]:
+        """Serialize an entity record into a JSON-compatible OData request body.
+
+        Python values that ``json`` cannot encode (datetime, date, Decimal, UUID,
+        Enum, bytes) are converted to their OData JSON representation. When a
+        schema is available, the property data type decides how ambiguous values
+        are written (e.g. a whole Decimal sent to an integer property).
+
+        Args:
+            data: Entity record keyed by property name
+            entity_schema: Optional entity schema for type-aware serialization
+
+        Returns:
+            New dictionary safe to pass to ``json.dumps``
+        """
+        property_lookup = (
+            {prop.name: prop for prop in entity_schema.properties}
+            if entity_schema
+            else {}
+        )
+
+        payload = {}
+        for field_name, field_value in data.items():
+            prop = property_lookup.get(field_name)
+            payload[field_name] = ODataSerializer._serialize_json_value(
+                field_value, prop.data_type if prop else None
+            )
+        return payload
+
+    @staticmethod
+    def _serialize_json_value(value: Any, data_type: Optional[str]) -> Any:
+        """Convert a single value to its OData JSON representation.
+
+        Args:
+            value: The value to convert
+            data_type: Optional simplified data type of the target property
+
+        Returns:
+            JSON-compatible value
+        """
+        if value is None or isinstance(value, (bool, str)):
+            return value
+
+        if isinstance(value, Enum):
+            # D365 F&O accepts enum members by symbol name in JSON payloads
+            return value.name
+
+        if isinstance(value, datetime):
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+        if isinstance(value, date):
+            # Date-only values are exposed as Edm.DateTimeOffset at midnight UTC
+            return f"{value.isoformat()}T00:00:00Z"
+
+        if isinstance(value, time):
+            return value.isoformat()
+
+        if isinstance(value, Decimal):
+            # Sent as a string, as in URLs, so no precision is lost to a float;
+            # a whole number bound for an integer property stays a number
+            if data_type in _INTEGER_TYPES and value == value.to_integral_value():
+                return int(value)
+            return str(value)
+
+        if isinstance(value, UUID):
+            return str(value)
+
+        if isinstance(value, (bytes, bytearray)):
+            return base64.b64encode(bytes(value)).decode("ascii")
+
+        if isinstance(value, dict):
+            return {
+                k: ODataSerializer._serialize_json_value(v, None)
+                for k, v in value.items()
+            }
+
+        if isinstance(value, (list, tuple)):
+            return [ODataSerializer._serialize_json_value(v, None) for v in value]
+
+        return value
+
     @staticmethod
     def serialize_key_dict(
         key_dict: Dict[str, Any], entity_schema: Optional["PublicEntityInfo"] = None
@@ -0,0 +1,84 @@
+"""Retry policy for throttled and unavailable D365 F&O responses.
+
+D365 F&O priority-based throttling rejects requests with ``429 Too Many
+Requests`` and a ``Retry-After`` header; transient service unavailability
+surfaces as ``503``. Retries use decorrelated jitter so concurrent clients do
+not retry in lockstep.
+"""
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+# Methods that can be safely re-sent after an ambiguous failure
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+@dataclass
+class RetryPolicy:
+    """Retry settings for one class of operations
+
+    Attributes:
+        max_retries: Maximum number of retries after the first attempt
+        base_delay: Minimum delay between attempts in seconds
+        max_delay: Maximum delay between attempts in seconds. A ``Retry-After``
+            longer than this is not waited for; the response is returned as is.
+        retry_statuses: HTTP status codes that trigger a retry
+    """
+
+    max_retries: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    retry_statuses: FrozenSet[int] = field(
+        default_factory=lambda: frozenset({429, 503})
+    )
+
+    def should_retry(self, status: int, retries: int) -> bool:
+        """Check whether a response status warrants another attempt"""
+        return status in self.retry_statuses and retries < self.max_retries
+
+    def next_delay(self, previous_delay: float) -> float:
+        """Return the next delay using decorrelated jitter
+
+        ``sleep = min(max_delay, uniform(base_delay, previous_delay * 3))``
+        """
+        upper = max(self.base_delay, previous_delay * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+    def to_dict(self) -> dict:
+        return {
+            "max_retries": self.max_retries,
+            "base_delay": self.base_delay,
+            "max_delay": self.max_delay,
+            "retry_statuses": sorted(self.retry_statuses),
+        }
+
+
+def parse_retry_after(header_value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header into seconds
+
+    Both forms allowed by RFC 9110 are supported: delta-seconds (``120``) and
+    an HTTP date (``Wed, 21 Oct 2015 07:28:00 GMT``).
+
+    Args:
+        header_value: Raw ``Retry-After`` header string
+
+    Returns:
+        Seconds to wait (never negative), or None if absent or unparseable
+    """
+    if not header_value or not isinstance(header_value, str):
+        return None
+    value = header_value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -1,14 +1,22 @@
 """HTTP session management for D365 F&O client."""
 
+import asyncio
 import logging
+import random
+import re
+import time
 import uuid
+import weakref
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 import aiohttp
 
 from .auth import AuthenticationManager
+from .limiter import AdaptiveConcurrencyLimiter
 from .models import FOClientConfig
+from .retry import IDEMPOTENT_METHODS, RetryPolicy, parse_retry_after
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +51,48 @@ def _parse_server_timing(header_value: Optional[str]) -> Optional[float]:
     return None
 
 
+def _latency_endpoint(request: aiohttp.ClientRequest) -> str:
+    """Key grouping requests whose latencies are comparable.
+
+    Method plus URL path with OData key predicates removed, so
+    ``GET /data/Customers('US-001')`` and ``GET /data/Customers('US-002')``
+    share a baseline while ``POST /data/$batch`` keeps its own.
+    """
+    path = re.sub(r"\([^)]*\)", "", request.url.path)
+    return f"{request.method} {path}"
+
+
+def _accept_encoding() -> str:
+    """Return the Accept-Encoding value for the codecs aiohttp can decode.
+
+    Brotli is only advertised when a brotli package is installed, since
+    aiohttp cannot decompress ``br`` responses otherwise.
+    """
+    encodings = ["gzip", "deflate"]
+    try:
+        from aiohttp.compression_utils import HAS_BROTLI
+    except ImportError:
+        HAS_BROTLI = False
+    if HAS_BROTLI:
+        encodings.append("br")
+    return ", ".join(encodings)
+
+
+def _pool_occupancy(connector: aiohttp.BaseConnector) -> Dict[str, Optional[int]]:
+    """Return acquired/idle/open connection counts of a connector
+
+    aiohttp has no public accessor for pool occupancy, so its private
+    attributes are read defensively; counts are None if they are missing or
+    have changed shape.
+    """
+    try:
+        acquired = len(connector._acquired)
+        idle = sum(len(conns) for conns in connector._conns.values())
+    except (AttributeError, TypeError):
+        return {"acquired": None, "idle": None, "open": None}
+    return {"acquired": acquired, "idle": idle, "open": acquired + idle}
+
+
 def _load_or_create_trace_client_id(override: Optional[str]) -> str:
     """Return the trace client ID, honouring this resolution order:
 
@@ -71,6 +121,27 @@ def _load_or_create_trace_client_id(override: Optional[str]) -> str:
     return new_id
 
 
+@dataclass
+class ConnectionPoolStats:
+    """Counters describing how requests obtained pooled connections"""
+
+    connections_created: int = 0
+    connections_reused: int = 0
+    queued: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "queued": self.queued,
+            "total_wait_ms": round(self.total_wait_ms, 3),
+            "avg_wait_ms": round(self.total_wait_ms / self.queued, 3) if self.queued else 0.0,
+            "max_wait_ms": round(self.max_wait_ms, 3),
+        }
+
+
 class SessionManager:
     """Manages HTTP sessions with authentication"""
 
@@ -95,6 +166,34 @@ class SessionManager:
         else:
             self._trace_client_id = ""
 
+        # Retry policies per operation class. Non-idempotent requests are only
+        # retried on 429, which D365FO returns before executing the request.
+        self.retry_policies: Dict[str, RetryPolicy] = {
+            "idempotent": RetryPolicy(
+                max_retries=config.max_retries,
+                base_delay=config.retry_backoff_base,
+                max_delay=config.retry_backoff_max,
+            ),
+            "non_idempotent": RetryPolicy(
+                max_retries=config.max_retries,
+                base_delay=config.retry_backoff_base,
+                max_delay=config.retry_backoff_max,
+                retry_statuses=frozenset({429}),
+            ),
+        }
+        self.total_retries = 0
+        self._response_retries: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+        # Adaptive limit on concurrent requests, shared by every call site
+        self.concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None
+        if config.enable_adaptive_concurrency:
+            self.concurrency_limiter = AdaptiveConcurrencyLimiter(
+                initial_limit=config.initial_concurrency_limit,
+                max_limit=config.max_concurrency_limit,
+            )
+
+        self.pool_stats = ConnectionPoolStats()
+
     @property
     def trace_client_id(self) -> str:
         """Stable GUID that identifies this d365fo-client instance."""
@@ -112,31 +211,205 @@ class SessionManager:
         return {"x-ms-client-request-id": str(uuid.uuid4())}
 
     async def get_session(self) -> aiohttp.ClientSession:
-        """Get HTTP session with auth headers
+        """Get the shared HTTP session
+
+        The session is created once with the configured connection pool and
+        static headers. The Authorization header is attached to each request
+        by a client middleware instead of being written into the shared
+        session headers, so concurrent callers never race on a token update.
+        The auth middleware runs inside the retry middleware, so every retry
+        attempt is sent with a token read from ``get_token()`` at that time.
 
         Returns:
             Configured aiohttp ClientSession
         """
         if self._session is None or self._session.closed:
-            connector = aiohttp.TCPConnector(ssl=self.config.verify_ssl)
-            timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+            self._session = aiohttp.ClientSession(
+                connector=self._create_connector(),
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
+                headers=self._default_headers(),
+                middlewares=(self._retry_middleware, self._auth_middleware),
+                trace_configs=[self._create_trace_config()],
+            )
 
-        # Update headers with fresh token
-        token = await self.auth_manager.get_token()
+        return self._session
+
+    def _create_connector(self) -> aiohttp.TCPConnector:
+        """Build the pooled connector from the connection settings"""
+        return aiohttp.TCPConnector(
+            ssl=self.config.verify_ssl,
+            limit=self.config.connection_pool_size,
+            limit_per_host=self.config.connection_pool_size_per_host,
+            keepalive_timeout=self.config.keepalive_timeout,
+            ttl_dns_cache=self.config.dns_cache_ttl,
+            use_dns_cache=self.config.dns_cache_ttl != 0,
+            happy_eyeballs_delay=self.config.happy_eyeballs_delay,
+        )
+
+    def _default_headers(self) -> Dict[str, str]:
+        """Headers that are identical for every request of this session"""
         headers: Dict[str, str] = {
-            "Authorization": f"Bearer {token}",
             "Accept": "application/json",
             "Content-Type": "application/json",
         }
+        if self.config.enable_compression:
+            headers["Accept-Encoding"] = _accept_encoding()
+        else:
+            headers["Accept-Encoding"] = "identity"
 
         # Stable session-level tracing header (same for every request in this session)
         if self.config.enable_request_tracing and self._trace_client_id:
             headers["x-ms-client-session-id"] = self._trace_client_id
 
-        self._session.headers.update(headers)
+        return headers
 
-        return self._session
+    async def _auth_middleware(
+        self, request: aiohttp.ClientRequest, handler
+    ) -> aiohttp.ClientResponse:
+        """Client middleware attaching a bearer token to each request."""
+        token = await self.auth_manager.get_token()
+        request.headers["Authorization"] = f"Bearer {token}"
+        return await handler(request)
+
+    def _create_trace_config(self) -> aiohttp.TraceConfig:
+        """Trace hooks feeding the connection pool counters"""
+        stats = self.pool_stats
+
+        async def on_queued_start(session, ctx, params):
+            ctx.queued_at = time.monotonic()
+
+        async def on_queued_end(session, ctx, params):
+            wait_ms = (time.monotonic() - ctx.queued_at) * 1000
+            stats.queued += 1
+            stats.total_wait_ms += wait_ms
+            stats.max_wait_ms = max(stats.max_wait_ms, wait_ms)
+
+        async def on_create_end(session, ctx, params):
+            stats.connections_created += 1
+
+        async def on_reuse(session, ctx, params):
+            stats.connections_reused += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_queued_start.append(on_queued_start)
+        trace_config.on_connection_queued_end.append(on_queued_end)
+        trace_config.on_connection_create_end.append(on_create_end)
+        trace_config.on_connection_reuseconn.append(on_reuse)
+        return trace_config
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Return connection pool usage for sizing the pool.
+
+        ``acquired`` connections are serving a request, ``idle`` ones are kept
+        alive for reuse, and ``queued``/``*_wait_ms`` show how often and how
+        long requests waited for a free connection. The reuse and wait
+        counters come from trace hooks; ``acquired``, ``idle`` and ``open``
+        are None if the installed aiohttp doesn't expose pool occupancy.
+        """
+        stats: Dict[str, Any] = {
+            "limit": self.config.connection_pool_size,
+            "limit_per_host": self.config.connection_pool_size_per_host,
+            "acquired": 0,
+            "idle": 0,
+            "open": 0,
+        }
+        connector = self._session.connector if self._session else None
+        if connector is not None and not connector.closed:
+            stats.update(_pool_occupancy(connector))
+        stats.update(self.pool_stats.to_dict())
+        return stats
+
+    def get_retry_policy(self, method: str) -> RetryPolicy:
+        """Return the retry policy for an HTTP method's operation class."""
+        if method.upper() in IDEMPOTENT_METHODS:
+            return self.retry_policies["idempotent"]
+        return self.retry_policies["non_idempotent"]
+
+    def get_retry_count(self, response: aiohttp.ClientResponse) -> int:
+        """Return how many retries preceded the given response."""
+        try:
+            return self._response_retries.get(response, 0)
+        except TypeError:
+            return 0
+
+    async def _retry_middleware(
+        self, request: aiohttp.ClientRequest, handler
+    ) -> aiohttp.ClientResponse:
+        """Client middleware retrying throttled/unavailable responses.
+
+        Honours ``Retry-After`` when present and otherwise backs off with
+        decorrelated jitter. Every call site using the managed session gets
+        the same behaviour without having to opt in.
+        """
+        policy = self.get_retry_policy(request.method)
+        delay = policy.base_delay
+        retries = 0
+
+        while True:
+            response = await self._send_limited(request, handler)
+            if not policy.should_retry(response.status, retries):
+                break
+
+            delay = policy.next_delay(delay)
+            wait = delay
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                if retry_after > policy.max_delay:
+                    logger.debug(
+                        "%s %s: Retry-After %.1fs exceeds max delay, not retrying",
+                        request.method, request.url, retry_after,
+                    )
+                    break
+                wait = retry_after + random.uniform(0, policy.base_delay)
+
+            retries += 1
+            self.total_retries += 1
+            logger.debug(
+                "%s %s: retry %d/%d after %d, waiting %.2fs x-ms-client-request-id=%s",
+                request.method,
+                request.url,
+                retries,
+                policy.max_retries,
+                response.status,
+                wait,
+                request.headers.get("x-ms-client-request-id", "n/a"),
+            )
+            response.release()
+            await asyncio.sleep(wait)
+
+        if retries:
+            self._response_retries[response] = retries
+        return response
+
+    async def _send_limited(
+        self, request: aiohttp.ClientRequest, handler
+    ) -> aiohttp.ClientResponse:
+        """Send one attempt through the adaptive concurrency limiter.
+
+        The server-reported ``server-timing`` duration drives the limiter; the
+        measured time to response headers is used when it is absent. Latency
+        is compared per endpoint (see ``_latency_endpoint``).
+        """
+        if self.concurrency_limiter is None:
+            return await handler(request)
+
+        async with self.concurrency_limiter.acquire():
+            started = time.monotonic()
+            response = await handler(request)
+            latency_ms = _parse_server_timing(response.headers.get("server-timing"))
+            if latency_ms is None:
+                latency_ms = (time.monotonic() - started) * 1000
+            self.concurrency_limiter.record(
+                response.status, latency_ms, _latency_endpoint(request)
+            )
+        return response
+
+    def get_concurrency_stats(self) -> Dict[str, object]:
+        """Return adaptive concurrency limiter state and retry totals."""
+        stats: Dict[str, object] = {"total_retries": self.total_retries}
+        if self.concurrency_limiter is not None:
+            stats["concurrency"] = self.concurrency_limiter.get_stats()
+        return stats
 
     async def close(self):
         """Close the HTTP session"""
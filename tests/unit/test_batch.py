@@ -0,0 +1,240 @@
+"""Unit tests for OData $batch request building and response parsing."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from d365fo_client.batch import BatchRequest, build_batch_body, parse_batch_response
+from d365fo_client.crud import CrudOperations
+from d365fo_client.exceptions import EntityError
+from d365fo_client.models import FOClientConfig
+from d365fo_client.session import SessionManager
+
+BASE_URL = "https://test.dynamics.com"
+
+
+def _response_body(boundary: str, parts) -> str:
+    lines = []
+    for part in parts:
+        lines.append(f"--{boundary}")
+        lines.extend(part)
+    lines.append(f"--{boundary}--")
+    return "\r\n".join(lines)
+
+
+def _changeset_response(boundary: str, responses) -> list:
+    """responses: list of (content_id, status line, body)"""
+    inner = []
+    for content_id, status, body in responses:
+        inner.append(f"--{boundary}")
+        inner.extend(
+            [
+                "Content-Type: application/http",
+                "Content-Transfer-Encoding: binary",
+                f"Content-ID: {content_id}",
+                "",
+                f"HTTP/1.1 {status}",
+                "Content-Type: application/json; odata.metadata=minimal",
+                "",
+                body,
+            ]
+        )
+    inner.append(f"--{boundary}--")
+    return [f"Content-Type: multipart/mixed; boundary={boundary}", ""] + inner
+
+
+class TestBatchRequest:
+    def test_writes_get_their_own_changesets(self):
+        batch = BatchRequest()
+        batch.add_create("CustomersV3", {"CustomerAccount": "C1"})
+        batch.add_create("CustomersV3", {"CustomerAccount": "C2"})
+        batch.add_get("CustomersV3", "C1")
+
+        assert [len(g) for g in batch.groups()] == [1, 1, 1]
+
+    def test_changeset_groups_operations(self):
+        batch = BatchRequest()
+        with batch.changeset():
+            batch.add_create("CustomersV3", {"CustomerAccount": "C1"})
+            batch.add_delete("CustomersV3", "C2")
+        batch.add_create("CustomersV3", {"CustomerAccount": "C3"})
+
+        assert [len(g) for g in batch.groups()] == [2, 1]
+
+    def test_get_inside_changeset_is_rejected(self):
+        batch = BatchRequest()
+        with pytest.raises(ValueError):
+            with batch.changeset():
+                batch.add_get("CustomersV3")
+
+    def test_chunks_respect_limit_without_splitting_changesets(self):
+        batch = BatchRequest()
+        for i in range(5):
+            batch.add_create("CustomersV3", {"CustomerAccount": f"C{i}"})
+        with batch.changeset():
+            for i in range(3):
+                batch.add_delete("CustomersV3", f"D{i}")
+
+        chunks = batch.chunks(max_operations=2)
+        sizes = [sum(len(g) for g in chunk) for chunk in chunks]
+        assert sizes == [2, 2, 1, 3]
+
+    def test_body_contains_operations(self):
+        batch = BatchRequest()
+        batch.add_create("CustomersV3", {"CustomerAccount": "C1"})
+        batch.add_update(
+            "CustomersV3",
+            {"dataAreaId": "usmf", "CustomerAccount": "C1"},
+            {"Name": "X"},
+        )
+        batch.add_get("CustomersV3", "C1")
+
+        content_type, body = build_batch_body(batch.groups(), BASE_URL)
+
+        assert content_type.startswith("multipart/mixed; boundary=batch_")
+        assert f"POST {BASE_URL}/data/CustomersV3 HTTP/1.1" in body
+        assert "PATCH " in body and "cross-company=true" in body
+        assert f"GET {BASE_URL}/data/CustomersV3('C1') HTTP/1.1" in body
+        assert '{"CustomerAccount": "C1"}' in body
+        assert "Content-ID: 1" in body and "Content-ID: 2" in body
+        assert body.count("changeset_") >= 4
+
+
+class TestParseBatchResponse:
+    def test_maps_results_by_content_id(self):
+        batch = BatchRequest()
+        with batch.changeset():
+            batch.add_create("CustomersV3", {"CustomerAccount": "C1"})
+            batch.add_delete("CustomersV3", "C2")
+        batch.add_get("CustomersV3", "C1")
+
+        body = _response_body(
+            "batchresponse_1",
+            [
+                _changeset_response(
+                    "changesetresponse_1",
+                    [
+                        ("2", "204 No Content", ""),
+                        ("1", "201 Created", '{"CustomerAccount": "C1"}'),
+                    ],
+                ),
+                [
+                    "Content-Type: application/http",
+                    "Content-Transfer-Encoding: binary",
+                    "",
+                    "HTTP/1.1 404 Not Found",
+                    "Content-Type: application/json",
+                    "",
+                    '{"error": {"message": "missing"}}',
+                ],
+            ],
+        )
+
+        results = parse_batch_response(
+            "multipart/mixed; boundary=batchresponse_1", body, batch.groups()
+        )
+
+        assert [r.status_code for r in results] == [201, 204, 404]
+        assert results[0].data == {"CustomerAccount": "C1"}
+        assert results[1].success and results[1].data == {"success": True}
+        assert not results[2].success
+        assert "404" in results[2].error
+
+    def test_failed_changeset_marks_all_operations(self):
+        batch = BatchRequest()
+        with batch.changeset():
+            batch.add_create("CustomersV3", {"CustomerAccount": "C1"})
+            batch.add_create("CustomersV3", {"CustomerAccount": "C2"})
+
+        body = _response_body(
+            "batchresponse_2",
+            [
+                [
+                    "Content-Type: application/http",
+                    "Content-Transfer-Encoding: binary",
+                    "",
+                    "HTTP/1.1 400 Bad Request",
+                    "",
+                    "Write failed for table row",
+                ]
+            ],
+        )
+
+        results = parse_batch_response(
+            'multipart/mixed; boundary="batchresponse_2"', body, batch.groups()
+        )
+
+        assert len(results) == 2
+        assert all(not r.success and r.status_code == 400 for r in results)
+
+
+class TestExecuteBatch:
+    def _make_session_manager(self) -> SessionManager:
+        mock_auth = MagicMock()
+        mock_auth.get_token = AsyncMock(return_value="tok")
+        return SessionManager(FOClientConfig(base_url=BASE_URL), mock_auth)
+
+    @pytest.mark.asyncio
+    async def test_auto_chunks_requests(self):
+        batch = BatchRequest()
+        for i in range(3):
+            batch.add_create("CustomersV3", {"CustomerAccount": f"C{i}"})
+
+        bodies = []
+
+        def post(url, data=None, headers=None):
+            bodies.append(data.decode())
+            ids = [
+                line.split(":")[1].strip()
+                for line in data.decode().split("\r\n")
+                if line.startswith("Content-ID")
+            ]
+            parts = [
+                _changeset_response(
+                    f"cs_{cid}", [(cid, "201 Created", '{"ok": %s}' % cid)]
+                )
+                for cid in ids
+            ]
+            response = AsyncMock()
+            response.status = 200
+            response.headers = {"content-type": "multipart/mixed; boundary=resp"}
+            response.text = AsyncMock(return_value=_response_body("resp", parts))
+            response.__aenter__ = AsyncMock(return_value=response)
+            response.__aexit__ = AsyncMock(return_value=False)
+            assert url == f"{BASE_URL}/data/$batch"
+            assert headers["Content-Type"].startswith("multipart/mixed")
+            return response
+
+        session = MagicMock()
+        session.post = MagicMock(side_effect=post)
+        sm = self._make_session_manager()
+
+        with patch.object(sm, "get_session", return_value=session):
+            crud = CrudOperations(sm, BASE_URL)
+            results = await crud.execute_batch(batch, max_operations_per_request=2)
+
+        assert len(bodies) == 2
+        assert [r.index for r in results] == [0, 1, 2]
+        assert [r.data for r in results] == [{"ok": 1}, {"ok": 2}, {"ok": 3}]
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_raises(self):
+        batch = BatchRequest()
+        batch.add_create("CustomersV3", {"CustomerAccount": "C1"})
+
+        response = AsyncMock()
+        response.status = 400
+        response.headers = {"ms-dyn-aid": "aid-1"}
+        response.text = AsyncMock(return_value="Malformed batch")
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=False)
+        session = MagicMock()
+        session.post = MagicMock(return_value=response)
+        sm = self._make_session_manager()
+
+        with patch.object(sm, "get_session", return_value=session):
+            crud = CrudOperations(sm, BASE_URL)
+            with pytest.raises(EntityError) as exc_info:
+                await crud.execute_batch(batch)
+
+        assert exc_info.value.activity_id == "aid-1"
@@ -0,0 +1,251 @@
+"""Unit tests for the bulk write pipeline."""
+
+import asyncio
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from types import SimpleNamespace
+
+import pytest
+
+from d365fo_client.batch import BatchOperationResult
+from d365fo_client.bulk import BulkWriter
+from d365fo_client.exceptions import EntityError
+from d365fo_client.models import PublicEntityInfo, PublicEntityPropertyInfo
+from d365fo_client.odata_serializer import ODataSerializer
+
+
+class NoYes(Enum):
+    No = 0
+    Yes = 1
+
+
+def _schema() -> PublicEntityInfo:
+    return PublicEntityInfo(
+        name="Customer",
+        entity_set_name="CustomersV3",
+        properties=[
+            PublicEntityPropertyInfo(
+                name="dataAreaId",
+                type_name="Edm.String",
+                data_type="String",
+                is_key=True,
+            ),
+            PublicEntityPropertyInfo(
+                name="CustomerAccount",
+                type_name="Edm.String",
+                data_type="String",
+                is_key=True,
+            ),
+            PublicEntityPropertyInfo(
+                name="CreditLimit", type_name="Edm.Decimal", data_type="Decimal"
+            ),
+            PublicEntityPropertyInfo(
+                name="Reference", type_name="Edm.String", data_type="String"
+            ),
+        ],
+    )
+
+
+class FakeCrudOperations:
+    def __init__(self, fail_accounts=(), delay: float = 0.0):
+        self.fail_accounts = set(fail_accounts)
+        self.delay = delay
+        self.created = []
+        self.updated = []
+        self.batches = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _enter(self):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+
+    async def create_entity(self, entity_name, data, entity_schema=None):
+        await self._enter()
+        account = data.get("CustomerAccount")
+        if account in self.fail_accounts:
+            raise EntityError("CREATE failed: 400 - invalid", status_code=400)
+        self.created.append(data)
+        return data
+
+    async def update_entity(
+        self, entity_name, key, data, method="PATCH", entity_schema=None
+    ):
+        await self._enter()
+        self.updated.append((key, data, method))
+        return {"success": True}
+
+    async def execute_batch(self, batch, max_operations_per_request=100):
+        await self._enter()
+        self.batches.append(len(batch))
+        results = []
+        for operation in batch.operations:
+            account = operation.data.get("CustomerAccount")
+            failed = account in self.fail_accounts
+            results.append(
+                BatchOperationResult(
+                    index=operation.index,
+                    method=operation.method,
+                    entity_name=operation.entity_name,
+                    status_code=400 if failed else 201,
+                    success=not failed,
+                    data=None if failed else operation.data,
+                    error="invalid" if failed else None,
+                )
+            )
+        return results
+
+
+class TestSerializePayload:
+    def test_converts_non_json_values(self):
+        payload = ODataSerializer.serialize_payload(
+            {
+                "CustomerAccount": "C1",
+                "CreditLimit": Decimal("1500.50"),
+                "Reference": Decimal("42"),
+                "Blocked": NoYes.Yes,
+                "Created": datetime(2024, 3, 1, 12, 30, tzinfo=timezone.utc),
+                "DueDate": date(2024, 4, 1),
+                "Missing": None,
+            },
+            _schema(),
+        )
+
+        assert payload == {
+            "CustomerAccount": "C1",
+            "CreditLimit": "1500.50",
+            "Reference": "42",
+            "Blocked": "Yes",
+            "Created": "2024-03-01T12:30:00Z",
+            "DueDate": "2024-04-01T00:00:00Z",
+            "Missing": None,
+        }
+
+    def test_whole_decimal_for_integer_property_is_a_number(self):
+        schema = PublicEntityInfo(
+            name="Line",
+            entity_set_name="Lines",
+            properties=[
+                PublicEntityPropertyInfo(
+                    name="LineNumber", type_name="Edm.Int64", data_type="Int64"
+                )
+            ],
+        )
+        payload = ODataSerializer.serialize_payload(
+            {"LineNumber": Decimal("3"), "Quantity": Decimal("3")}, schema
+        )
+        assert payload == {"LineNumber": 3, "Quantity": "3"}
+
+    def test_naive_datetime_is_treated_as_utc(self):
+        payload = ODataSerializer.serialize_payload({"At": datetime(2024, 1, 1)})
+        assert payload["At"] == "2024-01-01T00:00:00Z"
+
+
+class TestBulkWriter:
+    @pytest.mark.asyncio
+    async def test_captures_per_record_failures_without_aborting(self):
+        crud = FakeCrudOperations(fail_accounts={"C2"})
+        records = [{"CustomerAccount": f"C{i}"} for i in range(5)]
+
+        async with BulkWriter(crud, "CustomersV3", max_concurrency=2) as writer:
+            await writer.write_many(records)
+
+        assert writer.stats.submitted == 5
+        assert writer.stats.succeeded == 4
+        assert writer.stats.failed == 1
+        assert writer.stats.in_flight == 0
+        assert [r.index for r in writer.results] == [0, 1, 2, 3, 4]
+        assert writer.failures[0].index == 2
+        assert writer.failures[0].status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        crud = FakeCrudOperations(delay=0.005)
+
+        async with BulkWriter(crud, "CustomersV3", max_concurrency=3) as writer:
+            for i in range(12):
+                await writer.write({"CustomerAccount": f"C{i}"})
+
+        assert len(crud.created) == 12
+        assert crud.max_in_flight <= 3
+        assert writer.stats.records_per_second > 0
+
+    @pytest.mark.asyncio
+    async def test_retries_are_taken_from_session_manager(self):
+        crud = FakeCrudOperations()
+        crud.session_manager = SimpleNamespace(total_retries=7)
+
+        async def create_with_session_retry(entity_name, data, entity_schema=None):
+            if data["CustomerAccount"] == "C1":
+                crud.session_manager.total_retries += 2
+            return data
+
+        crud.create_entity = create_with_session_retry
+
+        async with BulkWriter(crud, "CustomersV3", max_concurrency=1) as writer:
+            await writer.write_many(
+                [{"CustomerAccount": "C0"}, {"CustomerAccount": "C1"}]
+            )
+
+        assert writer.stats.succeeded == 2
+        assert writer.stats.retries == 2
+
+    @pytest.mark.asyncio
+    async def test_update_derives_key_from_schema(self):
+        crud = FakeCrudOperations()
+
+        async with BulkWriter(
+            crud, "CustomersV3", operation="update", entity_schema=_schema()
+        ) as writer:
+            await writer.write(
+                {
+                    "dataAreaId": "usmf",
+                    "CustomerAccount": "C1",
+                    "CreditLimit": Decimal("10"),
+                }
+            )
+            await writer.write({"CreditLimit": 5})
+
+        key, body, method = crud.updated[0]
+        assert key == {"dataAreaId": "usmf", "CustomerAccount": "C1"}
+        assert body == {"CreditLimit": "10"}
+        assert method == "PATCH"
+        assert writer.stats.failed == 1
+        assert "missing key fields" in writer.failures[0].error
+
+    @pytest.mark.asyncio
+    async def test_batch_mode_packs_records(self):
+        crud = FakeCrudOperations(fail_accounts={"C3"})
+        records = [{"CustomerAccount": f"C{i}"} for i in range(10)]
+
+        async with BulkWriter(
+            crud, "CustomersV3", max_concurrency=1, use_batch=True, batch_size=4
+        ) as writer:
+            await writer.write_many(records)
+
+        assert sum(crud.batches) == 10
+        assert max(crud.batches) <= 4
+        assert writer.stats.succeeded == 9
+        assert [r.index for r in writer.failures] == [3]
+
+    @pytest.mark.asyncio
+    async def test_schema_loader_is_used_on_entry(self):
+        crud = FakeCrudOperations()
+        loaded = []
+
+        async def loader(entity_name):
+            loaded.append(entity_name)
+            return _schema()
+
+        async with BulkWriter(crud, "CustomersV3", schema_loader=loader) as writer:
+            await writer.write({"CustomerAccount": "C1", "Reference": Decimal("7")})
+
+        assert loaded == ["CustomersV3"]
+        assert crud.created == [{"CustomerAccount": "C1", "Reference": "7"}]
+
+    def test_rejects_unknown_operation(self):
+        with pytest.raises(ValueError):
+            BulkWriter(FakeCrudOperations(), "CustomersV3", operation="upsert")
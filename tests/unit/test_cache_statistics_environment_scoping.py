@@ -129,6 +129,9 @@ class TestCacheStatisticsEnvironmentScoping:
                 != stats2["current_version"]["global_version_id"]
             )
 
+            await cache1.close()
+            await cache2.close()
+
     @pytest.mark.asyncio
     async def test_database_statistics_methods_compatibility(self):
         """Test that both get_database_statistics and get_statistics work"""
@@ -157,6 +160,8 @@ class TestCacheStatisticsEnvironmentScoping:
             total_envs = global_stats["environment_statistics"]["total_environments"]
             assert total_envs >= 0  # May be 0 if no active environment versions exist
 
+            await cache.close()
+
     @pytest.mark.asyncio
     async def test_version_manager_environment_scoping(self):
         """Test that version manager statistics are properly scoped"""
@@ -178,3 +183,5 @@ class TestCacheStatisticsEnvironmentScoping:
             # Global stats may show 0 environments if no environment versions are registered
             total_envs = global_stats["total_environments"]
             assert total_envs >= 0  # May be 0 if no environment versions exist
+
+            await cache.close()
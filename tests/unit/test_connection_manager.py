@@ -0,0 +1,123 @@
+"""Unit tests for the metadata database connection manager."""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from d365fo_client.metadata_v2.connection_manager import (
+    ConnectionManager,
+    SQLiteTuning,
+    read_sqlite_settings,
+)
+
+
+@pytest.fixture
+async def connections(tmp_path):
+    manager = ConnectionManager(tmp_path / "metadata.db", max_readers=2)
+    async with manager.writer() as db:
+        await db.execute("PRAGMA journal_mode = WAL")
+        await db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    yield manager
+    await manager.close()
+
+
+class TestConnectionManager:
+    async def test_connections_are_reused(self, connections):
+        for i in range(5):
+            async with connections.writer() as db:
+                await db.execute("INSERT INTO items (name) VALUES (?)", (f"item{i}",))
+            async with connections.reader() as db:
+                cursor = await db.execute("SELECT COUNT(*) FROM items")
+                assert (await cursor.fetchone())[0] == i + 1
+
+        stats = connections.get_stats()
+        assert stats["connections_opened"] == 2
+        assert stats["reads"] == 5
+        assert stats["writes"] == 6
+
+    async def test_readers_are_read_only(self, connections):
+        async with connections.reader() as db:
+            with pytest.raises(sqlite3.OperationalError):
+                await db.execute("INSERT INTO items (name) VALUES ('x')")
+
+    async def test_writer_rolls_back_on_error(self, connections):
+        with pytest.raises(RuntimeError):
+            async with connections.writer() as db:
+                await db.execute("INSERT INTO items (name) VALUES ('lost')")
+                raise RuntimeError("boom")
+
+        async with connections.reader() as db:
+            cursor = await db.execute("SELECT COUNT(*) FROM items")
+            assert (await cursor.fetchone())[0] == 0
+
+    async def test_reader_pool_is_bounded(self, connections):
+        peak = 0
+        active = 0
+
+        async def read():
+            nonlocal peak, active
+            async with connections.reader() as db:
+                active += 1
+                peak = max(peak, active)
+                await db.execute("SELECT 1")
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(read() for _ in range(6)))
+
+        assert peak == 2
+        assert connections.get_stats()["open_readers"] == 2
+
+    async def test_reopens_after_close(self, connections):
+        await connections.close()
+        assert connections.get_stats()["open_readers"] == 0
+        assert connections.get_stats()["writer_open"] is False
+
+        async with connections.reader() as db:
+            cursor = await db.execute("SELECT COUNT(*) FROM items")
+            assert (await cursor.fetchone())[0] == 0
+
+
+class TestSQLiteTuning:
+    async def test_profile_applied_to_every_connection(self, tmp_path):
+        tuning = SQLiteTuning(cache_size_mb=8, mmap_size_mb=16, busy_timeout_ms=1234)
+        manager = ConnectionManager(tmp_path / "tuned.db", tuning=tuning)
+        try:
+            async with manager.writer() as db:
+                writer_settings = await read_sqlite_settings(db)
+            async with manager.reader() as db:
+                reader_settings = await read_sqlite_settings(db)
+        finally:
+            await manager.close()
+
+        for settings in (writer_settings, reader_settings):
+            assert settings["journal_mode"] == "wal"
+            assert settings["synchronous"] == "NORMAL"
+            assert settings["cache_size"] == -8 * 1024
+            assert settings["temp_store"] == "MEMORY"
+            assert settings["busy_timeout"] == 1234
+        assert writer_settings["query_only"] is False
+        assert reader_settings["query_only"] is True
+
+    async def test_periodic_maintenance(self, tmp_path):
+        manager = ConnectionManager(
+            tmp_path / "maintained.db", tuning=SQLiteTuning(maintenance_interval=3)
+        )
+        try:
+            for _ in range(7):
+                async with manager.writer() as db:
+                    await db.execute("CREATE TABLE IF NOT EXISTS t (x)")
+                    await db.execute("INSERT INTO t VALUES (1)")
+        finally:
+            await manager.close()
+
+        assert manager.get_stats()["maintenance_runs"] == 2
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"synchronous": "sometimes"}, {"temp_store": "disk"}, {"busy_timeout_ms": -1}],
+    )
+    def test_invalid_profile(self, kwargs):
+        with pytest.raises(ValueError):
+            SQLiteTuning(**kwargs)
@@ -1,5 +1,8 @@
 """Unit tests for enhanced authentication manager functionality."""
 
+import asyncio
+import threading
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -204,6 +207,93 @@ class TestEnhancedAuthenticationManager:
         # Credential should not be called for cached token
         auth_manager.credential.get_token.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_refresh(self):
+        """Test that concurrent token requests trigger a single acquisition."""
+        config = FOClientConfig(base_url="https://test.dynamics.com")
+        auth_manager = AuthenticationManager(config)
+        threads = []
+
+        def slow_get_token(scope):
+            threads.append(threading.current_thread())
+            time.sleep(0.05)
+            return MagicMock(token="fresh-token", expires_on=time.time() + 3600)
+
+        auth_manager.credential = MagicMock()
+        auth_manager.credential.get_token.side_effect = slow_get_token
+
+        tokens = await asyncio.gather(*(auth_manager.get_token() for _ in range(5)))
+
+        assert tokens == ["fresh-token"] * 5
+        assert auth_manager.credential.get_token.call_count == 1
+        # The blocking credential call must not run on the event loop thread
+        assert threads[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_token_is_refreshed_proactively(self):
+        """Test background refresh once most of the token lifetime has passed."""
+        config = FOClientConfig(base_url="https://test.dynamics.com")
+        auth_manager = AuthenticationManager(config)
+        auth_manager.credential = MagicMock()
+        auth_manager.credential.get_token.return_value = MagicMock(
+            token="new-token", expires_on=time.time() + 3600
+        )
+
+        auth_manager._token = "old-token"
+        auth_manager._token_expires = time.time() + 60
+        auth_manager._token_refresh_at = time.time() - 1
+
+        # Still-valid token is returned immediately while refreshing
+        assert await auth_manager.get_token() == "old-token"
+        await auth_manager._refresh_task
+
+        assert await auth_manager.get_token() == "new-token"
+        assert auth_manager.credential.get_token.call_count == 1
+        assert auth_manager._token_refresh_at < auth_manager._token_expires
+
+    @pytest.mark.asyncio
+    async def test_failed_background_refresh_keeps_token(self):
+        """Test that a failing proactive refresh does not drop a valid token."""
+        config = FOClientConfig(base_url="https://test.dynamics.com")
+        auth_manager = AuthenticationManager(config)
+        auth_manager.credential = MagicMock()
+        auth_manager.credential.get_token.side_effect = RuntimeError("AAD down")
+
+        auth_manager._token = "old-token"
+        auth_manager._token_expires = time.time() + 60
+        auth_manager._token_refresh_at = time.time() - 1
+
+        assert await auth_manager.get_token() == "old-token"
+        await asyncio.gather(auth_manager._refresh_task, return_exceptions=True)
+        assert await auth_manager.get_token() == "old-token"
+
+    @pytest.mark.asyncio
+    async def test_failed_background_refresh_backs_off(self):
+        """Test that a failing proactive refresh is not retried on every call."""
+        config = FOClientConfig(base_url="https://test.dynamics.com")
+        auth_manager = AuthenticationManager(config)
+        auth_manager.credential = MagicMock()
+        auth_manager.credential.get_token.side_effect = RuntimeError("AAD down")
+
+        auth_manager._token = "old-token"
+        auth_manager._token_expires = time.time() + 3600
+        auth_manager._token_refresh_at = time.time() - 1
+
+        for _ in range(10):
+            assert await auth_manager.get_token() == "old-token"
+            await asyncio.gather(auth_manager._refresh_task, return_exceptions=True)
+
+        assert auth_manager.credential.get_token.call_count == 1
+        first_retry_at = auth_manager._token_refresh_at
+        assert first_retry_at > time.time()
+
+        # Once due, the retry runs and a second failure waits twice as long
+        auth_manager._token_refresh_at = time.time() - 1
+        assert await auth_manager.get_token() == "old-token"
+        await asyncio.gather(auth_manager._refresh_task, return_exceptions=True)
+        assert auth_manager.credential.get_token.call_count == 2
+        assert auth_manager._token_refresh_at - time.time() > 9
+
     @pytest.mark.asyncio
     async def test_invalidate_credentials(self):
         """Test credential invalidation functionality."""
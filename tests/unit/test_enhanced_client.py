@@ -234,6 +234,8 @@ class TestCacheFirstFunctionality:
             assert "sync_manager_available" in info
             assert "background_sync_running" in info
 
+            await client.close()
+
     @pytest.mark.asyncio
     async def test_async_search_data_entities_cache_first(self):
         """Test search_data_entities with cache-first approach."""
@@ -265,6 +267,46 @@ class TestCacheFirstFunctionality:
                     assert result == mock_entities
                     mock_cache_first.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_public_schema_lookups_return_copies(self):
+        """Public schema lookups copy the cached schema; CRUD validation does not."""
+        config = FOClientConfig(
+            base_url="https://test.dynamics.com",
+            enable_metadata_cache=True,
+            use_cache_first=True,
+        )
+
+        shared = PublicEntityInfo(
+            name="Customer",
+            entity_set_name="CustomersV3",
+            label_id="@SYS123",
+            label_text=None,
+        )
+
+        with patch("d365fo_client.auth.DefaultAzureCredential"):
+            async with FOClient(config) as client:
+                mock_cache = AsyncMock()
+                mock_cache.get_public_entity_schema.return_value = shared
+                client.metadata_cache = mock_cache
+                client._metadata_initialized = True
+                client._ensure_metadata_initialized = AsyncMock()
+                client.label_ops.get_labels_batch = AsyncMock(
+                    return_value={"@SYS123": "Customer"}
+                )
+                client.crud_ops.get_entities = AsyncMock(return_value={"value": []})
+
+                by_set = await client.get_public_entity_schema_by_entityset(
+                    "CustomersV3"
+                )
+                info = await client.get_public_entity_info("Customer")
+                await client.get_entities("CustomersV3")
+
+                assert by_set == shared and by_set is not shared
+                assert info is not shared
+                assert info.label_text == "Customer"
+                assert shared.label_text is None
+                assert client.crud_ops.get_entities.call_args.args[2] is shared
+
 
 class TestBackgroundSyncLogic:
     """Test background sync logic."""
@@ -0,0 +1,129 @@
+"""Unit tests for streaming entity reads that follow @odata.nextLink."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from d365fo_client.crud import CrudOperations
+from d365fo_client.exceptions import EntityError
+from d365fo_client.models import FOClientConfig, QueryOptions
+from d365fo_client.session import SessionManager
+
+BASE_URL = "https://test.dynamics.com"
+
+
+def _make_session_manager() -> SessionManager:
+    mock_auth = MagicMock()
+    mock_auth.get_token = AsyncMock(return_value="tok")
+    return SessionManager(FOClientConfig(base_url=BASE_URL), mock_auth)
+
+
+def _make_response(status: int, payload=None, text: str = ""):
+    response = AsyncMock()
+    response.status = status
+    response.headers = {}
+    response.json = AsyncMock(return_value=payload)
+    response.text = AsyncMock(return_value=text)
+    response.__aenter__ = AsyncMock(return_value=response)
+    response.__aexit__ = AsyncMock(return_value=False)
+    return response
+
+
+def _make_paged_session(pages):
+    """Return a mock session serving ``pages`` keyed by URL, recording requests."""
+    requested = []
+
+    def get(url, headers=None):
+        requested.append(url)
+        return pages[url]
+
+    session = MagicMock()
+    session.get = MagicMock(side_effect=get)
+    return session, requested
+
+
+class TestIterEntities:
+    @pytest.mark.asyncio
+    async def test_follows_next_link_across_pages(self):
+        first = f"{BASE_URL}/data/CustomersV3?%24top=2"
+        second = f"{BASE_URL}/data/CustomersV3?$skiptoken=2"
+        third = f"{BASE_URL}/data/CustomersV3?$skiptoken=4"
+        session, requested = _make_paged_session(
+            {
+                first: _make_response(
+                    200, {"value": [{"id": 1}, {"id": 2}], "@odata.nextLink": second}
+                ),
+                second: _make_response(
+                    200, {"value": [{"id": 3}, {"id": 4}], "@odata.nextLink": third}
+                ),
+                third: _make_response(200, {"value": [{"id": 5}]}),
+            }
+        )
+        sm = _make_session_manager()
+
+        with patch.object(sm, "get_session", return_value=session):
+            crud = CrudOperations(sm, BASE_URL)
+            records = [
+                r async for r in crud.iter_entities("CustomersV3", QueryOptions(top=2))
+            ]
+
+        assert [r["id"] for r in records] == [1, 2, 3, 4, 5]
+        assert requested == [first, second, third]
+
+    @pytest.mark.asyncio
+    async def test_empty_result_set(self):
+        url = f"{BASE_URL}/data/CustomersV3"
+        session, _ = _make_paged_session({url: _make_response(200, {"value": []})})
+        sm = _make_session_manager()
+
+        with patch.object(sm, "get_session", return_value=session):
+            crud = CrudOperations(sm, BASE_URL)
+            records = [r async for r in crud.iter_entities("CustomersV3")]
+
+        assert records == []
+
+    @pytest.mark.asyncio
+    async def test_error_on_later_page_is_raised(self):
+        first = f"{BASE_URL}/data/CustomersV3"
+        second = f"{BASE_URL}/data/CustomersV3?$skiptoken=1"
+        session, _ = _make_paged_session(
+            {
+                first: _make_response(
+                    200, {"value": [{"id": 1}], "@odata.nextLink": second}
+                ),
+                second: _make_response(500, text="boom"),
+            }
+        )
+        sm = _make_session_manager()
+
+        received = []
+        with patch.object(sm, "get_session", return_value=session):
+            crud = CrudOperations(sm, BASE_URL)
+            with pytest.raises(EntityError, match="500"):
+                async for record in crud.iter_entities("CustomersV3"):
+                    received.append(record)
+
+        assert received == [{"id": 1}]
+
+    @pytest.mark.asyncio
+    async def test_early_exit_stops_prefetching(self):
+        pages = {}
+        for i in range(10):
+            url = f"{BASE_URL}/data/CustomersV3" + (f"?$skiptoken={i}" if i else "")
+            next_link = f"{BASE_URL}/data/CustomersV3?$skiptoken={i + 1}"
+            pages[url] = _make_response(
+                200, {"value": [{"id": i}], "@odata.nextLink": next_link}
+            )
+        session, requested = _make_paged_session(pages)
+        sm = _make_session_manager()
+
+        with patch.object(sm, "get_session", return_value=session):
+            crud = CrudOperations(sm, BASE_URL)
+            stream = crud.iter_entities("CustomersV3", prefetch_pages=1)
+            async for record in stream:
+                if record["id"] == 1:
+                    break
+            await stream.aclose()
+
+        # Two consumed pages plus a bounded number of prefetched ones
+        assert len(requested) <= 4
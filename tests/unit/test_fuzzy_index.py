@@ -0,0 +1,126 @@
+"""Unit tests for the typo-tolerant metadata name index."""
+
+import itertools
+import random
+
+import pytest
+
+from d365fo_client.metadata_v2.fuzzy_index import (
+    FuzzyNameIndex,
+    bounded_edit_distance,
+    default_max_distance,
+)
+
+
+def _osa_distance(a: str, b: str) -> int:
+    """Unbounded optimal string alignment distance, computed naively"""
+    d = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i in range(len(a) + 1):
+        d[i][0] = i
+    for j in range(len(b) + 1):
+        d[0][j] = j
+    for i, j in itertools.product(range(1, len(a) + 1), range(1, len(b) + 1)):
+        d[i][j] = min(
+            d[i - 1][j] + 1,
+            d[i][j - 1] + 1,
+            d[i - 1][j - 1] + (a[i - 1] != b[j - 1]),
+        )
+        if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+            d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+    return d[len(a)][len(b)]
+
+
+class TestBoundedEditDistance:
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            ("SalesOrderHeaderV2", "SalesOrderHeaderV2", 0),
+            ("SalesOrderHeaderV2", "SalesOrderHeadersV2", 1),
+            ("SalseOrderHeaderV2", "SalesOrderHeaderV2", 1),
+            ("CustGroup", "CustomerGroup", None),
+            ("", "abcd", None),
+        ],
+    )
+    def test_examples(self, a, b, expected):
+        assert bounded_edit_distance(a, b, 3) == expected
+
+    def test_matches_naive_distance(self):
+        rnd = random.Random(0)
+        for _ in range(2000):
+            a = "".join(rnd.choice("abc") for _ in range(rnd.randint(0, 8)))
+            b = "".join(rnd.choice("abc") for _ in range(rnd.randint(0, 8)))
+            distance = _osa_distance(a, b)
+            for max_distance in range(4):
+                expected = distance if distance <= max_distance else None
+                assert bounded_edit_distance(a, b, max_distance) == expected
+
+
+class TestFuzzyNameIndex:
+    @pytest.fixture
+    def index(self):
+        index = FuzzyNameIndex()
+        for name in [
+            "SalesOrderHeaderV2",
+            "SalesOrderHeadersV2",
+            "SalesOrderLine",
+            "PurchaseOrderHeaderV2",
+            "CustomersV3",
+            "VendorsV2",
+        ]:
+            index.add(name, name)
+        index.add("SalesOrderHeadersV2", "SalesOrderHeaderV2")
+        return index
+
+    def test_ranked_by_distance(self, index):
+        assert index.search("salesorderheaderv3") == [
+            (1, "SalesOrderHeaderV2"),
+            (2, "SalesOrderHeadersV2"),
+        ]
+
+    def test_value_returned_once_for_closest_name(self, index):
+        # SalesOrderHeaderV2 is also stored under SalesOrderHeadersV2
+        matches = index.search("SalesOrderHeadersV2", limit=10)
+        assert matches == [(0, "SalesOrderHeadersV2"), (0, "SalesOrderHeaderV2")]
+
+    def test_limit_and_filter(self, index):
+        assert index.search("SalesOrderHeaderV2", limit=1) == [
+            (0, "SalesOrderHeaderV2")
+        ]
+        matches = index.search(
+            "SalesOrderHeaderV2",
+            max_distance=3,
+            accept=lambda value: value.startswith("Purch"),
+        )
+        assert matches == []
+        matches = index.search(
+            "PurchOrderHeaderV2",
+            accept=lambda value: value.startswith("Purch"),
+        )
+        assert matches == [(3, "PurchaseOrderHeaderV2")]
+
+    def test_short_names(self, index):
+        assert index.search("VendorV2") == [(1, "VendorsV2")]
+        assert index.search("Xyz") == []
+
+    def test_agrees_with_linear_scan(self):
+        rnd = random.Random(1)
+        words = ["Cust", "Vend", "Sales", "Order", "Line", "Header", "Tax"]
+        names = {
+            "".join(rnd.sample(words, rnd.randint(1, 3))) + f"V{rnd.randint(1, 3)}"
+            for _ in range(300)
+        }
+        index = FuzzyNameIndex()
+        for name in names:
+            index.add(name, name)
+
+        for query in ["SalesOrderV2", "CustVendV1", "TaxLineHeaderV3", "OrdreV1"]:
+            max_distance = default_max_distance(query)
+            expected = sorted(
+                (distance, abs(len(name) - len(query)), name.lower(), name)
+                for name in names
+                for distance in [_osa_distance(query.lower(), name.lower())]
+                if distance <= max_distance
+            )[:5]
+            assert index.search(query, limit=5) == [
+                (distance, name) for distance, _, _, name in expected
+            ]
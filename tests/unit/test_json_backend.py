@@ -0,0 +1,167 @@
+"""Unit tests for JSON backend selection and response compression."""
+
+import gzip
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiohttp import web
+
+from d365fo_client import json_backend
+from d365fo_client.crud import CrudOperations
+from d365fo_client.json_backend import (
+    available_json_backends,
+    get_json_backend,
+    iter_json_array,
+    json_loads,
+    set_json_backend,
+)
+from d365fo_client.models import FOClientConfig
+from d365fo_client.session import SessionManager
+
+
+@pytest.fixture
+def restore_backend():
+    original = get_json_backend()
+    yield
+    set_json_backend(original)
+
+
+class TestJsonBackend:
+    def test_stdlib_is_always_available(self):
+        assert "json" in available_json_backends()
+        assert get_json_backend() in available_json_backends()
+
+    @pytest.mark.parametrize("backend", available_json_backends())
+    def test_backends_decode_str_and_bytes(self, backend, restore_backend):
+        set_json_backend(backend)
+        document = '{"value": [{"Name": "Contoso", "Amount": 1.5}]}'
+
+        assert json_loads(document) == json.loads(document)
+        assert json_loads(document.encode()) == json.loads(document)
+
+    @pytest.mark.parametrize("backend", available_json_backends())
+    def test_invalid_json_raises_value_error(self, backend, restore_backend):
+        set_json_backend(backend)
+        with pytest.raises(ValueError):
+            json_loads("{not json")
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            set_json_backend("simplejson5")
+
+    def test_missing_backend_keeps_current(self, restore_backend, monkeypatch):
+        current = get_json_backend()
+
+        def missing(name):
+            raise ImportError(name)
+
+        monkeypatch.setattr(json_backend, "_load_decoder", missing)
+        with pytest.raises(ImportError):
+            set_json_backend("orjson")
+        assert get_json_backend() == current
+
+
+async def _chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+class TestIterJsonArray:
+    DOCUMENT = {
+        "@odata.context": "https://test.dynamics.com/Metadata/$metadata#PublicEntities",
+        "value": [
+            {
+                "Name": 'Kund\u00e9 "A" {x}',
+                "Count": 12345,
+                "Tags": [1.5, None, {"a": []}],
+            },
+            {"Name": "B", "Count": -7e3},
+            {"Path": "C:\\", "Quote": '\\"]'},
+            42,
+        ],
+        "@odata.nextLink": "https://test.dynamics.com/next",
+    }
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("chunk_size", [1, 3, 16, 1 << 20])
+    async def test_yields_items_across_chunk_boundaries(self, chunk_size):
+        data = json.dumps(self.DOCUMENT, ensure_ascii=False).encode("utf-8")
+        items = [item async for item in iter_json_array(_chunks(data, chunk_size))]
+        assert items == self.DOCUMENT["value"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("document", [b"{}", b'{"value": []}', b'{"other": [1]}'])
+    async def test_empty_or_missing_array(self, document):
+        assert [item async for item in iter_json_array(_chunks(document, 2))] == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", available_json_backends())
+    async def test_items_are_decoded_by_selected_backend(
+        self, backend, restore_backend, monkeypatch
+    ):
+        set_json_backend(backend)
+        decoded = []
+        loads = json_backend._backend["loads"]
+
+        def tracking_loads(data):
+            decoded.append(data)
+            return loads(data)
+
+        monkeypatch.setitem(json_backend._backend, "loads", tracking_loads)
+        data = json.dumps(self.DOCUMENT).encode("utf-8")
+        items = [item async for item in iter_json_array(_chunks(data, 5))]
+
+        assert items == self.DOCUMENT["value"]
+        assert json.dumps(self.DOCUMENT["value"][0]) in decoded
+
+    @pytest.mark.asyncio
+    async def test_truncated_stream_raises(self):
+        with pytest.raises(ValueError):
+            async for _ in iter_json_array(_chunks(b'{"value": [{"a": 1}, {"b"', 4)):
+                pass
+
+
+class TestCompression:
+    @pytest.mark.asyncio
+    async def test_gzip_response_is_negotiated_and_decoded(self, restore_backend):
+        set_json_backend("json")
+        seen = {}
+
+        async def handler(request):
+            seen["accept_encoding"] = request.headers.get("Accept-Encoding")
+            body = gzip.compress(json.dumps({"value": [{"id": 1}]}).encode())
+            return web.Response(
+                body=body,
+                content_type="application/json",
+                headers={"Content-Encoding": "gzip"},
+            )
+
+        app = web.Application()
+        app.router.add_get("/data/CustomersV3", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        base_url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+        mock_auth = MagicMock()
+        mock_auth.get_token = AsyncMock(return_value="tok")
+        sm = SessionManager(FOClientConfig(base_url=base_url), mock_auth)
+        try:
+            result = await CrudOperations(sm, base_url).get_entities("CustomersV3")
+        finally:
+            await sm.close()
+            await runner.cleanup()
+
+        assert result == {"value": [{"id": 1}]}
+        assert "gzip" in seen["accept_encoding"]
+
+    def test_compression_can_be_disabled(self):
+        sm = SessionManager(
+            FOClientConfig(
+                base_url="https://test.dynamics.com", enable_compression=False
+            ),
+            MagicMock(),
+        )
+        assert sm._default_headers()["Accept-Encoding"] == "identity"
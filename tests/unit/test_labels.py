@@ -0,0 +1,95 @@
+"""Unit tests for label operations."""
+
+import asyncio
+import re
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from d365fo_client.labels import LabelOperations
+from d365fo_client.models import FOClientConfig
+from d365fo_client.session import SessionManager
+
+BASE_URL = "https://test.dynamics.com"
+METADATA_URL = f"{BASE_URL}/Metadata"
+
+
+def _make_session_manager() -> SessionManager:
+    mock_auth = MagicMock()
+    mock_auth.get_token = AsyncMock(return_value="tok")
+    return SessionManager(FOClientConfig(base_url=BASE_URL), mock_auth)
+
+
+class _LabelServer:
+    """Mock session serving Labels(Id=...) lookups, tracking requests in flight"""
+
+    def __init__(self, missing=()):
+        self.missing = set(missing)
+        self.requested = []
+        self.in_flight = 0
+        self.peak = 0
+
+    def get(self, url, headers=None):
+        label_id = re.search(r"Labels\(Id='([^']+)'", url).group(1)
+        self.requested.append(label_id)
+        server = self
+
+        class Response:
+            status = 404 if label_id in server.missing else 200
+
+            async def __aenter__(self):
+                server.in_flight += 1
+                server.peak = max(server.peak, server.in_flight)
+                await asyncio.sleep(0.001)
+                return self
+
+            async def __aexit__(self, *exc):
+                server.in_flight -= 1
+                return False
+
+            async def json(self, loads=None):
+                return {"Value": f"Text of {label_id}"}
+
+        return Response()
+
+
+class TestGetLabelsBatch:
+    @pytest.mark.asyncio
+    async def test_misses_are_fetched_concurrently(self):
+        server = _LabelServer(missing={"@SYS5"})
+        sm = _make_session_manager()
+        label_ids = [f"@SYS{i}" for i in range(40)]
+
+        with patch.object(sm, "get_session", AsyncMock(return_value=server)):
+            label_ops = LabelOperations(sm, METADATA_URL, max_concurrency=4)
+            labels = await label_ops.get_labels_batch(label_ids + ["@SYS1"], "en-US")
+
+        assert len(labels) == 39
+        assert labels["@SYS0"] == "Text of @SYS0"
+        assert "@SYS5" not in labels
+        assert sorted(server.requested) == sorted(label_ids)
+        assert server.peak == 4
+
+    @pytest.mark.asyncio
+    async def test_cache_is_consulted_once_per_batch(self):
+        server = _LabelServer()
+        sm = _make_session_manager()
+        cache = MagicMock()
+        cache.get_labels_batch = AsyncMock(return_value={"@SYS1": "Cached"})
+        cache.set_labels_batch = AsyncMock()
+
+        with patch.object(sm, "get_session", AsyncMock(return_value=server)):
+            label_ops = LabelOperations(sm, METADATA_URL, cache)
+            labels = await label_ops.get_labels_batch(["@SYS1", "@SYS2"], "en-US")
+
+        assert labels == {"@SYS1": "Cached", "@SYS2": "Text of @SYS2"}
+        cache.get_labels_batch.assert_awaited_once_with(["@SYS1", "@SYS2"], "en-US")
+        assert server.requested == ["@SYS2"]
+        (stored,), _ = cache.set_labels_batch.call_args
+        assert [(label.id, label.value) for label in stored] == [
+            ("@SYS2", "Text of @SYS2")
+        ]
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            LabelOperations(_make_session_manager(), METADATA_URL, max_concurrency=0)
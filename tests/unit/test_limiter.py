@@ -0,0 +1,169 @@
+"""Unit tests for the adaptive concurrency limiter."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from yarl import URL
+
+from d365fo_client.limiter import AdaptiveConcurrencyLimiter
+from d365fo_client.models import FOClientConfig
+from d365fo_client.session import SessionManager
+
+
+async def _hold(
+    limiter: AdaptiveConcurrencyLimiter,
+    status: int,
+    latency_ms: float,
+    endpoint: str = "GET /data/Customers",
+):
+    async with limiter.acquire():
+        limiter.record(status, latency_ms, endpoint)
+
+
+class TestAdaptiveConcurrencyLimiter:
+    @pytest.mark.asyncio
+    async def test_grows_while_limit_is_used(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4)
+
+        for _ in range(20):
+            await _hold(limiter, 200, 100.0)
+
+        assert limiter.limit > 2
+        assert limiter.limit <= 4
+
+    @pytest.mark.asyncio
+    async def test_idle_client_does_not_grow(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+
+        for _ in range(20):
+            await _hold(limiter, 200, 100.0)
+
+        assert limiter.limit == 8
+
+    @pytest.mark.asyncio
+    async def test_throttle_halves_limit_once_per_cooldown(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16, cooldown_seconds=60)
+
+        await _hold(limiter, 429, 10.0)
+        await _hold(limiter, 429, 10.0)
+
+        assert limiter.limit == 8
+        assert limiter.get_stats()["throttled"] == 2
+
+    @pytest.mark.asyncio
+    async def test_latency_inflation_backs_off(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=10, latency_backoff=0.5, cooldown_seconds=0, smoothing=1.0
+        )
+
+        await _hold(limiter, 200, 100.0)
+        await _hold(limiter, 200, 500.0)
+
+        assert limiter.limit == 5
+        assert limiter.get_stats()["latency_backoffs"] == 1
+
+    @pytest.mark.asyncio
+    async def test_mixed_endpoints_do_not_collapse_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=8, max_limit=16, cooldown_seconds=0
+        )
+
+        async def workload(endpoint: str, latency_ms: float):
+            for _ in range(50):
+                await _hold(limiter, 200, latency_ms, endpoint)
+
+        # Cheap metadata lookups interleaved with slow queries and $batch calls,
+        # eight requests in flight
+        await asyncio.gather(
+            *(
+                workload(endpoint, latency_ms)
+                for endpoint, latency_ms in [
+                    ("GET /Metadata/Labels", 20.0),
+                    ("GET /data/SalesOrderLines", 400.0),
+                    ("POST /data/$batch", 900.0),
+                    ("GET /Metadata/Labels", 25.0),
+                ]
+                * 2
+            )
+        )
+
+        assert limiter.limit >= 8
+        assert limiter.get_stats()["latency_backoffs"] == 0
+        assert set(limiter.get_stats()["endpoints"]) == {
+            "GET /Metadata/Labels",
+            "GET /data/SalesOrderLines",
+            "POST /data/$batch",
+        }
+
+    @pytest.mark.asyncio
+    async def test_never_drops_below_min_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=2, min_limit=1, cooldown_seconds=0
+        )
+
+        for _ in range(5):
+            await _hold(limiter, 429, 10.0)
+
+        assert limiter.limit == 1
+
+    @pytest.mark.asyncio
+    async def test_bounds_requests_in_flight(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3)
+        peak = 0
+
+        async def request():
+            nonlocal peak
+            async with limiter.acquire():
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.005)
+
+        await asyncio.gather(*(request() for _ in range(12)))
+
+        assert peak == 3
+        assert limiter.in_flight == 0
+
+    def test_rejects_inconsistent_bounds(self):
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=5)
+
+
+class TestSessionManagerLimiter:
+    def _session_manager(self, **kwargs) -> SessionManager:
+        mock_auth = MagicMock()
+        mock_auth.get_token = AsyncMock(return_value="tok")
+        config = FOClientConfig(
+            base_url="https://test.dynamics.com", enable_request_tracing=False, **kwargs
+        )
+        return SessionManager(config, mock_auth)
+
+    @pytest.mark.asyncio
+    async def test_server_timing_feeds_limiter(self):
+        sm = self._session_manager(enable_adaptive_concurrency=True)
+        response = MagicMock()
+        response.status = 200
+        response.headers = {"server-timing": "dur=123.5"}
+        request = MagicMock()
+        request.method = "GET"
+        request.url = URL(
+            "https://test.dynamics.com/data/Customers(dataAreaId='usmf',CustomerAccount='US-001')"
+        )
+
+        await sm._retry_middleware(request, AsyncMock(return_value=response))
+
+        stats = sm.get_concurrency_stats()["concurrency"]
+        assert stats["endpoints"]["GET /data/Customers"]["baseline_ms"] == 123.5
+        assert stats["in_flight"] == 0
+
+    def test_disabled_by_default(self):
+        sm = self._session_manager()
+        assert sm.concurrency_limiter is None
+        assert "concurrency" not in sm.get_concurrency_stats()
+
+    def test_config_validation(self):
+        with pytest.raises(ValueError):
+            FOClientConfig(
+                base_url="https://test.dynamics.com",
+                initial_concurrency_limit=10,
+                max_concurrency_limit=5,
+            )
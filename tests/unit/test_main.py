@@ -319,6 +319,10 @@ class TestEnhancedFOClient:
             # Should be False since metadata_cache is None initially
             assert info["advanced_cache_enabled"] is True
 
+            # Closing the client closes its metadata cache connections
+            await client.close()
+            assert not client.metadata_cache._initialized
+
     @pytest.mark.asyncio
     async def test_background_sync_trigger(self):
         """Test background sync triggering logic."""
@@ -0,0 +1,62 @@
+"""Unit tests for the in-process LRU cache."""
+
+import pytest
+
+from d365fo_client.metadata_v2.memory_cache import LRUCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUCache:
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert "b" not in cache
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        cache = LRUCache(max_size=10, ttl_seconds=5, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 4.9
+        assert cache.get("a") == 1
+        clock.now = 5.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_stats_and_invalidation(self):
+        cache = LRUCache(max_size=10)
+        cache.set((1, "Customers"), "c1")
+        cache.set((1, "Vendors"), "v1")
+        cache.set((2, "Customers"), "c2")
+
+        assert cache.get((1, "Customers")) == "c1"
+        assert cache.get((3, "Customers")) is None
+        assert cache.invalidate(lambda key: key[0] == 1) == 2
+        assert len(cache) == 1
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"max_size": 0}, {"max_size": 1, "ttl_seconds": 0}]
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            LRUCache(**kwargs)
@@ -1,5 +1,6 @@
 """Tests for metadata API operations."""
 
+import json
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -241,6 +242,52 @@ class TestPublicEntitiesAPI:
         assert result[0].entity_set_name == "Customers"
 
 
+class TestPublicEntitiesStreaming:
+    """Tests for incremental parsing of the PublicEntities payload"""
+
+    async def test_iter_public_entities_streams_chunks(
+        self, metadata_api_ops, mock_session_manager
+    ):
+        """Entities are yielded from chunked content without response.json()"""
+        _, session = mock_session_manager
+        payload = json.dumps(
+            {
+                "@odata.context": "test",
+                "value": [
+                    {"Name": f"Entity{i}", "EntitySetName": f"Entities{i}"}
+                    for i in range(3)
+                ],
+            }
+        ).encode()
+
+        async def iter_chunked(size):
+            for start in range(0, len(payload), 7):
+                yield payload[start : start + 7]
+
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.content = Mock()
+        mock_response.content.iter_chunked = iter_chunked
+        session.get.return_value = AsyncContextManagerMock(mock_response)
+
+        names = [
+            entity.name
+            async for entity in metadata_api_ops.iter_public_entities_with_details()
+        ]
+
+        assert names == ["Entity0", "Entity1", "Entity2"]
+        mock_response.json.assert_not_called()
+
+        session.get.return_value = AsyncContextManagerMock(mock_response)
+        result = await metadata_api_ops.get_all_public_entities_with_details()
+        assert [entity.entity_set_name for entity in result] == [
+            "Entities0",
+            "Entities1",
+            "Entities2",
+        ]
+
+
 class TestQueryBuilder:
     """Test query parameter building"""
 
@@ -1,18 +1,36 @@
 """Tests for V2 metadata caching system."""
 
 import asyncio
+import sqlite3
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
+import aiosqlite
 import pytest
 
-from d365fo_client.metadata_v2 import MetadataCacheV2, VersionAwareSearchEngine
+from d365fo_client.metadata_v2 import (
+    MetadataCacheV2,
+    SmartSyncManagerV2,
+    VersionAwareSearchEngine,
+)
+from d365fo_client.metadata_v2.cache_v2 import _trigram_match_query
 from d365fo_client.models import (
+    ActionParameterInfo,
+    ActionParameterTypeInfo,
     DataEntityInfo,
+    EnumerationInfo,
+    EnumerationMemberInfo,
+    LabelInfo,
+    ModuleVersionInfo,
     NavigationPropertyInfo,
+    ODataBindingKind,
+    PropertyGroupInfo,
+    PublicEntityActionInfo,
     PublicEntityInfo,
     PublicEntityPropertyInfo,
+    ReferentialConstraintInfo,
+    RelatedFixedConstraintInfo,
     SearchQuery,
 )
 
@@ -31,7 +49,8 @@ async def metadata_cache(temp_cache_dir):
         cache_dir=temp_cache_dir, base_url="https://test.dynamics.com"
     )
     await cache.initialize()
-    return cache
+    yield cache
+    await cache.close()
 
 
 @pytest.mark.asyncio
@@ -179,6 +198,806 @@ async def test_entity_caching(metadata_cache):
         assert property_row[1] == 1  # SQLite stores boolean as 1/0
 
 
+async def _create_global_version(cache) -> int:
+    async with cache.connections.writer() as db:
+        cursor = await db.execute(
+            "INSERT INTO global_versions (version_hash, modules_hash) VALUES (?, ?)",
+            ("bulk_hash", "bulk_modules_hash"),
+        )
+        return cursor.lastrowid
+
+
+def _make_schema(name: str, property_count: int) -> PublicEntityInfo:
+    schema = PublicEntityInfo(name=name, entity_set_name=f"{name}s", label_id="@SYS1")
+    schema.properties = [
+        PublicEntityPropertyInfo(
+            name=f"Field{i}", type_name="Edm.String", data_type="String"
+        )
+        for i in range(property_count)
+    ]
+    schema.navigation_properties = [
+        NavigationPropertyInfo(name="Lines", related_entity=f"{name}Line")
+    ]
+    schema.property_groups = [PropertyGroupInfo(name="Keys", properties=["Field0"])]
+    schema.actions = [
+        PublicEntityActionInfo(
+            name="Post",
+            binding_kind=ODataBindingKind.BOUND_TO_ENTITY_INSTANCE,
+            parameters=[
+                ActionParameterInfo(
+                    name="_date", type=ActionParameterTypeInfo(type_name="Edm.Date")
+                )
+            ],
+        )
+    ]
+    return schema
+
+
+@pytest.mark.asyncio
+async def test_bulk_store_metadata(metadata_cache):
+    """Test storing a version's metadata in one bulk transaction"""
+    global_version_id = await _create_global_version(metadata_cache)
+    assert not await metadata_cache.has_version_metadata(global_version_id)
+
+    counts = await metadata_cache.store_metadata_bulk(
+        global_version_id,
+        data_entities=[
+            DataEntityInfo(
+                name=f"Entity{i}",
+                public_entity_name=f"Entity{i}",
+                public_collection_name=f"Entity{i}s",
+            )
+            for i in range(50)
+        ],
+        public_entities=[_make_schema(f"Entity{i}", 3) for i in range(50)],
+        enumerations=[
+            EnumerationInfo(
+                name="NoYes",
+                members=[
+                    EnumerationMemberInfo(name="No", value=0),
+                    EnumerationMemberInfo(name="Yes", value=1),
+                ],
+            )
+        ],
+        fresh_version=True,
+    )
+
+    assert counts == {"data_entities": 50, "public_entities": 50, "enumerations": 1}
+    assert await metadata_cache.has_version_metadata(global_version_id)
+
+    schema = await metadata_cache.get_public_entity_schema("Entity7", global_version_id)
+    assert [prop.name for prop in schema.properties] == ["Field0", "Field1", "Field2"]
+    assert schema.navigation_properties[0].related_entity == "Entity7Line"
+    assert schema.property_groups[0].properties == ["Field0"]
+    assert schema.actions[0].parameters[0].name == "_date"
+
+    enum_info = await metadata_cache.get_enumeration_info("NoYes", global_version_id)
+    assert [member.name for member in enum_info.members] == ["No", "Yes"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_store_replaces_existing_rows(metadata_cache):
+    """Test that storing again replaces schemas and enumerations instead of duplicating"""
+    global_version_id = await _create_global_version(metadata_cache)
+    enumerations = [
+        EnumerationInfo(name="NoYes", members=[EnumerationMemberInfo("No", 0)])
+    ]
+
+    await metadata_cache.store_public_entity_schemas(
+        global_version_id, [_make_schema("Customer", 5)], fresh_version=True
+    )
+    await metadata_cache.store_enumerations(global_version_id, enumerations)
+
+    await metadata_cache.store_public_entity_schemas(
+        global_version_id, [_make_schema("Customer", 2), _make_schema("Vendor", 1)]
+    )
+    await metadata_cache.store_enumerations(global_version_id, enumerations)
+
+    schema = await metadata_cache.get_public_entity_schema(
+        "Customer", global_version_id
+    )
+    assert len(schema.properties) == 2
+    assert len(schema.actions) == 1
+
+    async with metadata_cache.connections.reader() as db:
+        cursor = await db.execute(
+            "SELECT COUNT(*) FROM public_entities WHERE global_version_id = ?",
+            (global_version_id,),
+        )
+        assert (await cursor.fetchone())[0] == 2
+        cursor = await db.execute(
+            "SELECT COUNT(*) FROM enumeration_members WHERE global_version_id = ?",
+            (global_version_id,),
+        )
+        assert (await cursor.fetchone())[0] == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_fails_when_schema_stream_breaks(metadata_cache):
+    """Test that a schema stream failing mid-way fails the sync instead of completing it"""
+    global_version_id = await _create_global_version(metadata_cache)
+
+    async def broken_stream(resolve_labels=False):
+        yield _make_schema("Entity0", 1)
+        raise ConnectionError("connection reset")
+
+    metadata_api = MagicMock()
+    metadata_api.search_data_entities = AsyncMock(
+        return_value=[
+            DataEntityInfo(
+                name="Entity0",
+                public_entity_name="Entity0",
+                public_collection_name="Entity0s",
+            )
+        ]
+    )
+    metadata_api.iter_public_entities_with_details = broken_stream
+
+    result = await SmartSyncManagerV2(metadata_cache, metadata_api).sync_metadata(
+        global_version_id
+    )
+
+    assert not result.success
+    assert "connection reset" in result.errors[0]
+    assert not await metadata_cache._has_complete_metadata(global_version_id)
+
+
+@pytest.mark.asyncio
+async def test_schema_memory_cache(metadata_cache):
+    """Test hydrated schemas are cached per version and invalidated on sync"""
+    global_version_id = await _create_global_version(metadata_cache)
+    await metadata_cache.store_public_entity_schemas(
+        global_version_id, [_make_schema("Customer", 3)], fresh_version=True
+    )
+
+    first = await metadata_cache.get_public_entity_schema("Customer", global_version_id)
+    second = await metadata_cache.get_public_entity_schema(
+        "Customer", global_version_id
+    )
+
+    assert second is first  # Shared, not copied per hit
+    assert len(second.properties) == 3
+    stats = metadata_cache.get_schema_cache_statistics()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+
+    await metadata_cache.mark_sync_completed(global_version_id)
+    assert metadata_cache.get_schema_cache_statistics()["size"] == 0
+
+    # Storing a schema drops its stale copy
+    await metadata_cache.get_public_entity_schema("Customer", global_version_id)
+    await metadata_cache.store_public_entity_schema(
+        global_version_id, _make_schema("Customer", 1)
+    )
+    schema = await metadata_cache.get_public_entity_schema(
+        "Customer", global_version_id
+    )
+    assert len(schema.properties) == 1
+
+
+@pytest.mark.asyncio
+async def test_schema_load_racing_a_write_is_not_cached(metadata_cache):
+    """Test a schema read before a write commits isn't cached after it"""
+    global_version_id = await _create_global_version(metadata_cache)
+    await metadata_cache.store_public_entity_schemas(
+        global_version_id, [_make_schema("Customer", 3)], fresh_version=True
+    )
+
+    load = metadata_cache._load_public_entity_schema
+
+    async def load_then_write(entity_name, version_id):
+        schema = await load(entity_name, version_id)
+        await metadata_cache.store_public_entity_schema(
+            version_id, _make_schema("Customer", 1)
+        )
+        return schema
+
+    metadata_cache._load_public_entity_schema = load_then_write
+    stale = await metadata_cache.get_public_entity_schema("Customer", global_version_id)
+    metadata_cache._load_public_entity_schema = load
+
+    assert len(stale.properties) == 3
+    schema = await metadata_cache.get_public_entity_schema(
+        "Customer", global_version_id
+    )
+    assert len(schema.properties) == 1
+
+
+@pytest.mark.asyncio
+async def test_row_ids_are_reserved_under_the_write_lock(metadata_cache):
+    """Test ids are read with the write lock held, so other writers can't reuse them"""
+    db_path = metadata_cache.database.db_path
+    async with metadata_cache.connections.writer() as db:
+        await metadata_cache._next_row_ids(db, ["enumerations"])
+        assert db.in_transaction
+
+        async with aiosqlite.connect(db_path, timeout=0) as other:
+            with pytest.raises(sqlite3.OperationalError, match="locked"):
+                await other.execute("BEGIN IMMEDIATE")
+
+
+@pytest.mark.asyncio
+async def test_schema_blob_matches_normalized_tables(metadata_cache):
+    """Test the stored schema blob hydrates the same schema as the row tables"""
+    global_version_id = await _create_global_version(metadata_cache)
+    schema = _make_schema("Customer", 3)
+    schema.navigation_properties[0].constraints = [
+        RelatedFixedConstraintInfo(related_property="Type", value=1),
+        ReferentialConstraintInfo(property="Field0", referenced_property="Id"),
+    ]
+    await metadata_cache.store_public_entity_schemas(
+        global_version_id, [schema], fresh_version=True
+    )
+
+    from_blob = await metadata_cache.get_public_entity_schema(
+        "Customer", global_version_id
+    )
+
+    async with metadata_cache.connections.writer() as db:
+        cursor = await db.execute(
+            "SELECT COUNT(*) FROM public_entities WHERE schema_blob IS NOT NULL"
+        )
+        assert (await cursor.fetchone())[0] == 1
+        await db.execute("UPDATE public_entities SET schema_blob = NULL")
+    metadata_cache.invalidate_schema_cache()
+    from_tables = await metadata_cache.get_public_entity_schema(
+        "Customer", global_version_id
+    )
+
+    assert from_blob == from_tables
+    assert [p.property_order for p in from_blob.properties] == [1, 2, 3]
+    assert len(from_blob.navigation_properties[0].constraints) == 2
+
+
+@pytest.mark.asyncio
+async def test_label_hits_are_written_behind(metadata_cache):
+    """Test label reads count hits in memory and flush them in one batch"""
+    global_version_id = await _create_global_version(metadata_cache)
+    await metadata_cache.set_labels_batch(
+        [
+            LabelInfo(id="@SYS1", language="en-US", value="Customer"),
+            LabelInfo(id="@SYS2", language="en-US", value="Vendor"),
+        ],
+        global_version_id,
+    )
+    writes_before = metadata_cache.connections.get_stats()["writes"]
+
+    for _ in range(3):
+        assert await metadata_cache.get_label("@SYS1", "en-US", global_version_id)
+    labels = await metadata_cache.get_labels_batch(
+        ["@SYS1", "@SYS2", "@MISSING"], "en-US", global_version_id
+    )
+
+    assert labels == {"@SYS1": "Customer", "@SYS2": "Vendor"}
+    assert metadata_cache.connections.get_stats()["writes"] == writes_before
+
+    assert await metadata_cache.flush_label_hits() == 2
+    async with metadata_cache.connections.reader() as db:
+        cursor = await db.execute(
+            "SELECT label_id, hit_count FROM labels_cache ORDER BY label_id"
+        )
+        assert await cursor.fetchall() == [("@SYS1", 4), ("@SYS2", 1)]
+
+    stats = await metadata_cache.get_label_cache_statistics(global_version_id)
+    assert stats["hit_statistics"]["total_hits"] == 5
+
+
+@pytest.mark.asyncio
+async def test_label_read_does_not_wait_on_writer(metadata_cache):
+    """Test a due label hit flush runs in the background, not in the read"""
+    global_version_id = await _create_global_version(metadata_cache)
+    await metadata_cache.set_label("@SYS1", "Customer", "en-US", global_version_id)
+    metadata_cache.label_hit_flush_threshold = 1
+
+    release = asyncio.Event()
+    held = asyncio.Event()
+
+    async def hold_writer():
+        async with metadata_cache.connections.writer():
+            held.set()
+            await release.wait()
+
+    holder = asyncio.create_task(hold_writer())
+    await held.wait()
+
+    # The flush is due, yet the read completes while the writer is held
+    label = await asyncio.wait_for(
+        metadata_cache.get_label("@SYS1", "en-US", global_version_id), timeout=1
+    )
+    assert label == "Customer"
+
+    release.set()
+    await holder
+    await metadata_cache._label_hit_flush_task
+    async with metadata_cache.connections.reader() as db:
+        cursor = await db.execute("SELECT hit_count FROM labels_cache")
+        assert await cursor.fetchall() == [(1,)]
+
+
+@pytest.mark.asyncio
+async def test_current_version_is_memoized(metadata_cache):
+    """Test the current version id is resolved once per mapping change"""
+    lookups = 0
+    get_version_info = metadata_cache.version_manager.get_environment_version_info
+
+    async def counting_get_version_info(environment_id):
+        nonlocal lookups
+        lookups += 1
+        return await get_version_info(environment_id)
+
+    metadata_cache.version_manager.get_environment_version_info = (
+        counting_get_version_info
+    )
+
+    # A missing mapping is remembered too
+    assert await metadata_cache._get_current_global_version_id() is None
+    assert await metadata_cache._get_current_global_version_id() is None
+    assert lookups == 1
+
+    modules = [
+        ModuleVersionInfo(
+            name="ApplicationSuite",
+            version="10.0.1",
+            module_id="ApplicationSuite",
+            publisher="Microsoft Corporation",
+            display_name="Application Suite",
+        )
+    ]
+    global_version_id, _ = (
+        await metadata_cache.version_manager.register_environment_version(
+            metadata_cache._environment_id, modules
+        )
+    )
+
+    for _ in range(3):
+        assert (
+            await metadata_cache._get_current_global_version_id() == global_version_id
+        )
+    assert lookups == 2
+
+    await metadata_cache.mark_sync_completed(global_version_id)
+    await metadata_cache._get_current_global_version_id()
+    assert lookups == 3
+
+
+@pytest.mark.asyncio
+async def test_labels_can_be_cached_before_any_version(metadata_cache):
+    """Test labels are cached under the placeholder version before the first sync"""
+    await metadata_cache.set_label("@SYS1", "Customer")
+    await metadata_cache.set_labels_batch(
+        [LabelInfo(id="@SYS2", language="en-US", value="Vendor")]
+    )
+
+    assert await metadata_cache.get_label("@SYS1") == "Customer"
+    assert await metadata_cache.get_label("@SYS2") == "Vendor"
+
+
+@pytest.mark.asyncio
+async def test_label_memory_tier(metadata_cache):
+    """Test warm label lookups are served from memory without SQLite reads"""
+    global_version_id = await _create_global_version(metadata_cache)
+    label_ids = [f"@SYS{i}" for i in range(300)]
+    await metadata_cache.set_labels_batch(
+        [
+            LabelInfo(id=label_id, language="en-US", value=label_id)
+            for label_id in label_ids
+        ],
+        global_version_id,
+    )
+    metadata_cache.invalidate_label_cache()
+
+    # Cold: one batched SQLite read fills the memory tier
+    reads_before = metadata_cache.connections.get_stats()["reads"]
+    labels = await metadata_cache.get_labels_batch(
+        label_ids, "en-US", global_version_id
+    )
+    assert len(labels) == 300
+    assert metadata_cache.connections.get_stats()["reads"] == reads_before + 1
+
+    # Warm: no SQLite reads at all
+    labels = await metadata_cache.get_labels_batch(
+        label_ids + ["@MISSING"], "en-US", global_version_id
+    )
+    assert len(labels) == 300
+    assert (
+        await metadata_cache.get_label("@SYS7", "en-US", global_version_id) == "@SYS7"
+    )
+    assert metadata_cache.connections.get_stats()["reads"] == reads_before + 2
+
+    # Other languages are cached separately
+    assert await metadata_cache.get_label("@SYS7", "fr-FR", global_version_id) is None
+
+
+async def _search_index_rows(cache, global_version_id) -> list:
+    async with cache.connections.reader() as db:
+        cursor = await db.execute(
+            """SELECT entity_type, name FROM metadata_search_v2
+               WHERE global_version_id = ? ORDER BY entity_type, name""",
+            (global_version_id,),
+        )
+        return await cursor.fetchall()
+
+
+@pytest.mark.asyncio
+async def test_search_index_follows_stored_metadata(metadata_cache):
+    """Test the FTS index is maintained incrementally as metadata is stored"""
+    global_version_id, _ = (
+        await metadata_cache.version_manager.register_environment_version(
+            metadata_cache._environment_id,
+            [
+                ModuleVersionInfo(
+                    name="ApplicationSuite",
+                    version="10.0.1",
+                    module_id="ApplicationSuite",
+                    publisher="Microsoft Corporation",
+                    display_name="Application Suite",
+                )
+            ],
+        )
+    )
+    await metadata_cache.store_metadata_bulk(
+        global_version_id,
+        data_entities=[
+            DataEntityInfo(
+                name="CustomerEntity",
+                public_entity_name="Customer",
+                public_collection_name="Customers",
+            )
+        ],
+        public_entities=[_make_schema("Customer", 1), _make_schema("Vendor", 1)],
+        enumerations=[EnumerationInfo(name="CustomerType")],
+    )
+
+    assert await _search_index_rows(metadata_cache, global_version_id) == [
+        ("data_entity", "CustomerEntity"),
+        ("enumeration", "CustomerType"),
+        ("public_entity", "Customer"),
+        ("public_entity", "Vendor"),
+    ]
+
+    search_engine = VersionAwareSearchEngine(metadata_cache)
+    results = await search_engine.search(
+        SearchQuery(text="Customer", entity_types=["public_entity"])
+    )
+    assert [result.name for result in results.results] == ["Customer"]
+
+    # Re-storing one schema replaces only its own index row
+    await metadata_cache.store_public_entity_schema(
+        global_version_id, _make_schema("Customer", 2)
+    )
+    assert len(await _search_index_rows(metadata_cache, global_version_id)) == 4
+
+    # An explicit rebuild produces the same index
+    await search_engine.rebuild_search_index(global_version_id)
+    await search_engine.optimize_search_index(merge_pages=16)
+    assert len(await _search_index_rows(metadata_cache, global_version_id)) == 4
+
+
+@pytest.mark.asyncio
+async def test_search_properties(metadata_cache):
+    """Test the property index finds fields across entities"""
+    global_version_id = await _create_global_version(metadata_cache)
+
+    await metadata_cache.store_public_entity_schemas(
+        global_version_id, [_make_schema("Customer", 2), _make_schema("Vendor", 3)]
+    )
+
+    search_engine = VersionAwareSearchEngine(metadata_cache)
+    results = await search_engine.search_properties(
+        "Field1", global_version_id=global_version_id
+    )
+    assert sorted(result.entity_name for result in results) == ["Customer", "Vendor"]
+    assert {result.name for result in results} == {"Field1"}
+    assert results[0].data_type == "String"
+    assert results[0].to_dict()["entity_name"] in ("Customer", "Vendor")
+
+    results = await search_engine.search_properties(
+        "Field", entity_name="Vendor", global_version_id=global_version_id
+    )
+    assert sorted(result.name for result in results) == ["Field0", "Field1", "Field2"]
+
+    assert (
+        await search_engine.search_properties(
+            "Field", data_type="Date", global_version_id=global_version_id
+        )
+        == []
+    )
+
+    # Replacing a schema drops its old properties from the index
+    await metadata_cache.store_public_entity_schema(
+        global_version_id, _make_schema("Vendor", 1)
+    )
+    results = await search_engine.search_properties(
+        "Field2", global_version_id=global_version_id
+    )
+    assert results == []
+
+
+@pytest.mark.asyncio
+async def test_contentless_search_index_is_migrated(temp_cache_dir):
+    """Test databases with the old contentless FTS table get the new index"""
+    async with aiosqlite.connect(temp_cache_dir / "metadata_v2.db") as db:
+        await db.execute("""CREATE VIRTUAL TABLE metadata_search_v2 USING fts5(
+                   name, entity_type, description, properties, labels,
+                   global_version_id UNINDEXED, entity_id UNINDEXED, content=''
+               )""")
+        await db.commit()
+
+    cache = MetadataCacheV2(temp_cache_dir, "https://test.dynamics.com")
+    await cache.initialize()
+    try:
+        global_version_id = await _create_global_version(cache)
+        await cache.store_public_entity_schema(
+            global_version_id, _make_schema("Customer", 1)
+        )
+        assert await _search_index_rows(cache, global_version_id) == [
+            ("public_entity", "Customer")
+        ]
+    finally:
+        await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_fuzzy_search(metadata_cache):
+    """Test misspelled names find near matches through the name index"""
+    global_version_id, _ = (
+        await metadata_cache.version_manager.register_environment_version(
+            metadata_cache._environment_id,
+            [
+                ModuleVersionInfo(
+                    name="ApplicationSuite",
+                    version="10.0.1",
+                    module_id="ApplicationSuite",
+                    publisher="Microsoft Corporation",
+                    display_name="Application Suite",
+                )
+            ],
+        )
+    )
+    await metadata_cache.store_metadata_bulk(
+        global_version_id,
+        data_entities=[
+            DataEntityInfo(
+                name="SalesOrderHeaderV2Entity",
+                public_entity_name="SalesOrderHeaderV2",
+                public_collection_name="SalesOrderHeadersV2",
+            )
+        ],
+        public_entities=[_make_schema("SalesOrderHeaderV2", 1)],
+        enumerations=[EnumerationInfo(name="SalesStatus")],
+    )
+
+    search_engine = VersionAwareSearchEngine(metadata_cache)
+    results = await search_engine.search_fuzzy("SalesOrdreHeaderV2")
+    assert [(r.entity_type, r.name, r.relevance) for r in results.results] == [
+        ("data_entity", "SalesOrderHeaderV2Entity", 0.5),
+        ("public_entity", "SalesOrderHeaderV2", 0.5),
+    ]
+
+    results = await search_engine.search_fuzzy(
+        "SalesStatsu", entity_types=["enumeration"]
+    )
+    assert [r.name for r in results.results] == ["SalesStatus"]
+
+    # Exact search finds nothing, the fuzzy fallback does
+    query = SearchQuery(text="SalesOrderHeaderV3", entity_types=["data_entity"])
+    assert (await search_engine.search(query)).results == []
+    query.fuzzy = True
+    results = await search_engine.search(query)
+    assert [r.entity_set_name for r in results.results] == ["SalesOrderHeadersV2"]
+
+    # Storing metadata drops the version's index
+    await metadata_cache.store_enumerations(
+        global_version_id, [EnumerationInfo(name="SalesStatusV2")]
+    )
+    results = await search_engine.search_fuzzy(
+        "SalesStatusV3", entity_types=["enumeration"]
+    )
+    assert [r.name for r in results.results] == ["SalesStatusV2"]
+
+
+@pytest.mark.asyncio
+async def test_search_results_cache(metadata_cache):
+    """Test search results are cached per version and handed out as copies"""
+    global_version_id, _ = (
+        await metadata_cache.version_manager.register_environment_version(
+            metadata_cache._environment_id,
+            [
+                ModuleVersionInfo(
+                    name="ApplicationSuite",
+                    version="10.0.1",
+                    module_id="ApplicationSuite",
+                    publisher="Microsoft Corporation",
+                    display_name="Application Suite",
+                )
+            ],
+        )
+    )
+    await metadata_cache.store_public_entity_schemas(
+        global_version_id, [_make_schema("Customer", 1)]
+    )
+
+    search_engine = VersionAwareSearchEngine(metadata_cache)
+    query = SearchQuery(text="Customer", entity_types=["public_entity"])
+    first = await search_engine.search(query)
+    assert not first.cache_hit
+    first.results.clear()
+
+    # Another engine shares the cache; mutating returned results is harmless
+    second = await VersionAwareSearchEngine(metadata_cache).search(query)
+    assert second.cache_hit
+    assert [result.name for result in second.results] == ["Customer"]
+    second.results[0].name = "Changed"
+    third = await search_engine.search(query)
+    assert third.cache_hit
+    assert [result.name for result in third.results] == ["Customer"]
+
+    # Completing a sync of the version drops its results
+    await metadata_cache.mark_sync_completed(global_version_id)
+    assert not (await search_engine.search(query)).cache_hit
+
+    stats = await metadata_cache.get_cache_statistics()
+    assert stats["search_cache"]["size"] == 1
+    assert metadata_cache.invalidate_search_results() == 1
+
+    # Results of a search that raced a write are not cached
+    generation = metadata_cache.search_results_generation
+    await metadata_cache.store_public_entity_schema(
+        global_version_id, _make_schema("Customer", 2)
+    )
+    metadata_cache.set_search_results(global_version_id, "stale", first, generation)
+    assert metadata_cache.get_search_results(global_version_id, "stale") is None
+
+
+def test_trigram_match_query():
+    """Test LIKE patterns are turned into trigram substring queries"""
+    assert _trigram_match_query("%Invoice%") == '"Invoice"'
+    assert _trigram_match_query("Cust%Invoice_V3") == '"Cust" AND "Invoice"'
+    assert _trigram_match_query('%a"b"c%') == '"a""b""c"'
+    assert _trigram_match_query("%V3%") is None
+    assert _trigram_match_query("%") is None
+
+
+@pytest.mark.asyncio
+async def test_data_entity_name_pattern_uses_trigram_index(metadata_cache):
+    """Test substring patterns return the same rows as a plain LIKE scan"""
+    global_version_id = await _create_global_version(metadata_cache)
+    await metadata_cache.store_data_entities(
+        global_version_id,
+        [
+            DataEntityInfo(
+                name="CustInvoiceJournalHeaderEntity",
+                public_entity_name="CustomerInvoiceJournalHeader",
+                public_collection_name="CustomerInvoiceJournalHeaders",
+                entity_category="Document",
+            ),
+            DataEntityInfo(
+                name="VendVendorV3Entity",
+                public_entity_name="VendorsV3",
+                public_collection_name="VendorsV3",
+                label_text="Vendor invoice accounts",
+                entity_category="Master",
+            ),
+            DataEntityInfo(
+                name="LedgerJournalEntity",
+                public_entity_name="LedgerJournal",
+                public_collection_name="LedgerJournals",
+                entity_category="Document",
+            ),
+        ],
+    )
+
+    async def names(pattern, **kwargs):
+        entities = await metadata_cache.get_data_entities(
+            global_version_id, name_pattern=pattern, **kwargs
+        )
+        return [entity.name for entity in entities]
+
+    # Case-insensitive substring across names and labels
+    assert await names("%invoice%") == [
+        "CustInvoiceJournalHeaderEntity",
+        "VendVendorV3Entity",
+    ]
+    assert await names("%Journal%", entity_category="Document") == [
+        "CustInvoiceJournalHeaderEntity",
+        "LedgerJournalEntity",
+    ]
+    # Literal runs must match in order within one column
+    assert await names("Cust%Journal%") == ["CustInvoiceJournalHeaderEntity"]
+    assert await names("%Journal%Cust%") == []
+    # Short patterns fall back to the LIKE scan
+    assert await names("%V3%") == ["VendVendorV3Entity"]
+
+    # Re-storing an entity replaces its index row
+    await metadata_cache.store_data_entities(
+        global_version_id,
+        [
+            DataEntityInfo(
+                name="LedgerJournalEntity",
+                public_entity_name="GeneralJournal",
+                public_collection_name="GeneralJournals",
+                label_text="Ledger invoices",
+            )
+        ],
+    )
+    assert await names("%invoice%") == [
+        "CustInvoiceJournalHeaderEntity",
+        "LedgerJournalEntity",
+        "VendVendorV3Entity",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_name_trigram_index_is_backfilled(temp_cache_dir):
+    """Test databases created before the trigram index get it on initialize"""
+    cache = MetadataCacheV2(temp_cache_dir, "https://test.dynamics.com")
+    await cache.initialize()
+    global_version_id = await _create_global_version(cache)
+    await cache.store_data_entities(
+        global_version_id,
+        [
+            DataEntityInfo(
+                name="CustInvoiceEntity",
+                public_entity_name="CustInvoice",
+                public_collection_name="CustInvoices",
+            )
+        ],
+    )
+    async with cache.connections.writer() as db:
+        await db.execute("DELETE FROM data_entity_names_v2")
+    await cache.close()
+
+    cache = MetadataCacheV2(temp_cache_dir, "https://test.dynamics.com")
+    await cache.initialize()
+    try:
+        entities = await cache.get_data_entities(
+            global_version_id, name_pattern="%Invoice%"
+        )
+        assert [entity.name for entity in entities] == ["CustInvoiceEntity"]
+    finally:
+        await cache.close()
+
+
+async def _count_action_queries(cache, global_version_id) -> tuple:
+    statements = []
+    async with cache.connections.reader() as db:
+        await db.set_trace_callback(statements.append)
+    try:
+        actions = await cache.search_actions("%", global_version_id=global_version_id)
+    finally:
+        async with cache.connections.reader() as db:
+            await db.set_trace_callback(None)
+    return len(actions), len(statements)
+
+
+@pytest.mark.asyncio
+async def test_search_actions_query_count_is_constant(temp_cache_dir):
+    """Test search_actions loads parameters without one query per action"""
+    cache = MetadataCacheV2(temp_cache_dir, "https://test.dynamics.com")
+    # A single reader makes every query go through the traced connection
+    cache.connections.max_readers = 1
+    await cache.initialize()
+    global_version_id = await _create_global_version(cache)
+
+    await cache.store_public_entity_schemas(
+        global_version_id, [_make_schema(f"Small{i}", 1) for i in range(2)]
+    )
+    small = await _count_action_queries(cache, global_version_id)
+
+    await cache.store_public_entity_schemas(
+        global_version_id, [_make_schema(f"Large{i}", 1) for i in range(200)]
+    )
+    large = await _count_action_queries(cache, global_version_id)
+
+    assert (small[0], large[0]) == (2, 202)
+    assert small[1] == large[1]
+
+    actions = await cache.search_actions(
+        "Post", entity_name="Large7", global_version_id=global_version_id
+    )
+    assert [param.name for param in actions[0].parameters] == ["_date"]
+    await cache.close()
+
+
 @pytest.mark.asyncio
 async def test_search_engine(metadata_cache):
     """Test search engine functionality"""
@@ -213,6 +1032,7 @@ async def test_cache_key_generation(metadata_cache):
 
     # Should have different environment IDs
     assert metadata_cache._environment_id != cache2._environment_id
+    await cache2.close()
 
 
 @pytest.mark.asyncio
@@ -230,6 +1050,9 @@ async def test_environment_management(temp_cache_dir):
     # But should share the same database file
     assert cache1.database.db_path == cache2.database.db_path
 
+    await cache1.close()
+    await cache2.close()
+
 
 def test_model_serialization():
     """Test model to_dict() methods"""
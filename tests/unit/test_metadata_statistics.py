@@ -31,6 +31,8 @@ class TestMetadataStatistics(unittest.IsolatedAsyncioTestCase):
 
     async def asyncTearDown(self):
         """Clean up test environment"""
+        await self.db.close()
+
         # Add a small delay and retry mechanism for cleanup
         for i in range(3):
             try:
@@ -124,6 +126,8 @@ class TestMetadataStatistics(unittest.IsolatedAsyncioTestCase):
         for field in essential_fields:
             self.assertIn(field, stats)
 
+        await cache.close()
+
     async def test_multiple_environments_statistics(self):
         """Test statistics with multiple environments"""
         # Create additional environments
@@ -0,0 +1,205 @@
+"""Unit tests for partitioned parallel entity reads."""
+
+import asyncio
+from datetime import date, datetime, timezone
+
+import pytest
+
+from d365fo_client.exceptions import EntityError
+from d365fo_client.models import (
+    PublicEntityInfo,
+    PublicEntityPropertyInfo,
+    QueryOptions,
+)
+from d365fo_client.partitions import (
+    PartitionBuilder,
+    PartitionedReader,
+    QueryPartition,
+)
+
+
+class FakeCrudOperations:
+    """Serves pages per partition filter and records concurrency."""
+
+    def __init__(self, pages_by_filter, delay: float = 0.0, fail_on=None):
+        self.pages_by_filter = pages_by_filter
+        self.delay = delay
+        self.fail_on = fail_on
+        self.requested_filters = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def iter_entity_pages(
+        self, entity_name, options, entity_schema, prefetch_pages
+    ):
+        self.requested_filters.append(options.filter)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            for page in self.pages_by_filter.get(options.filter, []):
+                await asyncio.sleep(self.delay)
+                if self.fail_on and self.fail_on in options.filter:
+                    raise EntityError(f"GET {entity_name} failed: 500 - boom")
+                yield page
+        finally:
+            self.in_flight -= 1
+
+
+def _schema() -> PublicEntityInfo:
+    return PublicEntityInfo(
+        name="Customer",
+        entity_set_name="CustomersV3",
+        properties=[
+            PublicEntityPropertyInfo(
+                name="dataAreaId",
+                type_name="Edm.String",
+                data_type="String",
+                is_key=True,
+            ),
+            PublicEntityPropertyInfo(
+                name="CustomerAccount",
+                type_name="Edm.String",
+                data_type="String",
+                is_key=True,
+            ),
+        ],
+    )
+
+
+class TestPartitionBuilder:
+    def test_by_company(self):
+        partitions = PartitionBuilder.by_company(["USMF", "DEMF", "USMF"])
+        assert [p.filter for p in partitions] == [
+            "dataAreaId eq 'USMF'",
+            "dataAreaId eq 'DEMF'",
+        ]
+
+    def test_string_literals_are_escaped(self):
+        partitions = PartitionBuilder.by_values("Name", ["O'Brien"])
+        assert partitions[0].filter == "Name eq 'O''Brien'"
+
+    def test_by_date_range_is_contiguous(self):
+        partitions = PartitionBuilder.by_date_range(
+            "TransDate", date(2024, 1, 1), date(2024, 1, 5), 2
+        )
+        assert [p.filter for p in partitions] == [
+            "TransDate lt 2024-01-03T00:00:00Z",
+            "TransDate ge 2024-01-03T00:00:00Z",
+        ]
+
+    def test_by_date_range_three_way(self):
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 4, tzinfo=timezone.utc)
+        partitions = PartitionBuilder.by_date_range("Posted", start, end, 3)
+        assert partitions[1].filter == (
+            "Posted ge 2024-01-02T00:00:00Z and Posted lt 2024-01-03T00:00:00Z"
+        )
+
+    def test_by_key_prefix_uses_first_non_company_string_key(self):
+        partitions = PartitionBuilder.by_key_prefix(_schema(), 3)
+        assert [p.filter for p in partitions] == [
+            "CustomerAccount lt 'C'",
+            "CustomerAccount ge 'C' and CustomerAccount lt 'O'",
+            "CustomerAccount ge 'O'",
+        ]
+
+    def test_by_key_prefix_single_partition_has_no_filter(self):
+        partitions = PartitionBuilder.by_key_prefix(_schema(), 1)
+        assert [p.filter for p in partitions] == [""]
+
+    def test_by_key_prefix_without_string_key(self):
+        schema = PublicEntityInfo(
+            name="Numbered",
+            entity_set_name="Numbered",
+            properties=[
+                PublicEntityPropertyInfo(
+                    name="RecId", type_name="Edm.Int64", data_type="Int64", is_key=True
+                )
+            ],
+        )
+        with pytest.raises(ValueError):
+            PartitionBuilder.by_key_prefix(schema, 4)
+
+
+class TestPartitionedReader:
+    @pytest.mark.asyncio
+    async def test_ordered_merge_preserves_partition_order(self):
+        partitions = [QueryPartition("a", "K lt 'M'"), QueryPartition("b", "K ge 'M'")]
+        crud = FakeCrudOperations(
+            {
+                "K lt 'M'": [[{"id": 1}, {"id": 2}], [{"id": 3}]],
+                "K ge 'M'": [[{"id": 4}], [{"id": 5}]],
+            },
+            delay=0.001,
+        )
+
+        reader = PartitionedReader(
+            crud, "Entities", partitions, max_workers=2, ordered=True
+        )
+        records = [r async for r in reader]
+
+        assert [r["id"] for r in records] == [1, 2, 3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_unordered_merge_returns_all_records(self):
+        partitions = PartitionBuilder.by_company(["USMF", "DEMF", "GBSI"])
+        crud = FakeCrudOperations(
+            {
+                "dataAreaId eq 'USMF'": [[{"id": 1}], [{"id": 2}]],
+                "dataAreaId eq 'DEMF'": [[{"id": 3}]],
+                "dataAreaId eq 'GBSI'": [[], [{"id": 4}]],
+            }
+        )
+
+        reader = PartitionedReader(crud, "Entities", partitions, max_workers=2)
+        records = [r async for r in reader]
+
+        assert sorted(r["id"] for r in records) == [1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_worker_pool_is_bounded(self):
+        partitions = [QueryPartition(str(i), f"K eq {i}") for i in range(8)]
+        crud = FakeCrudOperations(
+            {f"K eq {i}": [[{"id": i}]] for i in range(8)}, delay=0.005
+        )
+
+        reader = PartitionedReader(crud, "Entities", partitions, max_workers=3)
+        records = [r async for r in reader]
+
+        assert len(records) == 8
+        assert crud.max_in_flight <= 3
+
+    @pytest.mark.asyncio
+    async def test_base_filter_is_combined(self):
+        partitions = [QueryPartition("a", "K lt 'M'")]
+        crud = FakeCrudOperations({})
+
+        reader = PartitionedReader(
+            crud,
+            "Entities",
+            partitions,
+            options=QueryOptions(filter="Blocked eq false"),
+        )
+        assert [r async for r in reader] == []
+        assert crud.requested_filters == ["(Blocked eq false) and (K lt 'M')"]
+
+    @pytest.mark.asyncio
+    async def test_partition_error_is_raised(self):
+        partitions = [QueryPartition("a", "K lt 'M'"), QueryPartition("b", "K ge 'M'")]
+        crud = FakeCrudOperations(
+            {"K lt 'M'": [[{"id": 1}]], "K ge 'M'": [[{"id": 2}]]},
+            fail_on="ge",
+        )
+
+        reader = PartitionedReader(crud, "Entities", partitions, ordered=True)
+        with pytest.raises(EntityError, match="500"):
+            [r async for r in reader]
+
+    def test_top_is_rejected(self):
+        with pytest.raises(ValueError):
+            PartitionedReader(
+                FakeCrudOperations({}),
+                "Entities",
+                [QueryPartition("a", "")],
+                options=QueryOptions(top=10),
+            )
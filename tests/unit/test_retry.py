@@ -0,0 +1,223 @@
+"""Unit tests for the session-level retry policy."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aiohttp import web
+
+from d365fo_client.crud import CrudOperations
+from d365fo_client.exceptions import EntityError
+from d365fo_client.models import FOClientConfig
+from d365fo_client.retry import RetryPolicy, parse_retry_after
+from d365fo_client.session import SessionManager
+
+
+def _make_session_manager(**kwargs) -> SessionManager:
+    mock_auth = MagicMock()
+    mock_auth.get_token = AsyncMock(return_value="tok")
+    config = FOClientConfig(
+        base_url="https://test.dynamics.com", enable_request_tracing=False, **kwargs
+    )
+    return SessionManager(config, mock_auth)
+
+
+def _response(status: int, headers=None):
+    response = MagicMock()
+    response.status = status
+    response.headers = headers or {}
+    return response
+
+
+def _request(method: str = "GET"):
+    request = MagicMock()
+    request.method = method
+    request.url = "https://test.dynamics.com/data/CustomersV3"
+    request.headers = {"x-ms-client-request-id": "req-1"}
+    return request
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("5") == 5.0
+
+    def test_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert 25 <= parse_retry_after(format_datetime(when, usegmt=True)) <= 30
+
+    def test_past_date_is_zero(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_unparseable(self, value):
+        assert parse_retry_after(value) is None
+
+
+class TestRetryPolicy:
+    def test_decorrelated_jitter_bounds(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=10.0)
+        delay = policy.base_delay
+        for _ in range(50):
+            delay = policy.next_delay(delay)
+            assert 1.0 <= delay <= 10.0
+
+    def test_should_retry_respects_limit(self):
+        policy = RetryPolicy(max_retries=2)
+        assert policy.should_retry(429, 0)
+        assert policy.should_retry(503, 1)
+        assert not policy.should_retry(429, 2)
+        assert not policy.should_retry(500, 0)
+
+    def test_operation_classes(self):
+        sm = _make_session_manager()
+        assert 503 in sm.get_retry_policy("GET").retry_statuses
+        assert 503 in sm.get_retry_policy("DELETE").retry_statuses
+        assert sm.get_retry_policy("POST").retry_statuses == frozenset({429})
+        assert sm.get_retry_policy("patch") is sm.retry_policies["non_idempotent"]
+
+    def test_config_validation(self):
+        with pytest.raises(ValueError):
+            FOClientConfig(base_url="https://test.dynamics.com", max_retries=-1)
+
+
+class TestRetryMiddleware:
+    @pytest.mark.asyncio
+    async def test_retries_throttled_get_then_succeeds(self):
+        sm = _make_session_manager(retry_backoff_base=0.01, retry_backoff_max=0.05)
+        responses = [_response(429), _response(503), _response(200)]
+        handler = AsyncMock(side_effect=responses)
+
+        with patch("d365fo_client.session.asyncio.sleep", new=AsyncMock()) as sleep:
+            final = await sm._retry_middleware(_request("GET"), handler)
+
+        assert final is responses[-1]
+        assert handler.await_count == 3
+        assert sleep.await_count == 2
+        assert sm.total_retries == 2
+        assert sm.get_retry_count(final) == 2
+        responses[0].release.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_post_is_not_retried_on_503(self):
+        sm = _make_session_manager()
+        handler = AsyncMock(return_value=_response(503))
+
+        final = await sm._retry_middleware(_request("POST"), handler)
+
+        assert final.status == 503
+        assert handler.await_count == 1
+        assert sm.get_retry_count(final) == 0
+
+    @pytest.mark.asyncio
+    async def test_post_is_retried_on_429(self):
+        sm = _make_session_manager()
+        handler = AsyncMock(side_effect=[_response(429), _response(201)])
+
+        with patch("d365fo_client.session.asyncio.sleep", new=AsyncMock()):
+            final = await sm._retry_middleware(_request("POST"), handler)
+
+        assert final.status == 201
+
+    @pytest.mark.asyncio
+    async def test_honours_retry_after(self):
+        sm = _make_session_manager(retry_backoff_base=0.01, retry_backoff_max=10)
+        handler = AsyncMock(
+            side_effect=[_response(429, {"Retry-After": "3"}), _response(200)]
+        )
+
+        with patch("d365fo_client.session.asyncio.sleep", new=AsyncMock()) as sleep:
+            await sm._retry_middleware(_request("GET"), handler)
+
+        waited = sleep.await_args.args[0]
+        assert 3.0 <= waited <= 3.01
+
+    @pytest.mark.asyncio
+    async def test_long_retry_after_is_not_waited_for(self):
+        sm = _make_session_manager(retry_backoff_max=5)
+        handler = AsyncMock(return_value=_response(429, {"Retry-After": "600"}))
+
+        final = await sm._retry_middleware(_request("GET"), handler)
+
+        assert final.status == 429
+        assert handler.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        sm = _make_session_manager(
+            max_retries=2, retry_backoff_base=0.01, retry_backoff_max=0.05
+        )
+        handler = AsyncMock(return_value=_response(503))
+
+        with patch("d365fo_client.session.asyncio.sleep", new=AsyncMock()):
+            final = await sm._retry_middleware(_request("GET"), handler)
+
+        assert final.status == 503
+        assert handler.await_count == 3
+
+
+async def _serve(handler):
+    """Start a local server answering GET /data/CustomersV3 with ``handler``."""
+    app = web.Application()
+    app.router.add_get("/data/CustomersV3", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+class TestRetryEndToEnd:
+    @pytest.mark.asyncio
+    async def test_crud_get_is_retried_through_session(self):
+        calls = {"count": 0}
+
+        async def handler(request):
+            calls["count"] += 1
+            if calls["count"] < 3:
+                return web.Response(status=429, headers={"Retry-After": "0"})
+            return web.json_response({"value": [{"id": 1}]})
+
+        runner, base_url = await _serve(handler)
+        mock_auth = MagicMock()
+        mock_auth.get_token = AsyncMock(return_value="tok")
+        sm = SessionManager(
+            FOClientConfig(
+                base_url=base_url, retry_backoff_base=0.01, retry_backoff_max=1
+            ),
+            mock_auth,
+        )
+        try:
+            crud = CrudOperations(sm, base_url)
+            result = await crud.get_entities("CustomersV3")
+        finally:
+            await sm.close()
+            await runner.cleanup()
+
+        assert result == {"value": [{"id": 1}]}
+        assert calls["count"] == 3
+        assert sm.total_retries == 2
+
+    @pytest.mark.asyncio
+    async def test_server_errors_are_not_retried(self):
+        calls = {"count": 0}
+
+        async def handler(request):
+            calls["count"] += 1
+            return web.Response(status=500, text="boom")
+
+        runner, base_url = await _serve(handler)
+        mock_auth = MagicMock()
+        mock_auth.get_token = AsyncMock(return_value="tok")
+        sm = SessionManager(FOClientConfig(base_url=base_url), mock_auth)
+        try:
+            crud = CrudOperations(sm, base_url)
+            with pytest.raises(EntityError) as exc_info:
+                await crud.get_entities("CustomersV3")
+        finally:
+            await sm.close()
+            await runner.cleanup()
+
+        assert exc_info.value.status_code == 500
+        assert calls["count"] == 1
@@ -0,0 +1,150 @@
+"""Unit tests for SessionManager connection pooling and per-request auth."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiohttp import web
+
+from d365fo_client.models import FOClientConfig
+from d365fo_client.session import SessionManager, _pool_occupancy
+
+
+async def _serve(handler):
+    app = web.Application()
+    app.router.add_get("/data/CustomersV3", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def _session_manager(base_url: str, tokens, **kwargs) -> SessionManager:
+    mock_auth = MagicMock()
+    mock_auth.get_token = AsyncMock(side_effect=tokens)
+    return SessionManager(FOClientConfig(base_url=base_url, **kwargs), mock_auth)
+
+
+class TestConnectionPool:
+    @pytest.mark.asyncio
+    async def test_connector_uses_pool_settings(self):
+        sm = _session_manager(
+            "https://test.dynamics.com",
+            ["tok"],
+            connection_pool_size=20,
+            connection_pool_size_per_host=10,
+            keepalive_timeout=45,
+            happy_eyeballs_delay=None,
+        )
+
+        connector = sm._create_connector()
+        try:
+            assert connector.limit == 20
+            assert connector.limit_per_host == 10
+            assert connector._keepalive_timeout == 45
+        finally:
+            await connector.close()
+
+    def test_rejects_negative_pool_size(self):
+        with pytest.raises(ValueError):
+            FOClientConfig(
+                base_url="https://test.dynamics.com", connection_pool_size=-1
+            )
+
+    @pytest.mark.asyncio
+    async def test_token_is_sent_per_request(self):
+        seen = []
+
+        async def handler(request):
+            seen.append(request.headers.get("Authorization"))
+            return web.json_response({"value": []})
+
+        runner, base_url = await _serve(handler)
+        sm = _session_manager(
+            base_url, ["tok-1", "tok-2"], enable_request_tracing=False
+        )
+        try:
+            session = await sm.get_session()
+            for _ in range(2):
+                async with session.get(f"{base_url}/data/CustomersV3") as response:
+                    await response.read()
+        finally:
+            await sm.close()
+            await runner.cleanup()
+
+        assert seen == ["Bearer tok-1", "Bearer tok-2"]
+        assert "Authorization" not in session.headers
+
+    @pytest.mark.asyncio
+    async def test_retry_attempt_gets_fresh_token(self):
+        seen = []
+
+        async def handler(request):
+            seen.append(request.headers.get("Authorization"))
+            if len(seen) == 1:
+                return web.Response(status=429, headers={"Retry-After": "0"})
+            return web.json_response({"value": []})
+
+        runner, base_url = await _serve(handler)
+        sm = _session_manager(
+            base_url,
+            ["tok-1", "tok-2"],
+            enable_request_tracing=False,
+            retry_backoff_base=0.01,
+        )
+        try:
+            session = await sm.get_session()
+            async with session.get(f"{base_url}/data/CustomersV3") as response:
+                await response.read()
+        finally:
+            await sm.close()
+            await runner.cleanup()
+
+        assert response.status == 200
+        assert seen == ["Bearer tok-1", "Bearer tok-2"]
+
+    @pytest.mark.asyncio
+    async def test_pool_stats_track_reuse_and_waits(self):
+        async def handler(request):
+            await asyncio.sleep(0.01)
+            return web.json_response({"value": []})
+
+        runner, base_url = await _serve(handler)
+        sm = _session_manager(
+            base_url,
+            lambda: "tok",
+            connection_pool_size=1,
+            enable_request_tracing=False,
+        )
+
+        async def fetch(session):
+            async with session.get(f"{base_url}/data/CustomersV3") as response:
+                await response.read()
+
+        try:
+            session = await sm.get_session()
+            await asyncio.gather(*(fetch(session) for _ in range(3)))
+            stats = sm.get_pool_stats()
+        finally:
+            await sm.close()
+            await runner.cleanup()
+
+        assert stats["limit"] == 1
+        assert stats["connections_created"] == 1
+        assert stats["connections_reused"] == 2
+        assert stats["queued"] == 2
+        assert stats["max_wait_ms"] > 0
+        assert stats["acquired"] == 0
+        assert stats["open"] == stats["idle"] == 1
+
+    def test_pool_occupancy_tolerates_changed_connector_internals(self):
+        class Connector:
+            _acquired = None
+
+        assert _pool_occupancy(Connector()) == {
+            "acquired": None,
+            "idle": None,
+            "open": None,
+        }